@@ -0,0 +1,114 @@
+"""Local stand-in for the SubModel API used by the benchmarks
+
+Serves the ``{"code": 20000, "data": ...}`` envelope over HTTP/1.1 with
+keep-alive so client-side costs can be measured without the real API.
+Request bodies may be chunked and gzip or zstd encoded; the handler decodes
+them like the API would.
+"""
+
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+Route = Callable[[BaseHTTPRequestHandler], Any]
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Request handler answering every path with a JSON envelope"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def _read_body(self) -> bytes:
+        if self.headers.get("Transfer-Encoding", "").lower() != "chunked":
+            length = int(self.headers.get("Content-Length") or 0)
+            return self.rfile.read(length) if length else b""
+        chunks = []
+        while True:
+            size = int(self.rfile.readline().split(b";")[0], 16)
+            if not size:
+                self.rfile.readline()
+                return b"".join(chunks)
+            chunks.append(self.rfile.read(size))
+            self.rfile.readline()
+
+    def _respond(self) -> None:
+        self.raw_body = self._read_body()
+        if self.server.upload_rate:
+            time.sleep(len(self.raw_body) / self.server.upload_rate)
+        encoding = self.headers.get("Content-Encoding")
+        if encoding == "gzip":
+            self.body = gzip.decompress(self.raw_body)
+        elif encoding == "zstd":
+            self.body = zstandard.ZstdDecompressor().decompressobj().decompress(self.raw_body)
+        else:
+            self.body = self.raw_body
+        route = self.server.route
+        data = route(self) if route else {"path": self.path}
+        if isinstance(data, tuple):
+            status, headers, payload = data
+        else:
+            status, headers, payload = 200, {}, json.dumps({"code": 20000, "data": data}).encode()
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        if "Content-Type" not in headers:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = _respond
+    do_POST = _respond
+
+    def log_message(self, format, *args):
+        """Silence per-request logging"""
+        pass
+
+class _Server(ThreadingHTTPServer):
+    request_queue_size = 128  # Bursts of new connections must not overflow the accept backlog
+
+class StandInServer:
+    """Threaded local server that can be used as a context manager
+
+    Args:
+        route: Optional callable receiving the handler and returning either
+            the ``data`` payload or a ``(status, headers, body_bytes)`` tuple
+        upload_rate: Bytes per second request bodies are received at, to
+            emulate a real uplink instead of loopback; None for no limit
+    """
+
+    def __init__(self, route: Optional[Route] = None, upload_rate: Optional[float] = None):
+        self._server = _Server(("127.0.0.1", 0), StandInHandler)
+        self._server.daemon_threads = True
+        self._server.route = route
+        self._server.upload_rate = upload_rate
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        """Base URL to use as the client ``base_url``"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api/v1"
+
+    def __enter__(self) -> "StandInServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+def report(title: str, results: Dict[str, float], unit: str = "ms/req") -> None:
+    """Print benchmark results as an aligned table"""
+    print(title)
+    width = max(len(name) for name in results)
+    for name, value in results.items():
+        print(f"  {name:<{width}}  {value:10.3f} {unit}")
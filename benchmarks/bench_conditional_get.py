@@ -0,0 +1,61 @@
+"""Benchmark polling a large list with and without conditional GETs
+
+The local stand-in serves an ``inst/list`` page with an ``ETag`` and
+answers ``304 Not Modified`` when the client presents it, like a
+dashboard polling an unchanged fleet.
+
+Usage:
+    python benchmarks/bench_conditional_get.py [polls] [items]
+"""
+
+import json
+import sys
+import time
+from _server import StandInServer, report
+from submodel.sdk.client import create_client
+
+def make_route(items: int):
+    body = json.dumps({"code": 20000, "data": {
+        "page": 1, "limit": items, "total": items,
+        "items": [{"inst_id": f"inst-{i}", "status": "running", "plan": "gpu-rtx4090-24g-1",
+                   "area": ["us-east"], "conf": {"inst_label": f"worker-{i}"}} for i in range(items)],
+    }}).encode()
+    etag = '"fleet-v1"'
+    sent = {"bytes": 0}
+
+    def route(handler):
+        if handler.headers.get("If-None-Match") == etag:
+            return 304, {"ETag": etag}, b""
+        sent["bytes"] += len(body)
+        return 200, {"ETag": etag}, body
+
+    return route, sent
+
+def poll(server_url: str, polls: int, conditional: bool) -> float:
+    with create_client(token="bench", conditional_get=conditional) as client:
+        client.base_url = server_url
+        start = time.perf_counter()
+        for _ in range(polls):
+            client.instance.list_instances(limit=1000)
+        return (time.perf_counter() - start) * 1000 / polls
+
+def main(polls: int = 200, items: int = 5000) -> None:
+    route, sent = make_route(items)
+    with StandInServer(route) as server:
+        plain = poll(server.url, polls, conditional=False)
+        plain_bytes, sent["bytes"] = sent["bytes"], 0
+        conditional = poll(server.url, polls, conditional=True)
+        conditional_bytes = sent["bytes"]
+
+    report(f"Polling inst/list ({items} items) x {polls}", {
+        "full GET": plain,
+        "conditional GET": conditional,
+    })
+    report("Response bytes downloaded", {
+        "full GET": plain_bytes / 1024,
+        "conditional GET": conditional_bytes / 1024,
+    }, unit="KiB")
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
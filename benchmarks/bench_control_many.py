@@ -0,0 +1,61 @@
+"""Benchmark stopping many instances at once
+
+The local stand-in API answers each ``inst/action/stop/{inst_id}`` POST
+after a simulated delay. Compares a serial ``control_instance`` loop with
+``Instance.control_many`` on both clients at several concurrency limits.
+
+Usage:
+    python benchmarks/bench_control_many.py [instances]
+"""
+
+import asyncio
+import sys
+import time
+from _server import StandInServer, report
+from submodel.sdk.async_client import AsyncSubModelClient
+from submodel.sdk.client import SubModelClient
+
+LATENCY = 0.02  # Seconds the stand-in takes per action
+
+def route(handler):
+    time.sleep(LATENCY)
+    return {"inst_id": handler.path.rsplit("/", 1)[-1]}
+
+def serial_loop(client: SubModelClient, ids) -> int:
+    for inst_id in ids:
+        client.instance.control_instance("stop", inst_id)
+    return len(ids)
+
+def bulk(client: SubModelClient, ids, concurrency: int) -> int:
+    result = client.instance.control_many("stop", ids, concurrency=concurrency)
+    assert result.ok, result.errors
+    return len(result.results)
+
+async def async_bulk(url: str, ids, concurrency: int) -> int:
+    async with AsyncSubModelClient(token="bench") as client:
+        client.base_url = url
+        result = await client.instance.control_many("stop", ids, concurrency=concurrency)
+        assert result.ok, result.errors
+        return len(result.results)
+
+def timed(run) -> float:
+    start = time.perf_counter()
+    run()
+    return (time.perf_counter() - start) * 1e3
+
+def main(count: int = 200) -> None:
+    ids = [f"inst-{i}" for i in range(count)]
+    with StandInServer(route=route) as server:
+        client = SubModelClient(token="bench")
+        client.base_url = server.url
+        results = {"serial control_instance": timed(lambda: serial_loop(client, ids))}
+        for concurrency in (8, 32):
+            results[f"control_many concurrency={concurrency}"] = timed(lambda: bulk(client, ids, concurrency))
+        for concurrency in (8, 32):
+            results[f"async control_many concurrency={concurrency}"] = timed(
+                lambda: asyncio.run(async_bulk(server.url, ids, concurrency)))
+        client.close()
+    report(f"stop {count} instances, {LATENCY * 1e3:.0f} ms per action", results, unit="ms")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
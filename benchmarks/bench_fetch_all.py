@@ -0,0 +1,61 @@
+"""Benchmark fetching every item of device/list with parallel page fetches
+
+The local stand-in API answers each page after a fixed round-trip delay plus
+a per-item serialization cost, so bigger pages take longer. Compares a
+sequential walk of ``iter_devices`` with ``fetch_all`` on both clients, at a
+fixed page size and at the page size ``fetch_all`` picks from the total.
+
+Usage:
+    python benchmarks/bench_fetch_all.py [items]
+"""
+
+import asyncio
+import sys
+import time
+from urllib.parse import parse_qs, urlsplit
+from _server import StandInServer, report
+from submodel.sdk.async_client import AsyncSubModelClient
+from submodel.sdk.client import SubModelClient
+
+LIMIT = 100
+LATENCY = 0.03       # Seconds the stand-in takes per page
+PER_ITEM = 0.00002   # Extra seconds the stand-in takes per item on a page
+
+def route_for(total: int):
+    def route(handler):
+        query = parse_qs(urlsplit(handler.path).query)
+        page, limit = int(query["page"][0]), int(query["limit"][0])
+        start = (page - 1) * limit
+        items = [{"device_id": f"dev-{i}"} for i in range(start, min(start + limit, total))]
+        time.sleep(LATENCY + PER_ITEM * len(items))
+        return {"page": page, "limit": limit, "total": total, "items": items}
+    return route
+
+async def async_fetch_all(url: str, limit) -> int:
+    async with AsyncSubModelClient(token="bench") as client:
+        client.base_url = url
+        return len(await client.fetch_all("device/list", limit=limit))
+
+def timed(run, total: int) -> float:
+    start = time.perf_counter()
+    count = run()
+    elapsed = (time.perf_counter() - start) * 1e3
+    assert count == total, count
+    return elapsed
+
+def main(total: int = 5000) -> None:
+    with StandInServer(route=route_for(total)) as server:
+        client = SubModelClient(token="bench")
+        client.base_url = server.url
+        results = {
+            f"iter_devices limit={LIMIT}": timed(lambda: sum(1 for _ in client.device.iter_devices(limit=LIMIT)), total),
+            f"fetch_all limit={LIMIT}": timed(lambda: len(client.fetch_all("device/list", limit=LIMIT)), total),
+            "fetch_all auto page size": timed(lambda: len(client.fetch_all("device/list")), total),
+            f"async fetch_all limit={LIMIT}": timed(lambda: asyncio.run(async_fetch_all(server.url, LIMIT)), total),
+            "async fetch_all auto page size": timed(lambda: asyncio.run(async_fetch_all(server.url, None)), total),
+        }
+        client.close()
+    report(f"{total} items, {LATENCY * 1e3:.0f} ms per page + {PER_ITEM * 1e6:.0f} us per item", results, unit="ms")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,60 @@
+"""Benchmark looking up the details of many known instances
+
+The local stand-in API answers each ``inst/detail/{inst_id}`` GET after a
+simulated delay. The ID list repeats some instances, as lists gathered from
+several sources do. Compares a serial ``get_instance`` loop with
+``Instance.get_many_instances`` on both clients, cold and again within the
+lookup cache TTL.
+
+Usage:
+    python benchmarks/bench_get_many.py [ids]
+"""
+
+import asyncio
+import sys
+import time
+from _server import StandInServer, report
+from submodel.sdk.async_client import AsyncSubModelClient
+from submodel.sdk.client import SubModelClient
+
+LATENCY = 0.02  # Seconds the stand-in takes per lookup
+
+def route(handler):
+    time.sleep(LATENCY)
+    return {"inst_id": handler.path.rsplit("/", 1)[-1], "status": "running"}
+
+def serial_loop(client: SubModelClient, ids) -> int:
+    return len({inst_id: client.instance.get_instance(inst_id) for inst_id in ids})
+
+def bulk(client: SubModelClient, ids) -> int:
+    result = client.instance.get_many_instances(ids, concurrency=32)
+    assert result.ok, result.errors
+    return len(result.results)
+
+async def async_bulk(url: str, ids) -> float:
+    async with AsyncSubModelClient(token="bench") as client:
+        client.base_url = url
+        start = time.perf_counter()
+        result = await client.instance.get_many_instances(ids, concurrency=32)
+        assert result.ok, result.errors
+        return (time.perf_counter() - start) * 1e3
+
+def timed(run) -> float:
+    start = time.perf_counter()
+    run()
+    return (time.perf_counter() - start) * 1e3
+
+def main(count: int = 300) -> None:
+    ids = [f"inst-{i % (count * 2 // 3)}" for i in range(count)]
+    with StandInServer(route=route) as server:
+        client = SubModelClient(token="bench")
+        client.base_url = server.url
+        results = {"serial get_instance": timed(lambda: serial_loop(client, ids))}
+        results["get_many_instances cold"] = timed(lambda: bulk(client, ids))
+        results["get_many_instances cached"] = timed(lambda: bulk(client, ids))
+        results["async get_many_instances cold"] = asyncio.run(async_bulk(server.url, ids))
+        client.close()
+    report(f"{count} lookups of {len(set(ids))} instances, {LATENCY * 1e3:.0f} ms each, concurrency 32", results, unit="ms")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
@@ -0,0 +1,81 @@
+"""Benchmark JSON codecs on large list payloads
+
+Measures encoding and decoding of an ``inst/list``-sized response with each
+installed codec, then the end-to-end cost of fetching it from the local
+stand-in API with the sync client using native decoding vs. each codec.
+
+Usage:
+    python benchmarks/bench_json_codec.py [items]
+"""
+
+import json
+import sys
+import time
+from _server import StandInServer, report
+from submodel.sdk.client import SubModelClient
+from submodel.sdk.codec import CODECS, get_codec
+
+def make_payload(items: int) -> dict:
+    """Response envelope shaped like a large ``inst/list`` page"""
+    return {"code": 20000, "data": {"total": items, "list": [
+        {
+            "inst_id": f"inst-{i:06d}",
+            "name": f"worker-{i}",
+            "status": "running" if i % 3 else "stopped",
+            "mode": "pod",
+            "gpu": {"model": "RTX 4090", "count": 1 + i % 4, "memory_gb": 24.0},
+            "price_per_hour": 0.35 + (i % 10) / 100,
+            "ports": [8080, 22],
+            "env": {"MODEL": "llama", "REGION": "us-east"},
+            "created_at": "2025-01-01T00:00:00Z",
+        }
+        for i in range(items)
+    ]}}
+
+def codecs():
+    for name in CODECS:
+        try:
+            yield name, get_codec(name)
+        except ImportError:
+            print(f"  ({name} not installed, skipped)")
+
+def bench_codec(codec, payload, body: bytes, rounds: int):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        codec.dumps(payload)
+    encode = (time.perf_counter() - start) * 1e3 / rounds
+    start = time.perf_counter()
+    for _ in range(rounds):
+        codec.loads(body)
+    decode = (time.perf_counter() - start) * 1e3 / rounds
+    return encode, decode
+
+def bench_client(url: str, json_codec, rounds: int) -> float:
+    with SubModelClient(token="bench", json_codec=json_codec) as client:
+        client.base_url = url
+        client.get("inst/list")  # Warm up the connection
+        start = time.perf_counter()
+        for _ in range(rounds):
+            client.get("inst/list")
+        return (time.perf_counter() - start) * 1e3 / rounds
+
+def main(items: int = 5000, rounds: int = 20) -> None:
+    payload = make_payload(items)
+    body = json.dumps(payload).encode()
+    print(f"Payload: {items} items, {len(body) / 1e6:.1f} MB")
+
+    available = list(codecs())
+    encode, decode = {}, {}
+    for name, codec in available:
+        encode[name], decode[name] = bench_codec(codec, payload, body, rounds)
+    report("Encode", encode, unit="ms")
+    report("Decode", decode, unit="ms")
+
+    with StandInServer(route=lambda handler: (200, {}, body)) as server:
+        results = {"native (response.json)": bench_client(server.url, None, rounds)}
+        for name, codec in available:
+            results[name] = bench_client(server.url, codec, rounds)
+    report(f"GET inst/list end to end, {items} items", results)
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,62 @@
+"""Benchmark reading a wide list response fully decoded vs. as a lazy view
+
+Decodes a large ``device/list`` body with ``json.loads`` and with
+``LazyResponse``, then reads the envelope only, the first 20 devices, or
+every device. Reports the time taken and the memory still held by the
+response once it has been read.
+
+Usage:
+    python benchmarks/bench_lazy.py [devices]
+"""
+
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from bench_records import make_body
+from submodel.sdk.lazy import LazyResponse
+
+def full(body: bytes):
+    return json.loads(body)
+
+def lazy(body: bytes):
+    return LazyResponse(body)
+
+def envelope(page) -> int:
+    return page["data"]["total"]
+
+def first_page(page) -> int:
+    items = page["data"]["items"]
+    return sum(1 for item in items[:20] if item["status"] == "online")
+
+def every_item(page) -> int:
+    return sum(1 for item in page["data"]["items"] if item["status"] == "online")
+
+def measure(load, read, body: bytes):
+    """Load and read the body, returning the time taken and the memory the response holds"""
+    gc.collect()
+    start = time.perf_counter()
+    read(load(body))
+    elapsed = (time.perf_counter() - start) * 1e3
+    gc.collect()
+    tracemalloc.start()
+    page = load(body)
+    read(page)
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del page
+    return elapsed, held
+
+def main(size: int = 50000) -> None:
+    body = make_body(size)
+    print(f"{size} devices ({len(body) / 1e6:.1f} MB of JSON)")
+    print(f"  {'':<32}{'time':>12}{'held':>12}")
+    for reading, read in (("envelope", envelope), ("first 20 devices", first_page), ("every device", every_item)):
+        for name, load in (("json.loads", full), ("LazyResponse", lazy)):
+            elapsed, held = measure(load, read, body)
+            print(f"  {reading + ', ' + name:<32}{elapsed:>9.1f} ms{held / 1e6:>9.1f} MB")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
@@ -0,0 +1,86 @@
+"""Benchmark the cost of SDK log output on the caller's thread
+
+Compares client construction and a request that is retried once (one
+"Initialized" info line and one retry warning per iteration) with:
+
+    - the library default (NullHandler, nothing is written)
+    - a synchronous stderr-style handler on the caller's thread, as the SDK
+      used to install at import time
+    - configure_logging() with the background queue listener
+
+Handlers write to a temporary file so the terminal does not skew the
+numbers, once as is and once slowed down by 200 us per record to stand in
+for a busy terminal, a network share or a log shipper.
+
+Usage:
+    python benchmarks/bench_logging.py [iterations]
+"""
+
+import logging
+import sys
+import tempfile
+import time
+from _server import report
+from submodel.sdk.client import SubModelClient
+from submodel.sdk.retries import RetryPolicy
+from submodel.sdk.transport import InMemoryTransport, TransportResponse
+from submodel.sdk.utils import LOG_FORMAT, configure_logging, disable_async_logging, logger
+
+def flaky_transport() -> InMemoryTransport:
+    """Transport failing every other request so each call is retried once"""
+    state = {"calls": 0}
+
+    def handler(*args, **kwargs):
+        state["calls"] += 1
+        return TransportResponse(503) if state["calls"] % 2 else {"code": 20000}
+
+    return InMemoryTransport(handler=handler)
+
+def bench(count: int):
+    transport = flaky_transport()
+    start = time.perf_counter()
+    for _ in range(count):
+        SubModelClient(token="bench", transport=transport)
+    construct = (time.perf_counter() - start) * 1e6 / count
+
+    client = SubModelClient(token="bench", transport=transport, backoff_factor=0,
+                            retry_policy=RetryPolicy(budget=False))
+    start = time.perf_counter()
+    for _ in range(count):
+        client.get("inst/list")
+    request = (time.perf_counter() - start) * 1e6 / count
+    return construct, request
+
+class SlowFileHandler(logging.FileHandler):
+    """File handler taking 200 us longer per record"""
+
+    def emit(self, record):
+        time.sleep(0.0002)
+        super().emit(record)
+
+def file_handler(path: str, slow: bool = False) -> logging.Handler:
+    handler = (SlowFileHandler if slow else logging.FileHandler)(path)
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    return handler
+
+def main(count: int = 5000) -> None:
+    construct, request = {}, {}
+    construct["NullHandler (default)"], request["NullHandler (default)"] = bench(count)
+
+    with tempfile.NamedTemporaryFile(suffix=".log") as log_file:
+        for slow in (False, True):
+            sink = "slow sink" if slow else "file"
+            configure_logging(logging.INFO, handler=file_handler(log_file.name, slow), background=False)
+            name = f"synchronous handler, {sink}"
+            construct[name], request[name] = bench(count)
+
+            configure_logging(logging.INFO, handler=file_handler(log_file.name, slow), background=True)
+            name = f"background listener, {sink}"
+            construct[name], request[name] = bench(count)
+            disable_async_logging()
+
+    report(f"Client construction x {count}", construct, unit="us")
+    report(f"GET retried once x {count}", request, unit="us/req")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
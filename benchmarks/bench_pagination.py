@@ -0,0 +1,81 @@
+"""Benchmark walking every page of device/list with read-ahead
+
+The local stand-in API answers each page after a simulated network delay,
+and the caller spends a fixed time processing every page. Compares the
+hand-written ``page``/``limit`` loop with ``Device.iter_devices`` and the
+async client's ``paginate`` at several prefetch depths.
+
+Usage:
+    python benchmarks/bench_pagination.py [pages]
+"""
+
+import asyncio
+import sys
+import time
+from urllib.parse import parse_qs, urlsplit
+from _server import StandInServer, report
+from submodel.sdk.async_client import AsyncSubModelClient
+from submodel.sdk.client import SubModelClient
+
+LIMIT = 100
+LATENCY = 0.03     # Seconds the stand-in takes per page
+PROCESSING = 0.02  # Seconds the caller spends per page
+
+def route_for(total: int):
+    def route(handler):
+        query = parse_qs(urlsplit(handler.path).query)
+        page, limit = int(query["page"][0]), int(query["limit"][0])
+        time.sleep(LATENCY)
+        start = (page - 1) * limit
+        items = [{"device_id": f"dev-{i}"} for i in range(start, min(start + limit, total))]
+        return {"page": page, "limit": limit, "total": total, "items": items}
+    return route
+
+def manual_loop(client: SubModelClient) -> int:
+    count, page = 0, 1
+    while True:
+        items = client.device.list_devices(page=page, limit=LIMIT)["data"]["items"]
+        count += len(items)
+        time.sleep(PROCESSING)
+        if len(items) < LIMIT:
+            return count
+        page += 1
+
+def iterator_walk(client: SubModelClient, prefetch: int) -> int:
+    count = 0
+    for i, _ in enumerate(client.device.iter_devices(limit=LIMIT, prefetch=prefetch)):
+        count += 1
+        if i % LIMIT == LIMIT - 1:
+            time.sleep(PROCESSING)
+    return count
+
+async def async_walk(url: str, prefetch: int) -> int:
+    async with AsyncSubModelClient(token="bench") as client:
+        client.base_url = url
+        count = 0
+        async for _ in client.paginate("device/list", limit=LIMIT, prefetch=prefetch):
+            count += 1
+            if count % LIMIT == 0:
+                await asyncio.sleep(PROCESSING)
+        return count
+
+def timed(run) -> float:
+    start = time.perf_counter()
+    run()
+    return (time.perf_counter() - start) * 1e3
+
+def main(pages: int = 20) -> None:
+    total = pages * LIMIT - LIMIT // 2
+    with StandInServer(route=route_for(total)) as server:
+        client = SubModelClient(token="bench")
+        client.base_url = server.url
+        results = {"manual page loop": timed(lambda: manual_loop(client))}
+        for prefetch in (0, 1, 2, 4):
+            results[f"iter_devices prefetch={prefetch}"] = timed(lambda: iterator_walk(client, prefetch))
+        for prefetch in (0, 1, 2, 4):
+            results[f"async paginate prefetch={prefetch}"] = timed(lambda: asyncio.run(async_walk(server.url, prefetch)))
+        client.close()
+    report(f"{pages} pages of {LIMIT}, {LATENCY * 1e3:.0f} ms per page + {PROCESSING * 1e3:.0f} ms processing", results, unit="ms")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
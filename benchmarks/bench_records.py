@@ -0,0 +1,55 @@
+"""Benchmark the memory held by a device inventory as dicts vs. records
+
+Decodes ``device/list`` payloads of growing size and keeps every device,
+either as the raw dicts or converted to ``DeviceRecord``. Reports the memory
+still held once the page is processed, and the decode-and-convert time.
+
+Usage:
+    python benchmarks/bench_records.py
+"""
+
+import gc
+import json
+import time
+import tracemalloc
+from submodel.sdk.models import DeviceRecord
+
+def make_body(items: int) -> bytes:
+    """Envelope of a ``device/list`` page, with the device keys of tests/test_device.py"""
+    return json.dumps({"code": 20000, "data": {"total": items, "page": 1, "limit": items, "items": [
+        {"id": f"device{i}", "status": "online" if i % 5 else "offline", "machine_id": f"{i:012x}"}
+        for i in range(items)
+    ]}}).encode()
+
+def as_dicts(body: bytes):
+    return json.loads(body)["data"]["items"]
+
+def as_records(body: bytes):
+    return list(DeviceRecord.from_items(json.loads(body)["data"]["items"]))
+
+def measure(load, body: bytes):
+    """Load the inventory and return the time taken and the memory it still holds"""
+    gc.collect()
+    start = time.perf_counter()
+    load(body)
+    elapsed = (time.perf_counter() - start) * 1e3
+    gc.collect()
+    tracemalloc.start()
+    inventory = load(body)
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del inventory
+    return elapsed, held
+
+def main() -> None:
+    for size in (10000, 50000):
+        body = make_body(size)
+        print(f"{size} devices ({len(body) / 1e6:.1f} MB of JSON)")
+        print(f"  {'':<12}{'load':>12}{'held':>12}{'per device':>14}")
+        for name, load in (("dicts", as_dicts), ("records", as_records)):
+            elapsed, held = measure(load, body)
+            print(f"  {name:<12}{elapsed:>9.1f} ms{held / 1e6:>9.1f} MB{held / size:>11.0f} B")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark compressed request bodies on large serverless inputs
+
+Sends a ``runsync``-style input (a long chat history plus a base64 image) to
+the local stand-in API, which decompresses it, with the sync and async
+clients: uncompressed vs. gzip (and zstd when installed), over loopback and
+over emulated uplinks.
+
+Usage:
+    python benchmarks/bench_request_compression.py [megabytes]
+"""
+
+import asyncio
+import base64
+import random
+import sys
+import time
+from _server import StandInServer, report
+from submodel.sdk.async_client import AsyncSubModelClient
+from submodel.sdk.client import SubModelClient
+from submodel.sdk.compression import RequestCompression
+
+WORDS = ("the model should answer the question using the context below and cite "
+         "which document each fact comes from if the answer is not in the context "
+         "say that it does not know").split()
+
+def make_input(megabytes: float) -> dict:
+    """Serverless input of about the given size"""
+    rng = random.Random(0)
+    size = int(megabytes * 1e6)
+    image = base64.b64encode(bytes(rng.getrandbits(8) for _ in range(size // 8))).decode()
+    messages = []
+    while sum(len(m["content"]) for m in messages) < size - len(image):
+        messages.append({"role": rng.choice(("user", "assistant")),
+                         "content": " ".join(rng.choice(WORDS) for _ in range(200))})
+    return {"messages": messages, "image": image, "max_tokens": 512}
+
+def compressions():
+    yield "none", None
+    yield "gzip", RequestCompression("gzip", threshold=0)
+    try:
+        yield "zstd", RequestCompression("zstd", threshold=0)
+    except ImportError:
+        print("  (zstandard not installed, zstd skipped)")
+
+def bench_sync(url: str, compression, data: dict, rounds: int) -> float:
+    with SubModelClient(token="bench", compress_requests=compression) as client:
+        client.base_url = url
+        client.post("sl/bench/runsync", json={"input": data})
+        start = time.perf_counter()
+        for _ in range(rounds):
+            client.post("sl/bench/runsync", json={"input": data})
+        return (time.perf_counter() - start) * 1e3 / rounds
+
+async def bench_async(url: str, compression, data: dict, rounds: int) -> float:
+    async with AsyncSubModelClient(token="bench", compress_requests=compression) as client:
+        client.base_url = url
+        await client.post("sl/bench/runsync", json={"input": data})
+        start = time.perf_counter()
+        for _ in range(rounds):
+            await client.post("sl/bench/runsync", json={"input": data})
+        return (time.perf_counter() - start) * 1e3 / rounds
+
+def main(megabytes: float = 4.0, rounds: int = 5) -> None:
+    data = make_input(megabytes)
+    received = {}
+
+    def route(handler):
+        received[handler.headers.get("Content-Encoding") or "none"] = len(handler.raw_body)
+        return {"status": "COMPLETED", "size": len(handler.body)}
+
+    available = list(compressions())
+    for label, rate in (("loopback", None), ("100 Mbit/s uplink", 12.5e6), ("20 Mbit/s uplink", 2.5e6)):
+        with StandInServer(route=route, upload_rate=rate) as server:
+            results = {}
+            for name, compression in available:
+                results[f"sync {name}"] = bench_sync(server.url, compression, data, rounds)
+                results[f"async {name}"] = asyncio.run(bench_async(server.url, compression, data, rounds))
+        report(f"POST runsync, {megabytes:g} MB input, {label}", results)
+    report("Bytes on the wire", {name: size / 1e6 for name, size in received.items()}, unit="MB")
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 4.0)
@@ -0,0 +1,94 @@
+"""Benchmark compressed responses, buffered vs. streamed
+
+Serves a large gzip-encoded ``device/list`` page from the local stand-in API
+and compares fetching it with ``client.get`` (buffered and decoded) against
+reading it with ``client.stream`` chunk by chunk, for the sync and async
+clients: wall time and peak Python memory (tracemalloc).
+
+Usage:
+    python benchmarks/bench_response_streaming.py [items]
+"""
+
+import asyncio
+import gzip
+import json
+import sys
+import time
+import tracemalloc
+from _server import StandInServer, report
+from submodel.sdk.async_client import AsyncSubModelClient
+from submodel.sdk.client import SubModelClient
+
+def make_body(items: int) -> bytes:
+    """Envelope of a large ``device/list`` page"""
+    return json.dumps({"code": 20000, "data": {"total": items, "items": [
+        {
+            "device_id": f"dev-{i:06d}",
+            "name": f"node-{i}",
+            "status": "online" if i % 5 else "offline",
+            "gpu": {"model": "RTX 4090", "count": 8, "memory_gb": 24.0},
+            "area": {"id": i % 12, "name": "us-east"},
+            "price_per_hour": 0.35 + (i % 10) / 100,
+            "created_at": "2025-01-01T00:00:00Z",
+        }
+        for i in range(items)
+    ]}}).encode()
+
+def measure(run):
+    tracemalloc.start()
+    start = time.perf_counter()
+    run()
+    elapsed = (time.perf_counter() - start) * 1e3
+    peak = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+    return elapsed, peak
+
+def sync_runs(url: str):
+    client = SubModelClient(token="bench")
+    client.base_url = url
+
+    def buffered():
+        client.get("device/list")
+
+    def streamed():
+        with client.stream("GET", "device/list") as response:
+            for _ in response.iter_bytes():
+                pass
+
+    client.get("device/list")  # Warm up the connection
+    return {"sync get (decoded)": buffered, "sync stream (bytes)": streamed}
+
+def async_run(url: str, streamed: bool):
+    async def main():
+        async with AsyncSubModelClient(token="bench") as client:
+            client.base_url = url
+            if streamed:
+                async with client.stream("GET", "device/list") as response:
+                    async for _ in response.iter_bytes():
+                        pass
+            else:
+                await client.get("device/list")
+    return lambda: asyncio.run(main())
+
+def main(items: int = 50000) -> None:
+    body = make_body(items)
+    compressed = gzip.compress(body, 1)
+    print(f"Payload: {items} items, {len(body) / 1e6:.1f} MB, {len(compressed) / 1e6:.1f} MB gzip")
+
+    def route(handler):
+        if "gzip" in handler.headers.get("Accept-Encoding", ""):
+            return 200, {"Content-Encoding": "gzip"}, compressed
+        return 200, {}, body
+
+    times, peaks = {}, {}
+    with StandInServer(route=route) as server:
+        runs = sync_runs(server.url)
+        runs["async get (decoded)"] = async_run(server.url, False)
+        runs["async stream (bytes)"] = async_run(server.url, True)
+        for name, run in runs.items():
+            times[name], peaks[name] = measure(run)
+    report("Fetch device/list (under tracemalloc)", times, unit="ms")
+    report("Peak Python memory", peaks, unit="MB")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
@@ -0,0 +1,38 @@
+"""Benchmark per-request latency with and without the pooled session
+
+Compares a fresh connection per call (module-level ``requests.request``)
+with the client-owned keep-alive session against a local stand-in server.
+
+Usage:
+    python benchmarks/bench_session_pool.py [requests]
+"""
+
+import sys
+import time
+import requests
+from _server import StandInServer, report
+from submodel.sdk.client import create_client
+
+def main(count: int = 500) -> None:
+    with StandInServer() as server:
+        url = f"{server.url}/inst/detail/bench"
+
+        start = time.perf_counter()
+        for _ in range(count):
+            requests.request("GET", url, headers={"x-token": "bench"}).json()
+        per_call = (time.perf_counter() - start) * 1000 / count
+
+        with create_client(token="bench") as client:
+            client.base_url = server.url
+            start = time.perf_counter()
+            for _ in range(count):
+                client.instance.get_instance("bench")
+            pooled = (time.perf_counter() - start) * 1000 / count
+
+    report(f"GET inst/detail x {count}", {
+        "new connection per call": per_call,
+        "pooled keep-alive session": pooled,
+    })
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,86 @@
+"""Benchmark incremental parsing of large device/list pages
+
+Compares ``Device.list_devices`` (buffer and decode the whole page) with
+``Device.stream_devices`` and the async client's ``stream_items`` (parse the
+body while it arrives) on pages of growing size served by the local stand-in
+API: time to the first item, time to the last item and peak Python memory.
+
+Usage:
+    python benchmarks/bench_stream_items.py
+"""
+
+import asyncio
+import json
+import time
+import tracemalloc
+from _server import StandInServer
+from submodel.sdk.async_client import AsyncSubModelClient
+from submodel.sdk.client import SubModelClient
+
+def make_body(items: int) -> bytes:
+    """Envelope of a ``device/list`` page"""
+    return json.dumps({"code": 20000, "data": {"total": items, "page": 1, "limit": items, "items": [
+        {
+            "device_id": f"dev-{i:06d}",
+            "name": f"node-{i}",
+            "status": "online" if i % 5 else "offline",
+            "gpu": {"model": "RTX 4090", "count": 8, "memory_gb": 24.0},
+            "area": {"id": i % 12, "name": "us-east"},
+            "labels": ["spot", "nvlink"],
+            "created_at": "2025-01-01T00:00:00Z",
+        }
+        for i in range(items)
+    ]}}).encode()
+
+def measure(consume):
+    """Run a consumer of an item iterator, returning first/last item times and peak memory"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    first = consume(start)
+    last = (time.perf_counter() - start) * 1e3
+    peak = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+    return first, last, peak
+
+def sync_consumer(items):
+    def consume(start):
+        first = None
+        for _ in items():
+            if first is None:
+                first = (time.perf_counter() - start) * 1e3
+        return first
+    return consume
+
+def async_consumer(url: str):
+    async def main(start):
+        async with AsyncSubModelClient(token="bench") as client:
+            client.base_url = url
+            first = None
+            async for _ in client.stream_items("device/list"):
+                if first is None:
+                    first = (time.perf_counter() - start) * 1e3
+            return first
+    return lambda start: asyncio.run(main(start))
+
+def main() -> None:
+    print("Times are measured under tracemalloc and are inflated accordingly")
+    for size in (1000, 10000, 50000):
+        body = make_body(size)
+        with StandInServer(route=lambda handler: (200, {}, body)) as server:
+            client = SubModelClient(token="bench")
+            client.base_url = server.url
+            client.get("area/list")  # Warm up the connection
+            runs = {
+                "list_devices": sync_consumer(lambda: client.device.list_devices(limit=size)["data"]["items"]),
+                "stream_devices": sync_consumer(lambda: client.device.stream_devices(limit=size)),
+                "async stream_items": async_consumer(server.url),
+            }
+            print(f"device/list page of {size} items, {len(body) / 1e6:.1f} MB")
+            print(f"  {'':<20}{'first item':>12}{'last item':>12}{'peak memory':>14}")
+            for name, consume in runs.items():
+                first, last, peak = measure(consume)
+                print(f"  {name:<20}{first:>9.1f} ms{last:>9.1f} ms{peak:>11.1f} MB")
+            client.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Benchmark SDK overhead per call with no sockets involved
+
+Sends requests through the in-memory transports so the measured time is
+header building, URL joining, logging, retry wrapping and error checking.
+
+Usage:
+    python benchmarks/bench_transport_overhead.py [requests]
+"""
+
+import asyncio
+import sys
+import time
+from _server import report
+from submodel.sdk.async_client import AsyncSubModelClient
+from submodel.sdk.client import SubModelClient
+from submodel.sdk.transport import AsyncInMemoryTransport, InMemoryTransport
+
+RESPONSE = {"code": 20000, "data": {"inst_id": "bench", "status": "running"}}
+
+def bench_sync(count: int) -> float:
+    transport = InMemoryTransport(handler=lambda *args, **kwargs: RESPONSE)
+    client = SubModelClient(token="bench", transport=transport)
+    start = time.perf_counter()
+    for _ in range(count):
+        client.instance.get_instance("bench")
+    return (time.perf_counter() - start) * 1e6 / count
+
+async def bench_async(count: int) -> float:
+    transport = AsyncInMemoryTransport(handler=lambda *args, **kwargs: RESPONSE)
+    async with AsyncSubModelClient(token="bench", transport=transport) as client:
+        start = time.perf_counter()
+        for _ in range(count):
+            await client.instance.get_instance("bench")
+        return (time.perf_counter() - start) * 1e6 / count
+
+def main(count: int = 20000) -> None:
+    report(f"SDK overhead, GET inst/detail x {count}", {
+        "SubModelClient": bench_sync(count),
+        "AsyncSubModelClient": asyncio.run(bench_async(count)),
+    }, unit="us/req")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
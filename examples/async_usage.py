@@ -14,7 +14,7 @@ submodel.api_key = os.getenv("SUBMODEL_API_KEY")
 
 async def create_and_monitor_instance():
     """Create and monitor instance status"""
-    async with create_async_client() as client:  # No need to pass api_key here
+    async with create_async_client(close_on_exit=True) as client:  # No need to pass api_key here
         # Create instance
         instance = await client.instance.create(
             billing_method="payg",
@@ -42,7 +42,7 @@ async def create_and_monitor_instance():
 
 async def parallel_instance_creation(num_instances: int = 3):
     """Create multiple instances in parallel"""
-    async with create_async_client() as client:
+    async with create_async_client(close_on_exit=True) as client:
         tasks = []
         for i in range(num_instances):
             task = client.instance.create(
@@ -70,7 +70,7 @@ async def main():
         print(f"Successfully created {len(instance_ids)} instances: {instance_ids}")
         
         # 3. Get status of all instances asynchronously
-        async with create_async_client() as client:
+        async with create_async_client(close_on_exit=True) as client:
             print("\nGetting status of all instances...")
             tasks = [
                 client.instance.get_instance(id_)
@@ -7,7 +7,7 @@ from typing import Optional
 from submodel import __version__
 from submodel.sdk.client import create_client
 from submodel.sdk.exceptions import SubModelError, AuthenticationError, APIError
-from submodel.sdk.utils import set_log_level
+from submodel.sdk.utils import configure_logging
 
 def handle_error(func):
     """Handle errors during command execution"""
@@ -32,10 +32,10 @@ def cli(ctx, token: Optional[str], api_key: Optional[str], debug: bool):
     logger = logging.getLogger("submodel")
     
     if debug:
-        set_log_level(logging.DEBUG)
+        configure_logging(logging.DEBUG, background=False)
         logger.debug("Debug mode enabled")
     else:
-        set_log_level(logging.INFO)
+        configure_logging(logging.INFO, background=False)
         
     ctx.ensure_object(dict)
     try:
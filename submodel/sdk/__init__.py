@@ -14,16 +14,44 @@ token: Optional[str] = os.getenv("SUBMODEL_TOKEN")
 
 from .client import SubModelClient as Client
 from .async_client import AsyncSubModelClient as AsyncClient, create_async_client
-from .auth import Auth
-from .device import Device, Area, Baremetal
-from .instance import Instance
-from .serverless import ServerlessHandler, ServerlessEndpoint
+from .auth import Auth, AsyncAuth
+from .device import Device, Area, Baremetal, AsyncDevice, AsyncArea, AsyncBaremetal
+from .instance import Instance, AsyncInstance
+from .job import Job, AsyncJob
+from .serverless import ServerlessHandler, ServerlessEndpoint, AsyncServerlessEndpoint
+from .cache import ResponseCache, ValidatorCache
+from .ratelimit import RateLimiter
+from .concurrency import AdaptiveConcurrencyLimiter
+from .circuit import CircuitBreakerRegistry
+from .retries import RetryPolicy, RetryBudget
+from .hedging import HedgingPolicy
+from .timeouts import Timeout, Deadline
+from .codec import JSONCodec, get_codec
+from .compression import RequestCompression
+from .jsonstream import JSONItemStream
+from .lazy import LazyResponse, LazyItems
+from .bulk import BulkResult
+from .models import Record, InstanceRecord, DeviceRecord, AreaRecord, BaremetalRecord, JobRecord
+from .transport import (
+    Transport,
+    AsyncTransport,
+    RequestsTransport,
+    AiohttpTransport,
+    HTTPXTransport,
+    AsyncHTTPXTransport,
+    InMemoryTransport,
+    AsyncInMemoryTransport,
+    StreamedResponse,
+    AsyncStreamedResponse,
+)
 from .exceptions import (
     SubModelError,
     APIError,
     AuthenticationError,
     ResourceNotFoundError,
     QuotaExceededError,
+    CircuitOpenError,
+    DeadlineExceededError,
 )
 
 __all__ = [
@@ -31,15 +59,58 @@ __all__ = [
     "AsyncClient", 
     "create_async_client", 
     "Auth",
+    "AsyncAuth",
     "Device", 
     "Area", 
     "Baremetal", 
+    "AsyncDevice",
+    "AsyncArea",
+    "AsyncBaremetal",
     "Instance",
+    "AsyncInstance",
+    "Job",
+    "AsyncJob",
     "ServerlessHandler", 
     "ServerlessEndpoint",
+    "AsyncServerlessEndpoint",
+    "ResponseCache",
+    "ValidatorCache",
+    "RateLimiter",
+    "AdaptiveConcurrencyLimiter",
+    "CircuitBreakerRegistry",
+    "RetryPolicy",
+    "RetryBudget",
+    "HedgingPolicy",
+    "Timeout",
+    "Deadline",
+    "JSONCodec",
+    "get_codec",
+    "RequestCompression",
+    "JSONItemStream",
+    "LazyResponse",
+    "LazyItems",
+    "BulkResult",
+    "Record",
+    "InstanceRecord",
+    "DeviceRecord",
+    "AreaRecord",
+    "BaremetalRecord",
+    "JobRecord",
+    "Transport",
+    "AsyncTransport",
+    "RequestsTransport",
+    "AiohttpTransport",
+    "HTTPXTransport",
+    "AsyncHTTPXTransport",
+    "InMemoryTransport",
+    "AsyncInMemoryTransport",
+    "StreamedResponse",
+    "AsyncStreamedResponse",
     "SubModelError",
     "APIError",
     "AuthenticationError",
     "ResourceNotFoundError",
     "QuotaExceededError",
+    "CircuitOpenError",
+    "DeadlineExceededError",
 ]
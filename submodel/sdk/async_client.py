@@ -1,19 +1,54 @@
 """Asynchronous SubModel API Client"""
 
-import aiohttp
 import asyncio
-from typing import Dict, Any, Optional
-from .exceptions import raise_for_error
-from .utils import log_request, log_response, logger
+import time
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Dict, Any, AsyncIterator, Awaitable, Callable, Hashable, List, Optional, Sequence, Union
+from .base import BaseClient
+from .cache import ResponseCache, ValidatorCache
+from .circuit import CircuitBreakerRegistry
+from .codec import JSONCodec, get_codec
+from .compression import RequestCompression
+from .exceptions import DeadlineExceededError
+from .concurrency import AdaptiveConcurrencyLimiter
+from .hedging import HedgingPolicy
+from .jsonstream import JSONItemStream
+from .lazy import LazyResponse
+from .pagination import FIRST_PAGE_LIMIT, PagePlan, aiter_pages, cancel_tasks, page_items
+from .ratelimit import RateLimiter
+from .retries import RetryPolicy
+from .singleflight import AsyncSingleFlight, request_key
+from .timeouts import DEFAULT_TIMEOUT, Deadline, Timeout
+from .transport import AiohttpTransport, AsyncStreamedResponse, AsyncTransport
+from .utils import logger
 
-class AsyncSubModelClient:
+class AsyncSubModelClient(BaseClient):
     """Asynchronous SubModel API Client"""
     
     def __init__(self, 
                  token: Optional[str] = None, 
                  api_key: Optional[str] = None,
                  max_retries: int = 3,
-                 backoff_factor: float = 0.5):
+                 backoff_factor: float = 0.5,
+                 connector_limit: int = 100,
+                 connector_limit_per_host: int = 0,
+                 dns_cache_ttl: Optional[int] = 10,
+                 keepalive_timeout: float = 15.0,
+                 close_on_exit: bool = False,
+                 transport: Optional[AsyncTransport] = None,
+                 coalesce_requests: bool = False,
+                 cache: Union[ResponseCache, bool, None] = None,
+                 conditional_get: Union[ValidatorCache, bool, None] = None,
+                 rate_limiter: Union[RateLimiter, bool, None] = None,
+                 circuit_breaker: Union[CircuitBreakerRegistry, bool, None] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 hedging: Union[HedgingPolicy, bool, None] = None,
+                 timeout: Union[Timeout, float, None] = DEFAULT_TIMEOUT,
+                 deadline: Optional[float] = None,
+                 json_codec: Union[str, JSONCodec, None] = None,
+                 compress_requests: Union[RequestCompression, bool, None] = None,
+                 adaptive_concurrency: Union[AdaptiveConcurrencyLimiter, bool, None] = None):
         """Initialize the client
         
         Args:
@@ -21,68 +56,222 @@ class AsyncSubModelClient:
             api_key: API key
             max_retries: Maximum number of retries
             backoff_factor: Retry backoff factor
+            connector_limit: Maximum number of simultaneous connections (0 for no limit)
+            connector_limit_per_host: Maximum simultaneous connections per host (0 for no limit)
+            dns_cache_ttl: Seconds to cache resolved DNS entries, None to cache forever
+            keepalive_timeout: Seconds an idle connection is kept open for reuse
+            close_on_exit: Close the session when the outermost ``async with``
+                block exits, dropping its warm connections. By default they
+                are kept across context entries and released by ``aclose()``,
+                which must be called before the event loop ends.
+            transport: Transport to send requests through. Defaults to an
+                AiohttpTransport built from the connector options.
+            coalesce_requests: Share one in-flight GET between tasks asking
+                for the same URL and parameters at the same time
+            cache: Response cache for slow-changing read endpoints, or True
+                to use a ResponseCache with the default TTLs
+            conditional_get: Validator store used to revalidate GETs with
+                If-None-Match/If-Modified-Since, or True for a default one
+            rate_limiter: Token-bucket limiter awaited before every request,
+                or True for one with the default limits. Share one instance
+                between clients to apply a process-wide limit.
+            circuit_breaker: Per-route circuit breakers that fail fast with
+                CircuitOpenError while a route keeps failing, or True for
+                breakers with the default thresholds
+            retry_policy: Policy deciding which failures are retried and
+                when, shared by every request of the client. Defaults to a
+                RetryPolicy using ``max_retries`` and ``backoff_factor`` with
+                a retry budget.
+            hedging: Policy for hedging slow idempotent GETs with a second
+                attempt, or True for one with the default settings
+            timeout: Timeout of each attempt, as a Timeout or total seconds.
+                Defaults to a 10 second connect and 300 second read timeout.
+            deadline: Seconds each call may take including retries and
+                backoff, None for no limit
+            json_codec: JSON codec for request and response bodies, by name
+                (``"auto"``, ``"orjson"``, ``"msgspec"``, ``"json"``) or as a
+                JSONCodec. Defaults to the HTTP library's own JSON handling.
+            compress_requests: Compression of request bodies with
+                Content-Encoding, or True for gzip of bodies of 64 KiB and
+                more. The server must accept compressed, chunked uploads.
+            adaptive_concurrency: AIMD limiter bounding the requests in
+                flight by observed latency and errors, or True for one with
+                the default settings
         """
-        self.base_url = "https://api.submodel.ai/api/v1"
-        self.token = token
-        self.api_key = api_key
-        self.max_retries = max_retries
-        self.backoff_factor = backoff_factor
-        self._session = None
-        
-        if not (token or api_key):
-            raise ValueError("Either token or api_key must be provided")
+        super().__init__(token, api_key, max_retries, backoff_factor)
+        self.transport = transport or AiohttpTransport(
+            limit=connector_limit,
+            limit_per_host=connector_limit_per_host,
+            dns_cache_ttl=dns_cache_ttl,
+            keepalive_timeout=keepalive_timeout,
+            raw_body=json_codec is not None,
+        )
+        self.close_on_exit = close_on_exit
+        self.singleflight = AsyncSingleFlight() if coalesce_requests else None
+        self.cache = ResponseCache() if cache is True else (None if cache is False else cache)
+        self.validators = ValidatorCache() if conditional_get is True else (None if conditional_get is False else conditional_get)
+        self.rate_limiter = RateLimiter() if rate_limiter is True else (rate_limiter or None)
+        self.circuit_breakers = CircuitBreakerRegistry() if circuit_breaker is True else (circuit_breaker or None)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.hedging = HedgingPolicy() if hedging is True else (hedging or None)
+        self.timeout = Timeout.coerce(timeout)
+        self.deadline = deadline
+        self.codec = get_codec(json_codec) if json_codec is not None else None
+        self.compression = RequestCompression() if compress_requests is True else (compress_requests or None)
+        self.concurrency_limiter = AdaptiveConcurrencyLimiter() if adaptive_concurrency is True else (adaptive_concurrency or None)
+        self._context_depth = 0
             
         logger.info("Initialized AsyncSubModel client")
     
-    def _get_headers(self) -> Dict[str, str]:
-        """Get request headers"""
-        headers = {"Content-Type": "application/json"}
-        if self.token:
-            headers["x-token"] = self.token
-        if self.api_key:
-            headers["x-apikey"] = self.api_key
-        return headers
+    @property
+    def _session(self):
+        """Underlying session of the transport, None until first use"""
+        return getattr(self.transport, "session", None)
+    
+    async def aclose(self) -> None:
+        """Close the transport and release pooled connections"""
+        await self.transport.aclose()
     
-    async def _retry_request(self, method: str, url: str, **kwargs) -> Dict[str, Any]:
+    async def _retry_request(self, method: str, url: str, send: Optional[Callable[..., Any]] = None, **kwargs) -> Any:
         """Make a request with retry mechanism
 
         Args:
             method: HTTP method
             url: Request URL
+            send: Attempt to retry, defaults to a (hedged) decoded request
             **kwargs: Request parameters
             
         Returns:
             API response data
         """
-        headers = self._get_headers()
-        if "headers" in kwargs:
-            headers.update(kwargs.pop("headers"))
+        timeout, deadline = self._call_limits(kwargs)
+        idempotent = self._pop_idempotent(method, kwargs)
+        validator_key = self._validator_key(method, url, kwargs)
+        if send is None:
+            send = self._hedged_attempt if self._is_hedgeable(method, url, kwargs) else self._attempt
+        headers, kwargs = self._prepare_request(method, url, kwargs)
 
-        last_exception = None
-        for attempt in range(self.max_retries + 1):  # Include initial attempt
+        self.retry_policy.record_request()
+        attempt = 0
+        while True:
+            kwargs["timeout"] = self._attempt_timeout(timeout, deadline)
             try:
-                log_request(method, url, headers=headers, **kwargs)
-                
-                async with self._session.request(method, url, headers=headers, **kwargs) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-                    log_response(data)
-                    raise_for_error(data)
-                    return data
+                if deadline is None:
+                    return await send(method, url, headers, validator_key, **kwargs)
+                # Also bounds waiting for the rate and concurrency limiters
+                return await self._before_deadline(send(method, url, headers, validator_key, **kwargs), deadline)
+            except Exception as e:
+                delay = self._retry_delay(attempt, e, idempotent, deadline)
+                if delay is None:
+                    if attempt:
+                        logger.error("Request failed (%s) after %d retries", e, attempt)
+                    raise
+                attempt += 1
+                logger.warning("Request failed (%s), retrying in %.2f seconds (attempt %d/%d)", e, delay, attempt, self.max_retries)
+                await asyncio.sleep(delay)
+    
+    async def _before_deadline(self, attempt: Awaitable[Any], deadline: Deadline) -> Any:
+        """Await an attempt, cancelling it when the deadline passes
+
+        Raises:
+            DeadlineExceededError: If the deadline passed before the attempt finished
+        """
+        task = asyncio.ensure_future(attempt)
+        expired = False
+
+        def expire() -> None:
+            nonlocal expired
+            expired = task.cancel()
+
+        timer = asyncio.get_running_loop().call_later(deadline.remaining(), expire)
+        try:
+            return await task
+        except asyncio.CancelledError:
+            if not expired:
+                raise
+            raise DeadlineExceededError("Deadline exceeded before the response arrived") from None
+        finally:
+            timer.cancel()
 
-            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-                last_exception = e
-                if attempt == self.max_retries:  # Last attempt failed
-                    logger.error(f"Request failed ({str(e)}), max retries ({self.max_retries}) reached")
-                    raise last_exception
-                
-                retry_delay = self.backoff_factor * (2 ** attempt)
-                logger.warning(f"Request failed ({str(e)}), retrying in {retry_delay:.2f} seconds (attempt {attempt + 1}/{self.max_retries})")
-                await asyncio.sleep(retry_delay)
-        
-        if last_exception:
-            raise last_exception
-        return None  # Never reached, but keeps type checker happy
+    async def _hedged_attempt(self, method: str, url: str, headers: Dict[str, str],
+                              validator_key: Optional[Hashable] = None, **kwargs) -> Dict[str, Any]:
+        """Send an attempt, racing a second copy if it is slower than usual"""
+        hedging = self.hedging
+        route = self._route(url)
+        hedging.record_request()
+        delay = hedging.hedge_delay(route)
+        started = time.monotonic()
+        if delay is None:
+            data = await self._attempt(method, url, headers, validator_key, **kwargs)
+            hedging.record_latency(route, time.monotonic() - started)
+            return data
+        
+        primary = asyncio.ensure_future(self._attempt(method, url, headers, validator_key, **kwargs))
+        hedge = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done or not hedging.try_hedge():
+                data = await primary
+                hedging.record_latency(route, time.monotonic() - started)
+                return data
+            
+            logger.debug("Hedging %s %s after %.3f seconds", method, url, delay)
+            hedge = asyncio.ensure_future(self._attempt(method, url, headers, validator_key, **kwargs))
+            pending = {primary, hedge}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        hedging.record_win(task is hedge)
+                        hedging.record_latency(route, time.monotonic() - started)
+                        return task.result()
+            return primary.result()  # Both failed, raise the original error
+        finally:
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
+    
+    async def _attempt(self, method: str, url: str, headers: Dict[str, str],
+                       validator_key: Optional[Hashable] = None, decode: Optional[Callable[[Any], Any]] = None,
+                       **kwargs) -> Dict[str, Any]:
+        """Send a single attempt of a request, decoding the body with ``decode`` if given"""
+        route = self._route(url)
+        self._check_circuit(route)
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(route)
+        snapshot = self.validators.lookup(validator_key) if validator_key is not None else None
+        if snapshot is not None:
+            headers = {**headers, **snapshot[0]}
+        
+        limiter = self.concurrency_limiter
+        if limiter is not None:
+            await limiter.acquire()
+        started = time.monotonic()
+        latency, overloaded = None, False
+        response = None
+        try:
+            response = await self.transport.request(method, url, headers=headers, **kwargs)
+            response.raise_for_status()
+            
+            if snapshot is not None and response.status_code == 304:
+                data = self.validators.revalidated(validator_key, snapshot)
+            else:
+                data = self._handle_response((decode or self._decode)(response))
+                if validator_key is not None:
+                    self._remember_validators(validator_key, response, data)
+        except Exception as e:
+            if response is not None and getattr(e, "headers", None) is None:
+                e.headers = response.headers  # Lets the retry policy see Retry-After
+            latency, overloaded = time.monotonic() - started, self._is_overload(e)
+            self._record_outcome(route, e, response)
+            raise
+        else:
+            latency = time.monotonic() - started
+        finally:
+            if limiter is not None:
+                limiter.release(latency, overloaded)
+        self._record_outcome(route)
+        return data
     
     async def _request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
         """Send HTTP request
@@ -101,12 +290,196 @@ class AsyncSubModelClient:
             ResourceNotFoundError: When requested resource doesn't exist
             QuotaExceededError: When quota is exceeded
         """
-        if not self._session:
-            raise RuntimeError("Client not initialized. Use 'async with' context manager.")
-            
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        self.transport.open()
+        url = self._build_url(endpoint)
+        cache = self.cache
+        if cache is not None and self._is_coalescable(method, url, kwargs):
+            ttl = cache.ttl_for(endpoint)
+            if ttl > 0:
+                key = request_key(method, url, kwargs.get("params"), kwargs.get("headers"))
+                found, data = cache.get(key)
+                if found:
+                    return data
+                generation = cache.generation
+                data = await self._dispatch(method, url, **kwargs)
+                cache.set(key, endpoint, data, ttl, generation)
+                return data
+        try:
+            return await self._dispatch(method, url, **kwargs)
+        finally:
+            self._invalidate_after(method, endpoint)
+    
+    async def _dispatch(self, method: str, url: str, **kwargs) -> Dict[str, Any]:
+        """Send the request, sharing identical in-flight GETs when enabled"""
+        if self.singleflight is not None and self._is_coalescable(method, url, kwargs):
+            key = request_key(method, url, kwargs.get("params"), kwargs.get("headers"))
+            return await self.singleflight.do(key, lambda: self._retry_request(method, url, **kwargs))
         return await self._retry_request(method, url, **kwargs)
     
+    async def _open_stream(self, method: str, url: str, headers: Dict[str, str],
+                           validator_key: Optional[Hashable] = None, **kwargs) -> AsyncStreamedResponse:
+        """Send a single attempt of a streamed request, returning once the headers arrive"""
+        route = self._route(url)
+        self._check_circuit(route)
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(route)
+        
+        response = None
+        try:
+            response = await self.transport.stream(method, url, headers=headers, **kwargs)
+            response.raise_for_status()
+        except Exception as e:
+            if response is not None:
+                await response.aclose()
+                if getattr(e, "headers", None) is None:
+                    e.headers = response.headers
+            self._record_outcome(route, e, response)
+            raise
+        self._record_outcome(route)
+        return response
+    
+    @asynccontextmanager
+    async def stream(self, method: str, endpoint: str, **kwargs) -> AsyncIterator[AsyncStreamedResponse]:
+        """Send a request and read its body as it arrives
+        
+        The body is decompressed chunk by chunk as it is read, so memory use
+        follows the chunk size rather than the size of the response.
+        Retries, deadlines, circuit breakers and the rate limiter apply until
+        the response headers arrive; streamed responses are neither cached
+        nor coalesced, do not count against the adaptive concurrency limit,
+        and API error codes in the body are not checked.
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            **kwargs: Request parameters
+            
+        Example:
+            async with client.stream("GET", "device/list", params={"limit": 10000}) as response:
+                async for chunk in response.iter_bytes():
+                    ...
+        """
+        self.transport.open()
+        response = await self._retry_request(method, self._build_url(endpoint), send=self._open_stream, **kwargs)
+        try:
+            yield response
+        finally:
+            await response.aclose()
+    
+    async def stream_items(self, endpoint: str, path: Sequence[str] = ("data", "items"),
+                           chunk_size: int = 64 * 1024, **kwargs) -> AsyncIterator[Any]:
+        """GET a list and yield its items while the response is still arriving
+        
+        The body is parsed incrementally, so the first item is available
+        after its own bytes have arrived and memory use does not grow with
+        the page size. API error codes are raised once the body has been read.
+        
+        Args:
+            endpoint: API endpoint
+            path: Keys leading from the response envelope to the item array
+            chunk_size: Bytes read from the response at a time
+            **kwargs: Request parameters
+        """
+        parser = JSONItemStream(path)
+        async with self.stream("GET", endpoint, **kwargs) as response:
+            async for chunk in response.iter_bytes(chunk_size):
+                for item in parser.feed(chunk):
+                    yield item
+            for item in parser.close():
+                yield item
+        self._handle_response(parser.envelope)
+    
+    async def paginate(self, endpoint: str, params: Optional[Dict[str, Any]] = None, limit: int = 100,
+                       prefetch: int = 1, first_page: int = 1) -> AsyncIterator[Any]:
+        """Yield the items of every page of a list endpoint
+        
+        The next ``prefetch`` pages are fetched on background tasks while
+        the caller processes the current one.
+        
+        Args:
+            endpoint: API endpoint taking ``page`` and ``limit`` parameters
+            params: Other query parameters
+            limit: Page size
+            prefetch: Pages fetched ahead, 0 to fetch pages only when needed
+            first_page: Page to start at
+        """
+        params = dict(params or {})
+        
+        def fetch(page: int) -> Awaitable[Dict[str, Any]]:
+            return self.get(endpoint, params={**params, "page": page, "limit": limit})
+        
+        async for response in aiter_pages(fetch, limit, first_page, prefetch):
+            for item in page_items(response):
+                yield item
+    
+    async def fetch_all(self, endpoint: str, params: Optional[Dict[str, Any]] = None, limit: Optional[int] = None,
+                        concurrency: int = 8, max_limit: int = 1000) -> List[Any]:
+        """Fetch every item of a list endpoint, fetching pages in parallel
+        
+        The first page reports the total; all remaining pages are then
+        fetched at once, at most ``concurrency`` at a time, and joined in order.
+        
+        Args:
+            endpoint: API endpoint taking ``page`` and ``limit`` parameters
+            params: Other query parameters
+            limit: Page size, None to pick the one with the least wall time
+            concurrency: Pages fetched at the same time
+            max_limit: Largest page size the API serves
+            
+        Returns:
+            Items of every page, in order
+        """
+        params = dict(params or {})
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def fetch(page: int, size: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.get(endpoint, params={**params, "page": page, "limit": size})
+        
+        first_limit = limit or min(FIRST_PAGE_LIMIT, max_limit)
+        plan = PagePlan(await fetch(1, first_limit), first_limit, limit, concurrency, max_limit)
+        if plan.total is None:  # No total to plan with, walk the pages instead
+            items = plan.first_items
+            if len(items) >= first_limit:
+                async for response in aiter_pages(lambda page: fetch(page, first_limit), first_limit, 2, concurrency):
+                    items.extend(page_items(response))
+            return items
+        
+        tasks = [asyncio.ensure_future(fetch(page, plan.limit)) for page in plan.pages]
+        try:
+            return plan.assemble(await asyncio.gather(*tasks))
+        finally:
+            cancel_tasks(tasks)
+    
+    async def get_lazy(self, endpoint: str, path: Sequence[str] = ("data", "items"), **kwargs) -> LazyResponse:
+        """GET a list, decoding its items only when they are accessed
+        
+        The envelope is decoded right away and API error codes are raised as
+        usual; the item array at ``path`` stays undecoded until it is read,
+        see :class:`~submodel.sdk.lazy.LazyResponse`. Retries, deadlines,
+        circuit breakers and the rate limiter apply; lazy responses are
+        neither cached, coalesced nor hedged.
+        
+        Args:
+            endpoint: API endpoint
+            path: Keys leading from the response envelope to the item array
+            **kwargs: Request parameters
+            
+        Example:
+            page = await client.get_lazy("device/list", params={"limit": 10000})
+            total = page["data"]["total"]
+            first = page.array[0]
+        """
+        decode = partial(self._decode_lazy, path=path)
+        
+        async def attempt(method: str, url: str, headers: Dict[str, str],
+                          validator_key: Optional[Hashable] = None, **kwargs) -> LazyResponse:
+            # Undecoded body, or the transport would decode it only to have it re-encoded
+            return await self._attempt(method, url, headers, decode=decode, raw_body=True, **kwargs)
+        
+        self.transport.open()
+        return await self._retry_request("GET", self._build_url(endpoint), send=attempt, **kwargs)
+    
     async def get(self, endpoint: str, **kwargs) -> Dict[str, Any]:
         """Send GET request"""
         return await self._request("GET", endpoint, **kwargs)
@@ -117,32 +490,56 @@ class AsyncSubModelClient:
     
     async def __aenter__(self):
         """Enter async context"""
-        if not self._session:
-            self._session = aiohttp.ClientSession()
+        self.transport.open()
+        self._context_depth += 1
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Exit async context"""
-        if self._session:
-            await self._session.close()
-            self._session = None
+        self._context_depth = max(self._context_depth - 1, 0)
+        if self._context_depth == 0 and self.close_on_exit:
+            await self.aclose()
 
     @property
     def auth(self):
         """Get authentication management instance"""
-        from .auth import Auth
+        from .auth import AsyncAuth
         if not hasattr(self, '_auth'):
-            self._auth = Auth(self)
+            self._auth = AsyncAuth(self)
         return self._auth
 
     @property
     def instance(self):
         """Get instance management instance"""
-        from .instance import Instance
+        from .instance import AsyncInstance
         if not hasattr(self, '_instance'):
-            self._instance = Instance(self)
+            self._instance = AsyncInstance(self)
         return self._instance
 
+    @property
+    def device(self):
+        """Get device management instance"""
+        from .device import AsyncDevice
+        if not hasattr(self, '_device'):
+            self._device = AsyncDevice(self)
+        return self._device
+
+    @property
+    def area(self):
+        """Get area management instance"""
+        from .device import AsyncArea
+        if not hasattr(self, '_area'):
+            self._area = AsyncArea(self)
+        return self._area
+
+    @property
+    def baremetal(self):
+        """Get baremetal management instance"""
+        from .device import AsyncBaremetal
+        if not hasattr(self, '_baremetal'):
+            self._baremetal = AsyncBaremetal(self)
+        return self._baremetal
+
 def create_async_client(token: Optional[str] = None, 
                        api_key: Optional[str] = None, 
                        **kwargs) -> AsyncSubModelClient:
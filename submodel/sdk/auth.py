@@ -69,4 +69,53 @@ class Auth:
             key: API Key
             active: Whether to activate
         """
-        return self.client.get(f"user/active_api_key/{key}/{str(active).lower()}")
\ No newline at end of file
+        return self.client.get(f"user/active_api_key/{key}/{str(active).lower()}")
+
+class AsyncAuth:
+    """Authentication management on the asynchronous client"""
+    
+    def __init__(self, client):
+        """Initialize AsyncAuth manager
+        
+        Args:
+            client: Asynchronous SubModel client instance
+        """
+        self.client = client
+    
+    async def register(self, username: str, password: str) -> Dict[str, Any]:
+        """Register account"""
+        return await self.client.post("user/reg", json={
+            "username": username,
+            "password": password
+        })
+    
+    async def login(self, username: str, password: str) -> Dict[str, Any]:
+        """Login account"""
+        return await self.client.post("user/login", json={
+            "username": username,
+            "password": password
+        })
+    
+    async def logout(self) -> Dict[str, Any]:
+        """Logout account"""
+        return await self.client.get("user/logout")
+    
+    async def get_user_info(self) -> Dict[str, Any]:
+        """Get user information"""
+        return await self.client.get("user/info")
+    
+    async def generate_api_key(self) -> Dict[str, Any]:
+        """Generate API Key"""
+        return await self.client.get("user/generate_api_key")
+    
+    async def list_api_keys(self) -> Dict[str, Any]:
+        """Get API Key list"""
+        return await self.client.get("user/list_api_key")
+    
+    async def remove_api_key(self, key: str) -> Dict[str, Any]:
+        """Delete API Key"""
+        return await self.client.get(f"user/remove_api_key/{key}")
+    
+    async def active_api_key(self, key: str, active: bool) -> Dict[str, Any]:
+        """Activate/deactivate API Key"""
+        return await self.client.get(f"user/active_api_key/{key}/{str(active).lower()}")
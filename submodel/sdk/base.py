@@ -0,0 +1,257 @@
+"""Behaviour shared by the sync and async SubModel clients"""
+
+import json
+import logging
+from typing import Dict, Any, Hashable, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+from .cache import ResponseCache
+from .codec import JSONCodec
+from .compression import RequestCompression
+from .exceptions import DeadlineExceededError, RateLimitError, ServerError, raise_for_error
+from .lazy import LazyResponse
+from .retries import IDEMPOTENT_METHODS
+from .singleflight import request_key
+from .timeouts import DEFAULT_TIMEOUT, Deadline, Timeout
+from .transport import TransportResponse
+from .utils import get_error_headers, get_http_status, log_request, log_response, logger, parse_retry_after
+
+DEFAULT_BASE_URL = "https://api.submodel.ai/api/v1"
+
+#: Most detail responses kept for the ``get_many`` lookups
+LOOKUP_CACHE_SIZE = 4096
+
+class BaseClient:
+    """Base class holding credentials, header building and response checks"""
+
+    def __init__(self,
+                 token: Optional[str] = None,
+                 api_key: Optional[str] = None,
+                 max_retries: int = 3,
+                 backoff_factor: float = 0.5):
+        """Initialize the client
+
+        Args:
+            token: Access token
+            api_key: API key
+            max_retries: Maximum number of retries
+            backoff_factor: Retry backoff factor
+        """
+        self.base_url = DEFAULT_BASE_URL
+        self.token = token
+        self.api_key = api_key
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.validators = None
+        self.rate_limiter = None
+        self.circuit_breakers = None
+        self.retry_policy = None
+        self.hedging = None
+        self.timeout = DEFAULT_TIMEOUT
+        self.deadline = None
+        self.codec: Optional[JSONCodec] = None
+        self.compression: Optional[RequestCompression] = None
+        self.cache: Optional[ResponseCache] = None
+        # Short-lived detail responses of get_many lookups, TTLs set per call
+        self.lookup_cache = ResponseCache(ttls={}, maxsize=LOOKUP_CACHE_SIZE)
+
+        if not (token or api_key):
+            raise ValueError("Either token or api_key must be provided")
+
+    def _get_headers(self) -> Dict[str, str]:
+        """Get request headers"""
+        headers = {"Content-Type": "application/json"}
+        if self.token:
+            headers["x-token"] = self.token
+        if self.api_key:
+            headers["x-apikey"] = self.api_key
+        accept_encoding = getattr(self.transport, "accept_encoding", None)
+        if accept_encoding:
+            headers["Accept-Encoding"] = accept_encoding
+        return headers
+
+    def _build_url(self, endpoint: str) -> str:
+        """Join an API endpoint onto the base URL"""
+        return f"{self.base_url}/{endpoint.lstrip('/')}"
+
+    def _invalidate_after(self, method: str, endpoint: str) -> None:
+        """Drop the cached responses a call may have made stale"""
+        if not ResponseCache.is_mutation(method, endpoint):
+            return
+        for cache in (self.cache, self.lookup_cache):
+            if cache is not None:
+                cache.invalidate_after(endpoint)
+
+    def _route(self, url: str) -> str:
+        """Get the API endpoint path of a request URL"""
+        if url.startswith(self.base_url):
+            return url[len(self.base_url):].split("?", 1)[0].strip("/")
+        return urlsplit(url).path.strip("/")
+
+    def _record_outcome(self, route: str, error: Optional[BaseException] = None,
+                        response: Any = None) -> None:
+        """Feed the outcome of a request attempt back into the throttling state
+
+        Args:
+            route: API endpoint path of the request
+            error: Exception the attempt raised, None on success
+            response: Response received before the error, if any
+        """
+        if self.circuit_breakers is not None:
+            breaker = self.circuit_breakers.get(route)
+            if error is not None and self._is_server_failure(error):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+        if self.rate_limiter is None:
+            return
+        if error is None:
+            self.rate_limiter.record_success(route)
+        elif isinstance(error, RateLimitError) or get_http_status(error) == 429:
+            headers = get_error_headers(error) or getattr(response, "headers", None)
+            self.rate_limiter.penalize(route, parse_retry_after(headers))
+
+    def _call_limits(self, kwargs: Dict[str, Any]) -> Tuple[Optional[Timeout], Optional[Deadline]]:
+        """Pop the timeout and deadline of a call, defaulting to the client's"""
+        timeout = Timeout.coerce(kwargs.pop("timeout", self.timeout))
+        deadline = Deadline.coerce(kwargs.pop("deadline", self.deadline))
+        return timeout, deadline
+
+    def _attempt_timeout(self, timeout: Optional[Timeout], deadline: Optional[Deadline]) -> Optional[Timeout]:
+        """Get the timeout of the next attempt, clipped to the deadline
+
+        Raises:
+            DeadlineExceededError: If the deadline has already passed
+        """
+        if deadline is None:
+            return timeout
+        remaining = deadline.remaining()
+        if remaining <= 0:
+            raise DeadlineExceededError("Deadline exceeded before the request could be sent")
+        return timeout.clip(remaining) if timeout is not None else Timeout(total=remaining)
+
+    @staticmethod
+    def _pop_idempotent(method: str, kwargs: Dict[str, Any]) -> bool:
+        """Pop the ``idempotent`` flag of a call, defaulting to what its HTTP method implies
+
+        Callers set it for POSTs that can safely be sent twice, such as
+        setting an instance state.
+        """
+        idempotent = kwargs.pop("idempotent", None)
+        return method.upper() in IDEMPOTENT_METHODS if idempotent is None else idempotent
+
+    def _retry_delay(self, attempt: int, error: BaseException, idempotent: bool = True,
+                     deadline: Optional[Deadline] = None) -> Optional[float]:
+        """Get the delay before retrying a failed attempt, None to give up
+
+        Non-idempotent requests are only retried when they cannot have been
+        processed, see :class:`RetryPolicy`.
+        """
+        delay = self.retry_policy.next_delay(
+            attempt, error, self.transport.network_errors, self.max_retries, self.backoff_factor,
+            idempotent=idempotent,
+            connect_errors=self.transport.connect_errors)
+        if delay is not None and deadline is not None and delay >= deadline.remaining():
+            return None  # The retry could not finish before the deadline
+        return delay
+
+    def _check_circuit(self, route: str) -> None:
+        """Fail fast if the circuit breaker of a route is open
+
+        Raises:
+            CircuitOpenError: If the route's circuit is open
+        """
+        if self.circuit_breakers is not None:
+            self.circuit_breakers.get(route).allow()
+
+    def _is_server_failure(self, error: BaseException) -> bool:
+        """Whether an error is a server error, timeout or connection failure"""
+        if isinstance(error, ServerError):
+            return True
+        status = get_http_status(error)
+        if status is not None:
+            return status >= 500
+        return isinstance(error, self.transport.network_errors)
+
+    def _is_overload(self, error: BaseException) -> bool:
+        """Whether an error signals an overloaded or unreachable server"""
+        return (isinstance(error, RateLimitError) or get_http_status(error) == 429
+                or self._is_server_failure(error))
+
+    def _is_coalescable(self, method: str, url: str, kwargs: Dict[str, Any]) -> bool:
+        """Whether a request is a GET of a read endpoint without a body
+
+        Only these may be shared, cached, revalidated or hedged.
+        """
+        return (method.upper() == "GET" and not any(k in kwargs for k in ("json", "data"))
+                and not ResponseCache.is_mutation(method, self._route(url)))
+
+    def _is_hedgeable(self, method: str, url: str, kwargs: Dict[str, Any]) -> bool:
+        """Whether a request may be hedged: a GET of a read endpoint"""
+        return self.hedging is not None and self._is_coalescable(method, url, kwargs)
+
+    def _validator_key(self, method: str, url: str, kwargs: Dict[str, Any]) -> Optional[Hashable]:
+        """Key of a request that is sent conditionally, None if it is not"""
+        if self.validators is None or not self._is_coalescable(method, url, kwargs):
+            return None
+        return request_key(method, url, kwargs.get("params"), kwargs.get("headers"))
+
+    def _remember_validators(self, key: Hashable, response: Any, data: Dict[str, Any]) -> None:
+        """Store the validators of a successful response"""
+        headers = response.headers
+        self.validators.store(key, headers, data, int(headers.get("Content-Length") or 0))
+
+    def _prepare_request(self, method: str, url: str, kwargs: Dict[str, Any]) -> Tuple[Dict[str, str], Dict[str, Any]]:
+        """Merge headers and log the outgoing request
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            kwargs: Request parameters, may contain extra ``headers``
+
+        Returns:
+            Tuple of merged headers and the remaining request parameters
+        """
+        kwargs = dict(kwargs)
+        headers = self._get_headers()
+        if "headers" in kwargs:
+            headers.update(kwargs.pop("headers"))
+        if logger.isEnabledFor(logging.DEBUG):
+            log_request(method, url, headers=headers, **kwargs)
+        if self.codec is not None and "json" in kwargs:
+            kwargs["data"] = self.codec.dumps(kwargs.pop("json"))
+        if self.compression is not None:
+            self._compress_body(headers, kwargs)
+        return headers, kwargs
+
+    def _compress_body(self, headers: Dict[str, str], kwargs: Dict[str, Any]) -> None:
+        """Compress a request body of at least the compression threshold"""
+        if kwargs.get("json") is not None:
+            payload = json.dumps(kwargs["json"]).encode("utf-8")
+        elif isinstance(kwargs.get("data"), (bytes, bytearray)):
+            payload = kwargs["data"]
+        else:
+            return
+        if len(payload) < self.compression.threshold:
+            return
+        kwargs.pop("json", None)
+        kwargs["data"] = self.compression.body(payload)
+        headers["Content-Encoding"] = self.compression.encoding
+
+    def _decode(self, response: Any) -> Any:
+        """Decode a JSON response body with the client's codec"""
+        if self.codec is None:
+            return response.json()
+        if isinstance(response, TransportResponse):
+            return response.json(self.codec.loads)
+        return self.codec.loads(response.content)
+
+    @staticmethod
+    def _decode_lazy(response: Any, path: Sequence[str] = ("data", "items")) -> LazyResponse:
+        """Wrap a JSON response body in a lazy view of the item array at ``path``"""
+        return LazyResponse(response.content, tuple(path))
+
+    def _handle_response(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Log the decoded response and raise for API error codes"""
+        log_response(data)
+        raise_for_error(data)
+        return data
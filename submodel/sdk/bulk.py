@@ -0,0 +1,227 @@
+"""
+Bulk Calls
+~~~~~~~~~
+
+Runs one API call per ID with bounded concurrency and collects the outcome
+of every ID instead of stopping at the first failure.
+
+Each call goes through the client's normal request pipeline, so every ID is
+retried on its own under the client's retry policy, rate limiter and circuit
+breakers. The retry policy only resends a non-idempotent call (a POST not
+flagged ``idempotent=True``) when it cannot have been processed. IDs are deduplicated, keeping their first position. Sync bulk
+calls run on a thread pool, async ones on tasks.
+
+Progress is reported after each ID to a ``progress(done, total)`` callback,
+or on a ``tqdm`` progress bar when ``progress=True``.
+
+``lookup_many`` fetches detail endpoints the same way, first serving IDs
+looked up within the last ``cache_ttl`` seconds from the client's
+``lookup_cache``. Mutating calls through the client invalidate that cache
+like the response cache.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Tuple, Union
+
+from .pagination import cancel_tasks, shutdown_executor
+from .singleflight import request_key
+
+#: Seconds a detail response looked up by ``lookup_many`` is reused by default
+LOOKUP_TTL = 5.0
+
+ProgressCallback = Callable[[int, int], None]
+Progress = Union[ProgressCallback, bool, None]
+
+class BulkResult:
+    """Per-ID outcome of a bulk call
+
+    Attributes:
+        results: Response of every ID that succeeded, in request order
+        errors: Exception of every ID that failed after its retries, in
+            request order
+    """
+
+    def __init__(self, results: Dict[Hashable, Any], errors: Dict[Hashable, BaseException]):
+        self.results = results
+        self.errors = errors
+
+    @property
+    def ok(self) -> bool:
+        """Whether every ID succeeded"""
+        return not self.errors
+
+    def __len__(self) -> int:
+        return len(self.results) + len(self.errors)
+
+    def __repr__(self) -> str:
+        return f"BulkResult(succeeded={len(self.results)}, failed={len(self.errors)})"
+
+class _ProgressReport:
+    """Progress of a bulk call, reported to a callback or a tqdm bar"""
+
+    def __init__(self, progress: Progress, total: int, desc: Optional[str]):
+        self.total = total
+        self.done = 0
+        self.callback = progress if callable(progress) else None
+        self.bar = None
+        if progress is True:
+            from tqdm.auto import tqdm
+            self.bar = tqdm(total=total, desc=desc, unit="item")
+
+    def advance(self) -> None:
+        self.done += 1
+        if self.bar is not None:
+            self.bar.update(1)
+        if self.callback is not None:
+            self.callback(self.done, self.total)
+
+    def close(self) -> None:
+        if self.bar is not None:
+            self.bar.close()
+
+def unique_ids(ids: Iterable[Hashable]) -> List[Hashable]:
+    """Get the IDs without duplicates, in order of first appearance"""
+    return list(dict.fromkeys(ids))
+
+def _ordered(keys: List[Hashable], results: Dict[Hashable, Any], errors: Dict[Hashable, BaseException]) -> BulkResult:
+    return BulkResult({key: results[key] for key in keys if key in results},
+                      {key: errors[key] for key in keys if key in errors})
+
+def run_many(call: Callable[[Hashable], Any],
+             ids: Iterable[Hashable],
+             concurrency: int = 8,
+             progress: Progress = None,
+             desc: Optional[str] = None) -> BulkResult:
+    """Call ``call(id)`` for every ID on a thread pool
+
+    Args:
+        call: Callable making the API call for one ID
+        ids: IDs to call it for
+        concurrency: Calls in flight at the same time
+        progress: ``progress(done, total)`` callback, or True for a tqdm bar
+        desc: Label of the tqdm bar
+    """
+    keys = unique_ids(ids)
+    results: Dict[Hashable, Any] = {}
+    errors: Dict[Hashable, BaseException] = {}
+    report = _ProgressReport(progress, len(keys), desc)
+    executor = ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(keys) or 1)), thread_name_prefix="submodel-bulk")
+    futures: Dict[Any, Hashable] = {}
+    try:
+        futures = {executor.submit(call, key): key for key in keys}
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                results[key] = future.result()
+            except Exception as e:
+                errors[key] = e
+            report.advance()
+    finally:
+        shutdown_executor(executor, futures)
+        report.close()
+    return _ordered(keys, results, errors)
+
+async def arun_many(call: Callable[[Hashable], Awaitable[Any]],
+                    ids: Iterable[Hashable],
+                    concurrency: int = 8,
+                    progress: Progress = None,
+                    desc: Optional[str] = None) -> BulkResult:
+    """Await ``call(id)`` for every ID on tasks, at most ``concurrency`` at a time
+
+    Args:
+        call: Coroutine function making the API call for one ID
+        ids: IDs to call it for
+        concurrency: Calls in flight at the same time
+        progress: ``progress(done, total)`` callback, or True for a tqdm bar
+        desc: Label of the tqdm bar
+    """
+    keys = unique_ids(ids)
+    results: Dict[Hashable, Any] = {}
+    errors: Dict[Hashable, BaseException] = {}
+    report = _ProgressReport(progress, len(keys), desc)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def one(key: Hashable) -> None:
+        async with semaphore:
+            try:
+                results[key] = await call(key)
+            except Exception as e:
+                errors[key] = e
+        report.advance()
+
+    tasks = [asyncio.ensure_future(one(key)) for key in keys]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        cancel_tasks(tasks)
+        report.close()
+    return _ordered(keys, results, errors)
+
+def _cached_lookups(client: Any, endpoint: Callable[[Hashable], str], keys: List[Hashable],
+                    cache_ttl: float) -> Tuple[Dict[Hashable, Any], List[Hashable]]:
+    """Split IDs into fresh cached responses and IDs still to fetch"""
+    if cache_ttl <= 0:
+        return {}, keys
+    hits, misses = {}, []
+    for key in keys:
+        found, data = client.lookup_cache.get(request_key("GET", client._build_url(endpoint(key))))
+        if found:
+            hits[key] = data
+        else:
+            misses.append(key)
+    return hits, misses
+
+def _remember(client: Any, path: str, data: Any, cache_ttl: float, generation: int) -> None:
+    if cache_ttl > 0:
+        client.lookup_cache.set(request_key("GET", client._build_url(path)), path, data, cache_ttl, generation)
+
+def lookup_many(client: Any,
+                endpoint: Callable[[Hashable], str],
+                ids: Iterable[Hashable],
+                concurrency: int = 8,
+                cache_ttl: float = LOOKUP_TTL,
+                progress: Progress = None) -> BulkResult:
+    """GET a detail endpoint for every ID on a thread pool
+
+    Args:
+        client: Sync client to send the requests with
+        endpoint: Callable building the endpoint of an ID
+        ids: IDs to look up
+        concurrency: Requests in flight at the same time
+        cache_ttl: Seconds a response is reused for, 0 to always fetch
+        progress: ``progress(done, total)`` callback over the IDs not
+            served from the cache, or True for a tqdm bar
+    """
+    keys = unique_ids(ids)
+    hits, misses = _cached_lookups(client, endpoint, keys, cache_ttl)
+
+    def fetch(key: Hashable) -> Any:
+        path = endpoint(key)
+        generation = client.lookup_cache.generation
+        data = client.get(path)
+        _remember(client, path, data, cache_ttl, generation)
+        return data
+
+    fetched = run_many(fetch, misses, concurrency, progress)
+    return _ordered(keys, {**hits, **fetched.results}, fetched.errors)
+
+async def alookup_many(client: Any,
+                       endpoint: Callable[[Hashable], str],
+                       ids: Iterable[Hashable],
+                       concurrency: int = 8,
+                       cache_ttl: float = LOOKUP_TTL,
+                       progress: Progress = None) -> BulkResult:
+    """GET a detail endpoint for every ID on tasks, see :func:`lookup_many`"""
+    keys = unique_ids(ids)
+    hits, misses = _cached_lookups(client, endpoint, keys, cache_ttl)
+
+    async def fetch(key: Hashable) -> Any:
+        path = endpoint(key)
+        generation = client.lookup_cache.generation
+        data = await client.get(path)
+        _remember(client, path, data, cache_ttl, generation)
+        return data
+
+    fetched = await arun_many(fetch, misses, concurrency, progress)
+    return _ordered(keys, {**hits, **fetched.results}, fetched.errors)
@@ -0,0 +1,268 @@
+"""
+Response Cache
+~~~~~~~~~~~~~
+
+Size-bounded LRU cache with per-endpoint TTLs for slow-changing read
+endpoints, invalidated explicitly or automatically after mutating calls,
+and a validator store for conditional GETs (``ETag`` / ``Last-Modified``).
+
+Endpoints are matched with shell-style patterns against the API path
+relative to the base URL, e.g. ``"area/detail/*"`` or ``"sl/*/models"``.
+Cached responses are shared between callers and must be treated as
+read-only.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+#: TTLs (seconds) of the read endpoints cached by default
+DEFAULT_CACHE_TTLS: Dict[str, float] = {
+    "area/list": 300.0,
+    "area/detail/*": 300.0,
+    "baremetal/list": 60.0,
+    "sl/*/models": 300.0,
+    "sl/*/models/*": 300.0,
+}
+
+#: GET endpoints that only read server state; every other call counts as a
+#: mutation, so GET endpoints added to the API are not cached, coalesced or
+#: hedged until they are listed here
+READ_GET_PATTERNS: Tuple[str, ...] = (
+    "*/list",
+    "*/detail/*",
+    "user/info",
+    "user/list_api_key",
+    "inst/cont/*",
+    "inst/*/pod/*/logs",
+    "sl/*/status/*",
+    "sl/*/health",
+    "sl/*/metrics",
+    "sl/*/_requests",
+    "sl/*/_requests/*",
+    "sl/*/models",
+    "sl/*/models/*",
+)
+
+#: Cached endpoints affected by mutations of each resource family
+INVALIDATION_RULES: Dict[str, Tuple[str, ...]] = {
+    "inst": ("inst/*", "baremetal/*"),
+    "device": ("device/*", "area/*", "baremetal/*"),
+}
+
+class ResponseCache:
+    """Thread-safe TTL/LRU cache of parsed API responses
+
+    Args:
+        ttls: Mapping of endpoint patterns to TTLs in seconds. Endpoints
+            matching no pattern are not cached. Defaults to DEFAULT_CACHE_TTLS.
+        maxsize: Maximum number of cached responses
+        invalidation_rules: Mapping of the first path segment of a mutating
+            call to the endpoint patterns it invalidates. Families without a
+            rule invalidate ``"<family>/*"``.
+    """
+
+    def __init__(self,
+                 ttls: Optional[Dict[str, float]] = None,
+                 maxsize: int = 1024,
+                 invalidation_rules: Optional[Dict[str, Tuple[str, ...]]] = None):
+        self.ttls = dict(DEFAULT_CACHE_TTLS if ttls is None else ttls)
+        self.maxsize = maxsize
+        self.invalidation_rules = dict(INVALIDATION_RULES if invalidation_rules is None else invalidation_rules)
+        self._entries: "OrderedDict[Hashable, Tuple[float, str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Get the TTL of an endpoint, 0 when it is not cacheable"""
+        endpoint = endpoint.strip("/")
+        for pattern, ttl in self.ttls.items():
+            if fnmatchcase(endpoint, pattern):
+                return ttl
+        return 0.0
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Look up a response
+
+        Returns:
+            Tuple of whether a fresh entry was found and its value
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, entry[2]
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def set(self, key: Hashable, endpoint: str, value: Any, ttl: float,
+            generation: Optional[int] = None) -> None:
+        """Store a response
+
+        Args:
+            key: Request key
+            endpoint: API endpoint the response belongs to
+            value: Parsed response
+            ttl: Time to live in seconds
+            generation: Cache generation read before the request was sent.
+                The value is dropped if an invalidation happened since.
+        """
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[key] = (time.monotonic() + ttl, endpoint.strip("/"), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, patterns: Optional[Iterable[str]] = None) -> int:
+        """Drop cached responses
+
+        Args:
+            patterns: Endpoint patterns to drop, None to clear the cache
+
+        Returns:
+            Number of dropped entries
+        """
+        with self._lock:
+            self.generation += 1
+            if patterns is None:
+                count = len(self._entries)
+                self._entries.clear()
+            else:
+                if isinstance(patterns, str):
+                    patterns = (patterns,)
+                patterns = tuple(patterns)
+                stale = [key for key, (_, endpoint, _) in self._entries.items()
+                         if any(fnmatchcase(endpoint, p) for p in patterns)]
+                for key in stale:
+                    del self._entries[key]
+                count = len(stale)
+            self.invalidations += count
+            return count
+
+    @staticmethod
+    def is_mutation(method: str, endpoint: str) -> bool:
+        """Whether a call may change server state: anything but a GET of a known read endpoint"""
+        if method.upper() != "GET":
+            return True
+        endpoint = endpoint.strip("/")
+        return not any(fnmatchcase(endpoint, p) for p in READ_GET_PATTERNS)
+
+    def invalidate_after(self, endpoint: str) -> int:
+        """Drop the cached responses affected by a mutating call"""
+        family = endpoint.strip("/").split("/", 1)[0]
+        return self.invalidate(self.invalidation_rules.get(family, (f"{family}/*",)))
+
+    def stats(self) -> Dict[str, int]:
+        """Get hit, miss, eviction and invalidation counts"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "size": len(self._entries),
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+class ValidatorCache:
+    """LRU store of HTTP validators and parsed bodies for conditional GETs
+
+    Remembers the ``ETag`` and ``Last-Modified`` validators of successful
+    GET responses so the next request for the same URL can be sent with
+    ``If-None-Match`` / ``If-Modified-Since``. On ``304 Not Modified`` the
+    remembered parsed body is returned without downloading or parsing it.
+
+    Args:
+        maxsize: Maximum number of remembered responses
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[Optional[str], Optional[str], int, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.not_modified = 0
+        self.modified = 0
+        self.bytes_saved = 0
+
+    def lookup(self, key: Hashable) -> Optional[Tuple[Dict[str, str], Any, int]]:
+        """Get the conditional headers to send for a request
+
+        Returns:
+            None if nothing is remembered for the request, otherwise a
+            snapshot of the conditional headers, the remembered parsed body
+            and its size. Pass the snapshot to :meth:`revalidated` on 304.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+        etag, last_modified, size, data = entry
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers, data, size
+
+    def store(self, key: Hashable, headers: Any, data: Any, size: int = 0) -> None:
+        """Remember the validators and parsed body of a 200 response
+
+        Args:
+            key: Request key
+            headers: Response headers
+            data: Parsed response body
+            size: Size of the response body in bytes, as reported by
+                ``Content-Length``
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        with self._lock:
+            if not (etag or last_modified):
+                self._entries.pop(key, None)
+                return
+            self.modified += 1
+            self._entries[key] = (etag, last_modified, size, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def revalidated(self, key: Hashable, snapshot: Tuple[Dict[str, str], Any, int]) -> Any:
+        """Record a 304 response and get the remembered body
+
+        Args:
+            key: Request key
+            snapshot: Value returned by :meth:`lookup` for the request
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self.not_modified += 1
+            self.bytes_saved += snapshot[2]
+        return snapshot[1]
+
+    def stats(self) -> Dict[str, int]:
+        """Get 304/200 counts and the response bytes not downloaded"""
+        with self._lock:
+            return {
+                "not_modified": self.not_modified,
+                "modified": self.modified,
+                "bytes_saved": self.bytes_saved,
+                "size": len(self._entries),
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
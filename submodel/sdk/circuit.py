@@ -0,0 +1,170 @@
+"""
+Circuit Breakers
+~~~~~~~~~~~~~~~
+
+Per-route circuit breakers that stop sending requests to an endpoint route
+that keeps failing with server errors or timeouts, so callers fail fast
+with :class:`CircuitOpenError` instead of walking the whole retry ladder.
+
+States:
+    - closed: requests flow, consecutive failures are counted
+    - open: requests fail fast until ``recovery_timeout`` has passed
+    - half_open: a limited number of probe requests decide whether the
+      route closes again (probe succeeds) or reopens (probe fails)
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from .exceptions import CircuitOpenError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+def default_route_key(endpoint: str) -> str:
+    """Group an API endpoint into the route its breaker is scoped to
+
+    Endpoints are grouped by operation with their IDs replaced by ``*``
+    (``sl/*/runsync``, ``inst/*/pod``), everything else by its first two
+    path segments (``inst/detail``, ``device/action``), so the number of
+    routes does not grow with the number of instances.
+    """
+    parts = endpoint.strip("/").split("/")
+    if parts[0] == "sl" and len(parts) > 2:
+        return f"sl/*/{parts[2]}"
+    if parts[0] == "inst" and len(parts) > 2 and parts[2] == "pod":
+        return "inst/*/pod"
+    return "/".join(parts[:2])
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker for a single route
+
+    Args:
+        route: Route the breaker protects
+        failure_threshold: Consecutive failures that open the circuit
+        recovery_timeout: Seconds the circuit stays open before probing
+        half_open_max_calls: Probe requests allowed while half-open
+    """
+
+    def __init__(self,
+                 route: str,
+                 failure_threshold: int = 5,
+                 recovery_timeout: float = 30.0,
+                 half_open_max_calls: int = 1):
+        self.route = route
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_started = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state, moving from open to half-open once the timeout passed"""
+        with self._lock:
+            return self._current_state(time.monotonic())
+
+    def _current_state(self, now: float) -> str:
+        if self._state == OPEN and now - self._opened_at >= self.recovery_timeout:
+            self._state = HALF_OPEN
+            self._probes = 0
+        return self._state
+
+    def allow(self) -> None:
+        """Check a request may be sent
+
+        Raises:
+            CircuitOpenError: While the circuit is open, or half-open with
+                all probe slots taken
+        """
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+            if state == CLOSED:
+                return
+            if state == HALF_OPEN:
+                # Probes that never reported back (e.g. cancelled) expire
+                if self._probes < self.half_open_max_calls or now - self._probe_started >= self.recovery_timeout:
+                    if self._probes >= self.half_open_max_calls:
+                        self._probes = 0
+                    self._probes += 1
+                    self._probe_started = now
+                    return
+                retry_after = self.recovery_timeout - (now - self._probe_started)
+            else:
+                retry_after = self.recovery_timeout - (now - self._opened_at)
+        raise CircuitOpenError(
+            f"Circuit open for route '{self.route}', retry in {retry_after:.1f} seconds",
+            self.route,
+            retry_after,
+        )
+
+    def record_success(self) -> None:
+        """Record a request the server handled"""
+        with self._lock:
+            self._failures = 0
+            self._probes = 0
+            self._state = CLOSED
+
+    def record_failure(self) -> None:
+        """Record a server error, timeout or connection failure"""
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self._probes = 0
+
+    def reset(self) -> None:
+        """Close the circuit and forget past failures"""
+        self.record_success()
+
+class CircuitBreakerRegistry:
+    """Circuit breakers created on demand, one per route
+
+    Args:
+        failure_threshold: Consecutive failures that open a circuit
+        recovery_timeout: Seconds a circuit stays open before probing
+        half_open_max_calls: Probe requests allowed while half-open
+        route_key: Callable grouping an endpoint into its route, defaults
+            to :func:`default_route_key`
+    """
+
+    def __init__(self,
+                 failure_threshold: int = 5,
+                 recovery_timeout: float = 30.0,
+                 half_open_max_calls: int = 1,
+                 route_key: Optional[Callable[[str], str]] = None):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.route_key = route_key or default_route_key
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, endpoint: str) -> CircuitBreaker:
+        """Get the breaker protecting an endpoint"""
+        route = self.route_key(endpoint)
+        breaker = self._breakers.get(route)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(route)
+                if breaker is None:
+                    breaker = self._breakers[route] = CircuitBreaker(
+                        route, self.failure_threshold, self.recovery_timeout, self.half_open_max_calls)
+        return breaker
+
+    def states(self) -> Dict[str, str]:
+        """Get the state of every route seen so far"""
+        return {route: breaker.state for route, breaker in list(self._breakers.items())}
+
+    def reset(self) -> None:
+        """Close every circuit"""
+        for breaker in list(self._breakers.values()):
+            breaker.reset()
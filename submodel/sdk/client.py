@@ -1,18 +1,52 @@
 """SubModel API Client"""
 
+import threading
+import time
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import partial
 import requests
-from typing import Dict, Any, Optional
-from .exceptions import raise_for_error
-from .utils import log_request, log_response, logger, retry
+from typing import Dict, Any, Callable, Hashable, Iterator, List, Optional, Sequence, Union
+from .base import BaseClient
+from .cache import ResponseCache, ValidatorCache
+from .circuit import CircuitBreakerRegistry
+from .codec import JSONCodec, get_codec
+from .compression import RequestCompression
+from .hedging import HedgingPolicy
+from .jsonstream import JSONItemStream
+from .lazy import LazyResponse
+from .pagination import FIRST_PAGE_LIMIT, PagePlan, iter_pages, page_items, shutdown_executor
+from .ratelimit import RateLimiter
+from .retries import RetryPolicy
+from .singleflight import SingleFlight, request_key
+from .timeouts import DEFAULT_TIMEOUT, Timeout
+from .transport import RequestsTransport, StreamedResponse, Transport, create_session
+from .utils import logger
 
-class SubModelClient:
+class SubModelClient(BaseClient):
     """SubModel API Client"""
     
     def __init__(self, 
                  token: Optional[str] = None, 
                  api_key: Optional[str] = None,
                  max_retries: int = 3,
-                 backoff_factor: float = 0.5):
+                 backoff_factor: float = 0.5,
+                 session: Optional[requests.Session] = None,
+                 pool_connections: int = 10,
+                 pool_maxsize: int = 10,
+                 pool_block: bool = False,
+                 transport: Optional[Transport] = None,
+                 coalesce_requests: bool = False,
+                 cache: Union[ResponseCache, bool, None] = None,
+                 conditional_get: Union[ValidatorCache, bool, None] = None,
+                 rate_limiter: Union[RateLimiter, bool, None] = None,
+                 circuit_breaker: Union[CircuitBreakerRegistry, bool, None] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 hedging: Union[HedgingPolicy, bool, None] = None,
+                 timeout: Union[Timeout, float, None] = DEFAULT_TIMEOUT,
+                 deadline: Optional[float] = None,
+                 json_codec: Union[str, JSONCodec, None] = None,
+                 compress_requests: Union[RequestCompression, bool, None] = None):
         """Initialize the client
         
         Args:
@@ -20,28 +54,81 @@ class SubModelClient:
             api_key: API key
             max_retries: Maximum number of retries
             backoff_factor: Retry backoff factor
+            session: Shared session to send requests with. The client does
+                not close a session it was given.
+            pool_connections: Number of host pools of the client-owned session
+            pool_maxsize: Maximum keep-alive connections per host of the
+                client-owned session
+            pool_block: Whether the client-owned pool blocks when exhausted
+            transport: Transport to send requests through. Defaults to a
+                RequestsTransport built from the session and pool options.
+            coalesce_requests: Share one in-flight GET between threads asking
+                for the same URL and parameters at the same time
+            cache: Response cache for slow-changing read endpoints, or True
+                to use a ResponseCache with the default TTLs
+            conditional_get: Validator store used to revalidate GETs with
+                If-None-Match/If-Modified-Since, or True for a default one
+            rate_limiter: Token-bucket limiter consulted before every request,
+                or True for one with the default limits. Share one instance
+                between clients to apply a process-wide limit.
+            circuit_breaker: Per-route circuit breakers that fail fast with
+                CircuitOpenError while a route keeps failing, or True for
+                breakers with the default thresholds
+            retry_policy: Policy deciding which failures are retried and
+                when, shared by every request of the client. Defaults to a
+                RetryPolicy using ``max_retries`` and ``backoff_factor`` with
+                a retry budget.
+            hedging: Policy for hedging slow idempotent GETs with a second
+                attempt, or True for one with the default settings
+            timeout: Timeout of each attempt, as a Timeout or total seconds.
+                Defaults to a 10 second connect and 300 second read timeout.
+            deadline: Seconds each call may take including retries and
+                backoff, None for no limit
+            json_codec: JSON codec for request and response bodies, by name
+                (``"auto"``, ``"orjson"``, ``"msgspec"``, ``"json"``) or as a
+                JSONCodec. Defaults to the HTTP library's own JSON handling.
+            compress_requests: Compression of request bodies with
+                Content-Encoding, or True for gzip of bodies of 64 KiB and
+                more. The server must accept compressed, chunked uploads.
         """
-        self.base_url = "https://api.submodel.ai/api/v1"
-        self.token = token
-        self.api_key = api_key
-        self.max_retries = max_retries
-        self.backoff_factor = backoff_factor
-        
-        if not (token or api_key):
-            raise ValueError("Either token or api_key must be provided")
+        super().__init__(token, api_key, max_retries, backoff_factor)
+        self.transport = transport or RequestsTransport(session, pool_connections, pool_maxsize, pool_block)
+        self.singleflight = SingleFlight() if coalesce_requests else None
+        self.cache = ResponseCache() if cache is True else (None if cache is False else cache)
+        self.validators = ValidatorCache() if conditional_get is True else (None if conditional_get is False else conditional_get)
+        self.rate_limiter = RateLimiter() if rate_limiter is True else (rate_limiter or None)
+        self.circuit_breakers = CircuitBreakerRegistry() if circuit_breaker is True else (circuit_breaker or None)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.hedging = HedgingPolicy() if hedging is True else (hedging or None)
+        self.timeout = Timeout.coerce(timeout)
+        self.deadline = deadline
+        self.codec = get_codec(json_codec) if json_codec is not None else None
+        self.compression = RequestCompression() if compress_requests is True else (compress_requests or None)
+        self._hedge_executor = None
+        self._hedge_lock = threading.Lock()
             
         logger.info("Initialized SubModel client")
     
-    def _get_headers(self) -> Dict[str, str]:
-        """Get request headers"""
-        headers = {"Content-Type": "application/json"}
-        if self.token:
-            headers["x-token"] = self.token
-        if self.api_key:
-            headers["x-apikey"] = self.api_key
-        return headers
+    @property
+    def session(self) -> Optional[requests.Session]:
+        """Get the underlying HTTP session of the transport"""
+        return getattr(self.transport, "session", None)
+    
+    def close(self) -> None:
+        """Close the transport and release pooled connections"""
+        if self._hedge_executor is not None:
+            shutdown_executor(self._hedge_executor)
+            self._hedge_executor = None
+        self.transport.close()
+    
+    def __enter__(self):
+        """Enter context"""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Exit context"""
+        self.close()
     
-    @retry()
     def _request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
         """Send HTTP request
         
@@ -59,25 +146,295 @@ class SubModelClient:
             ResourceNotFoundError: When requested resource doesn't exist
             QuotaExceededError: When quota is exceeded
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        headers = self._get_headers()
-        if "headers" in kwargs:
-            headers.update(kwargs.pop("headers"))
+        url = self._build_url(endpoint)
+        cache = self.cache
+        if cache is not None and self._is_coalescable(method, url, kwargs):
+            ttl = cache.ttl_for(endpoint)
+            if ttl > 0:
+                key = request_key(method, url, kwargs.get("params"), kwargs.get("headers"))
+                found, data = cache.get(key)
+                if found:
+                    return data
+                generation = cache.generation
+                data = self._dispatch(method, url, **kwargs)
+                cache.set(key, endpoint, data, ttl, generation)
+                return data
+        try:
+            return self._dispatch(method, url, **kwargs)
+        finally:
+            self._invalidate_after(method, endpoint)
+    
+    def _dispatch(self, method: str, url: str, **kwargs) -> Dict[str, Any]:
+        """Send the request, sharing identical in-flight GETs when enabled"""
+        if self.singleflight is not None and self._is_coalescable(method, url, kwargs):
+            key = request_key(method, url, kwargs.get("params"), kwargs.get("headers"))
+            return self.singleflight.do(key, lambda: self._send(method, url, **kwargs))
+        return self._send(method, url, **kwargs)
+    
+    def _send(self, method: str, url: str, send: Optional[Callable[..., Any]] = None, **kwargs) -> Any:
+        """Send HTTP request to an absolute URL with retries
+
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            send: Attempt to retry, defaults to a (hedged) decoded request
+            **kwargs: Request parameters
+        """
+        timeout, deadline = self._call_limits(kwargs)
+        idempotent = self._pop_idempotent(method, kwargs)
+        validator_key = self._validator_key(method, url, kwargs)
+        if send is None:
+            send = self._hedged_attempt if self._is_hedgeable(method, url, kwargs) else self._attempt
+        headers, kwargs = self._prepare_request(method, url, kwargs)
+        self.retry_policy.record_request()
+        attempt = 0
+        while True:
+            kwargs["timeout"] = self._attempt_timeout(timeout, deadline)
+            try:
+                return send(method, url, headers, validator_key, **kwargs)
+            except Exception as e:
+                delay = self._retry_delay(attempt, e, idempotent, deadline)
+                if delay is None:
+                    if attempt:
+                        logger.error("Request failed (%s) after %d retries", e, attempt)
+                    raise
+                attempt += 1
+                logger.warning("Request failed (%s), retrying in %.2f seconds (attempt %d/%d)", e, delay, attempt, self.max_retries)
+                time.sleep(delay)
+    
+    def _hedge_pool(self) -> ThreadPoolExecutor:
+        """Get the threads hedged GETs run on, created on first use"""
+        with self._hedge_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(
+                    max_workers=self.hedging.max_workers, thread_name_prefix="submodel-hedge")
+            return self._hedge_executor
+    
+    def _hedged_attempt(self, method: str, url: str, headers: Dict[str, str],
+                        validator_key: Optional[Hashable] = None, **kwargs) -> Dict[str, Any]:
+        """Send an attempt, racing a second copy if it is slower than usual"""
+        hedging = self.hedging
+        route = self._route(url)
+        hedging.record_request()
+        delay = hedging.hedge_delay(route)
+        started = time.monotonic()
+        if delay is None:
+            data = self._attempt(method, url, headers, validator_key, **kwargs)
+            hedging.record_latency(route, time.monotonic() - started)
+            return data
+        
+        pool = self._hedge_pool()
+        primary = pool.submit(self._attempt, method, url, headers, validator_key, **kwargs)
+        done, _ = wait([primary], timeout=delay)
+        if done or not hedging.try_hedge():
+            data = primary.result()
+            hedging.record_latency(route, time.monotonic() - started)
+            return data
+        
+        logger.debug("Hedging %s %s after %.3f seconds", method, url, delay)
+        hedge = pool.submit(self._attempt, method, url, headers, validator_key, **kwargs)
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for loser in pending:
+                        loser.cancel()  # Only stops it if it has not started yet
+                    hedging.record_win(future is hedge)
+                    hedging.record_latency(route, time.monotonic() - started)
+                    return future.result()
+        return primary.result()  # Both failed, raise the original error
+    
+    def _attempt(self, method: str, url: str, headers: Dict[str, str],
+                 validator_key: Optional[Hashable] = None, decode: Optional[Callable[[Any], Any]] = None,
+                 **kwargs) -> Dict[str, Any]:
+        """Send a single attempt of a request, decoding the body with ``decode`` if given"""
+        route = self._route(url)
+        self._check_circuit(route)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(route)
+        snapshot = self.validators.lookup(validator_key) if validator_key is not None else None
+        if snapshot is not None:
+            headers = {**headers, **snapshot[0]}
+        
+        response = None
+        try:
+            response = self.transport.request(method, url, headers=headers, **kwargs)
+            response.raise_for_status()  # Raise exception for non-200 status codes
             
-        # Log request
-        log_request(method, url, headers=headers, **kwargs)
+            if snapshot is not None and response.status_code == 304:
+                data = self.validators.revalidated(validator_key, snapshot)
+            else:
+                data = self._handle_response((decode or self._decode)(response))
+                if validator_key is not None:
+                    self._remember_validators(validator_key, response, data)
+        except Exception as e:
+            if response is not None and getattr(e, "headers", None) is None:
+                e.headers = response.headers  # Lets the retry policy see Retry-After
+            self._record_outcome(route, e, response)
+            raise
+        self._record_outcome(route)
+        return data
+    
+    def _open_stream(self, method: str, url: str, headers: Dict[str, str],
+                     validator_key: Optional[Hashable] = None, **kwargs) -> StreamedResponse:
+        """Send a single attempt of a streamed request, returning once the headers arrive"""
+        route = self._route(url)
+        self._check_circuit(route)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(route)
+        
+        response = None
+        try:
+            response = self.transport.stream(method, url, headers=headers, **kwargs)
+            response.raise_for_status()
+        except Exception as e:
+            if response is not None:
+                response.close()
+                if getattr(e, "headers", None) is None:
+                    e.headers = response.headers
+            self._record_outcome(route, e, response)
+            raise
+        self._record_outcome(route)
+        return response
+    
+    @contextmanager
+    def stream(self, method: str, endpoint: str, **kwargs) -> Iterator[StreamedResponse]:
+        """Send a request and read its body as it arrives
+        
+        The body is decompressed chunk by chunk as it is read, so memory use
+        follows the chunk size rather than the size of the response.
+        Retries, deadlines, circuit breakers and the rate limiter apply until
+        the response headers arrive; streamed responses are neither cached
+        nor coalesced, and API error codes in the body are not checked.
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            **kwargs: Request parameters
+            
+        Example:
+            with client.stream("GET", "device/list", params={"limit": 10000}) as response:
+                for chunk in response.iter_bytes():
+                    ...
+        """
+        response = self._send(method, self._build_url(endpoint), send=self._open_stream, **kwargs)
+        try:
+            yield response
+        finally:
+            response.close()
+    
+    def stream_items(self, endpoint: str, path: Sequence[str] = ("data", "items"),
+                     chunk_size: int = 64 * 1024, **kwargs) -> Iterator[Any]:
+        """GET a list and yield its items while the response is still arriving
+        
+        The body is parsed incrementally, so the first item is available
+        after its own bytes have arrived and memory use does not grow with
+        the page size. API error codes are raised once the body has been read.
+        
+        Args:
+            endpoint: API endpoint
+            path: Keys leading from the response envelope to the item array
+            chunk_size: Bytes read from the response at a time
+            **kwargs: Request parameters
+        """
+        parser = JSONItemStream(path)
+        with self.stream("GET", endpoint, **kwargs) as response:
+            for chunk in response.iter_bytes(chunk_size):
+                yield from parser.feed(chunk)
+            yield from parser.close()
+        self._handle_response(parser.envelope)
+    
+    def paginate(self, endpoint: str, params: Optional[Dict[str, Any]] = None, limit: int = 100,
+                 prefetch: int = 1, first_page: int = 1) -> Iterator[Any]:
+        """Yield the items of every page of a list endpoint
+        
+        The next ``prefetch`` pages are fetched on background threads while
+        the caller processes the current one.
+        
+        Args:
+            endpoint: API endpoint taking ``page`` and ``limit`` parameters
+            params: Other query parameters
+            limit: Page size
+            prefetch: Pages fetched ahead, 0 to fetch pages only when needed
+            first_page: Page to start at
+        """
+        params = dict(params or {})
+        
+        def fetch(page: int) -> Dict[str, Any]:
+            return self.get(endpoint, params={**params, "page": page, "limit": limit})
+        
+        for response in iter_pages(fetch, limit, first_page, prefetch):
+            yield from page_items(response)
+    
+    def fetch_all(self, endpoint: str, params: Optional[Dict[str, Any]] = None, limit: Optional[int] = None,
+                  concurrency: int = 8, max_limit: int = 1000) -> List[Any]:
+        """Fetch every item of a list endpoint, fetching pages in parallel
+        
+        The first page reports the total; all remaining pages are then
+        fetched at once on up to ``concurrency`` threads and joined in order.
+        
+        Args:
+            endpoint: API endpoint taking ``page`` and ``limit`` parameters
+            params: Other query parameters
+            limit: Page size, None to pick the one with the least wall time
+            concurrency: Pages fetched at the same time
+            max_limit: Largest page size the API serves
             
-        response = requests.request(method, url, headers=headers, **kwargs)
-        response.raise_for_status()  # Raise exception for non-200 status codes
+        Returns:
+            Items of every page, in order
+        """
+        params = dict(params or {})
         
-        data = response.json()
-        # Log response
-        log_response(data)
+        def fetch(page: int, size: int) -> Dict[str, Any]:
+            return self.get(endpoint, params={**params, "page": page, "limit": size})
         
-        # Check API errors
-        raise_for_error(data)
+        first_limit = limit or min(FIRST_PAGE_LIMIT, max_limit)
+        plan = PagePlan(fetch(1, first_limit), first_limit, limit, concurrency, max_limit)
+        if plan.total is None:  # No total to plan with, walk the pages instead
+            items = plan.first_items
+            if len(items) >= first_limit:
+                for response in iter_pages(lambda page: fetch(page, first_limit), first_limit, 2, concurrency):
+                    items.extend(page_items(response))
+            return items
+        if not plan.pages:
+            return plan.assemble([])
         
-        return data
+        executor = ThreadPoolExecutor(max_workers=min(max(1, concurrency), len(plan.pages)),
+                                      thread_name_prefix="submodel-fetch-all")
+        futures: List[Any] = []
+        try:
+            futures = [executor.submit(fetch, page, plan.limit) for page in plan.pages]
+            return plan.assemble([future.result() for future in futures])
+        finally:
+            shutdown_executor(executor, futures)
+    
+    def get_lazy(self, endpoint: str, path: Sequence[str] = ("data", "items"), **kwargs) -> LazyResponse:
+        """GET a list, decoding its items only when they are accessed
+        
+        The envelope is decoded right away and API error codes are raised as
+        usual; the item array at ``path`` stays undecoded until it is read,
+        see :class:`~submodel.sdk.lazy.LazyResponse`. Retries, deadlines,
+        circuit breakers and the rate limiter apply; lazy responses are
+        neither cached, coalesced nor hedged.
+        
+        Args:
+            endpoint: API endpoint
+            path: Keys leading from the response envelope to the item array
+            **kwargs: Request parameters
+            
+        Example:
+            page = client.get_lazy("device/list", params={"limit": 10000})
+            total = page["data"]["total"]
+            first = page.array[0]
+        """
+        decode = partial(self._decode_lazy, path=path)
+        
+        def attempt(method: str, url: str, headers: Dict[str, str],
+                    validator_key: Optional[Hashable] = None, **kwargs) -> LazyResponse:
+            return self._attempt(method, url, headers, decode=decode, **kwargs)
+        
+        return self._send("GET", self._build_url(endpoint), send=attempt, **kwargs)
     
     def get(self, endpoint: str, **kwargs) -> Dict[str, Any]:
         """Send GET request"""
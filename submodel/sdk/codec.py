@@ -0,0 +1,129 @@
+"""
+JSON Codecs
+~~~~~~~~~~
+
+Pluggable JSON encoding and decoding of request and response bodies.
+``orjson`` and ``msgspec`` are used when installed and are several times
+faster than the standard library on large payloads such as ``inst/list``,
+``_requests`` or ``runsync`` results.
+
+Codecs are selected by name:
+
+    - ``"auto"``: orjson, else msgspec, else the standard library
+    - ``"orjson"``, ``"msgspec"``: the given library, ImportError if missing
+    - ``"json"``: the standard library
+"""
+
+import json
+from typing import Any, Callable, Dict, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+class JSONCodec:
+    """Interface of JSON codecs"""
+
+    #: Name the codec is selected by
+    name = ""
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object to UTF-8 JSON bytes"""
+        raise NotImplementedError
+
+    def dumps_str(self, obj: Any) -> str:
+        """Encode an object to a JSON string"""
+        return self.dumps(obj).decode("utf-8")
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """Decode JSON bytes or text"""
+        raise NotImplementedError
+
+class StdlibCodec(JSONCodec):
+    """Codec backed by the standard library ``json`` module"""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    def dumps_str(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        if isinstance(data, memoryview):
+            data = bytes(data)
+        return json.loads(data)
+
+class OrjsonCodec(JSONCodec):
+    """Codec backed by ``orjson``"""
+
+    name = "orjson"
+
+    def __init__(self):
+        _require("orjson", orjson)
+        self._option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, option=self._option)
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        return orjson.loads(data)
+
+class MsgspecCodec(JSONCodec):
+    """Codec backed by ``msgspec.json``"""
+
+    name = "msgspec"
+
+    def __init__(self):
+        _require("msgspec", msgspec)
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        return self._decoder.decode(data)
+
+def _require(name: str, module: Any) -> None:
+    if module is None:
+        raise ImportError(
+            f"The {name} JSON codec requires {name}. "
+            f"Install it with: pip install {name}"
+        )
+
+CODECS: Dict[str, Callable[[], JSONCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json": StdlibCodec,
+}
+
+def get_codec(codec: Union[str, JSONCodec] = "auto") -> JSONCodec:
+    """Get a JSON codec by name
+
+    Args:
+        codec: Codec name (``"auto"``, ``"orjson"``, ``"msgspec"``,
+            ``"json"``) or a codec instance, which is returned as is
+
+    Raises:
+        ImportError: If the named codec's library is not installed
+        ValueError: If the name is unknown
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec == "auto":
+        if orjson is not None:
+            return OrjsonCodec()
+        if msgspec is not None:
+            return MsgspecCodec()
+        return StdlibCodec()
+    if codec not in CODECS:
+        raise ValueError(f"Unknown JSON codec '{codec}', expected one of: auto, {', '.join(CODECS)}")
+    return CODECS[codec]()
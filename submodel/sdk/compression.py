@@ -0,0 +1,145 @@
+"""
+Compression
+~~~~~~~~~~
+
+Content encodings of request and response bodies.
+
+Requests: opt-in ``Content-Encoding`` compression of large bodies, such as
+``ServerlessEndpoint.run``/``run_sync`` inputs with long prompts or embedded
+images. The JSON body is encoded once and then compressed slice by slice
+while it is sent (chunked transfer encoding), so no second full-size copy of
+the payload is made. Supported encodings are ``gzip`` (standard library) and
+``zstd`` (Python 3.14+, ``backports.zstd`` or ``zstandard``).
+
+Responses: the clients advertise every encoding their HTTP library can
+decode in ``Accept-Encoding``, preferring zstd, then brotli, then gzip. The
+libraries decode bodies transparently and incrementally, so streamed
+responses are decompressed chunk by chunk as they are read. Which encodings
+a library decodes depends on its version and on the optional packages it
+finds (``brotli``/``brotlicffi``, ``backports.zstd`` or ``zstandard``), so
+each transport asks its library rather than checking what is importable.
+"""
+
+import zlib
+from typing import Any, AsyncIterator, Iterator, Optional
+
+try:
+    from compression import zstd  # Python 3.14+
+except ImportError:
+    try:
+        from backports import zstd
+    except ImportError:  # pragma: no cover - optional dependency
+        zstd = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+try:
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:  # pragma: no cover - optional dependency
+        brotli = None
+
+#: Content encodings available for request bodies
+ENCODINGS = ("gzip", "zstd")
+
+def accept_encoding(has_zstd: bool = zstd is not None, has_brotli: bool = brotli is not None) -> str:
+    """Build an ``Accept-Encoding`` value, most preferred encoding first
+
+    Args:
+        has_zstd: Whether zstd responses can be decoded
+        has_brotli: Whether brotli responses can be decoded
+    """
+    encodings = (["zstd"] if has_zstd else []) + (["br"] if has_brotli else []) + ["gzip", "deflate"]
+    return ", ".join(encodings)
+
+#: Encodings every HTTP library decodes
+ACCEPT_ENCODING = accept_encoding(has_zstd=False, has_brotli=False)
+
+class RequestCompression:
+    """When and how request bodies are compressed
+
+    Args:
+        encoding: ``"gzip"`` or ``"zstd"``
+        threshold: Bodies smaller than this many bytes are sent as is
+        level: Compression level, defaults to 1 for gzip (fastest, most of
+            the size reduction of JSON) and 3 for zstd
+        chunk_size: Bytes of the payload compressed at a time
+
+    Raises:
+        ImportError: If zstd is requested and no zstd library is installed
+        ValueError: If the encoding is unknown
+    """
+
+    def __init__(self,
+                 encoding: str = "gzip",
+                 threshold: int = 64 * 1024,
+                 level: Optional[int] = None,
+                 chunk_size: int = 256 * 1024):
+        if encoding not in ENCODINGS:
+            raise ValueError(f"Unknown content encoding '{encoding}', expected one of: {', '.join(ENCODINGS)}")
+        if encoding == "zstd" and zstd is None and zstandard is None:
+            raise ImportError(
+                "zstd request compression requires backports.zstd or zstandard. "
+                "Install it with: pip install backports.zstd"
+            )
+        self.encoding = encoding
+        self.threshold = threshold
+        self.level = level if level is not None else (3 if encoding == "zstd" else 1)
+        self.chunk_size = chunk_size
+
+    def compressor(self) -> Any:
+        """Create a streaming compressor with ``compress`` and ``flush`` methods"""
+        if self.encoding == "zstd":
+            if zstd is not None:
+                return zstd.ZstdCompressor(level=self.level)
+            return zstandard.ZstdCompressor(level=self.level).compressobj()
+        return zlib.compressobj(self.level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def body(self, payload: bytes) -> "CompressedBody":
+        """Wrap an encoded payload for compression while it is sent"""
+        return CompressedBody(payload, self)
+
+class CompressedBody:
+    """Request body compressed chunk by chunk as it is sent
+
+    Iterating it (sync for requests/httpx, async for aiohttp) compresses
+    ``chunk_size`` slices of a memoryview over the payload. Every iteration
+    starts over, so a retried request sends the body again.
+
+    Args:
+        payload: Encoded, uncompressed body
+        compression: Compression settings
+    """
+
+    def __init__(self, payload: bytes, compression: RequestCompression):
+        self.payload = payload
+        self.compression = compression
+
+    @property
+    def encoding(self) -> str:
+        """Value of the Content-Encoding header"""
+        return self.compression.encoding
+
+    def __iter__(self) -> Iterator[bytes]:
+        compressor = self.compression.compressor()
+        view = memoryview(self.payload)
+        step = self.compression.chunk_size
+        for start in range(0, len(view), step):
+            chunk = compressor.compress(view[start:start + step])
+            if chunk:
+                yield chunk
+        tail = compressor.flush()
+        if tail:
+            yield tail
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self._aiter()
+
+    async def _aiter(self) -> AsyncIterator[bytes]:
+        for chunk in self:
+            yield chunk
@@ -0,0 +1,127 @@
+"""
+Adaptive Concurrency Limiting
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+AIMD limiter for the number of requests the async client keeps in flight.
+
+The limit grows additively (about one slot per ``limit`` successful
+requests) while latency stays close to the best latency recently seen, and
+is cut multiplicatively when latency rises past ``latency_tolerance`` times
+that baseline or when requests fail with server errors or timeouts. Bulk
+``asyncio.gather`` sweeps therefore settle near the highest concurrency the
+API sustains without queueing.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD concurrency limiter driven by latency and errors
+
+    Args:
+        initial_limit: Concurrency allowed before any feedback
+        min_limit: Lowest concurrency the limit is cut down to
+        max_limit: Highest concurrency the limit grows to
+        decrease_factor: Multiplier applied to the limit on overload
+        latency_tolerance: Latency, relative to the baseline, treated as overload
+        latency_slack: Seconds above the baseline always tolerated, so
+            jitter on very fast responses does not count as overload
+        window: Number of recent latency samples the baseline is taken from
+    """
+
+    def __init__(self,
+                 initial_limit: int = 10,
+                 min_limit: int = 1,
+                 max_limit: int = 200,
+                 decrease_factor: float = 0.7,
+                 latency_tolerance: float = 2.0,
+                 latency_slack: float = 0.01,
+                 window: int = 100):
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.latency_slack = latency_slack
+        self.in_flight = 0
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._last_decrease = 0.0
+        self.smoothed_latency: Optional[float] = None
+        self.decreases = 0
+
+    @property
+    def baseline_latency(self) -> Optional[float]:
+        """Best latency among the recent samples"""
+        return min(self._samples) if self._samples else None
+
+    async def acquire(self) -> None:
+        """Wait for a free slot"""
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._release_slot()  # Slot was handed over just before cancellation
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def _release_slot(self) -> None:
+        self.in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        """Hand free slots to waiting tasks"""
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def release(self, latency: Optional[float], overloaded: bool = False) -> None:
+        """Free a slot and adapt the limit
+
+        Args:
+            latency: Seconds the request took, None if it was abandoned
+                (cancelled) and says nothing about the server
+            overloaded: Whether the request failed in a way that signals
+                overload (server error, timeout, connection failure)
+        """
+        if latency is None:
+            self._release_slot()
+            return
+        self._samples.append(latency)
+        self.smoothed_latency = latency if self.smoothed_latency is None else 0.8 * self.smoothed_latency + 0.2 * latency
+        baseline = self.baseline_latency
+        if overloaded or latency > max(baseline * self.latency_tolerance, baseline + self.latency_slack):
+            self._decrease()
+        else:
+            self.limit = min(self.max_limit, self.limit + 1.0 / max(self.limit, 1.0))
+        self._release_slot()
+
+    def _decrease(self) -> None:
+        # Requests in flight during one round trip share a single decrease
+        now = time.monotonic()
+        if now - self._last_decrease < (self.smoothed_latency or 0.0):
+            return
+        self._last_decrease = now
+        self.decreases += 1
+        self.limit = max(float(self.min_limit), self.limit * self.decrease_factor)
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        """Get the current limit, load and latency estimates"""
+        return {
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "waiting": len(self._waiters),
+            "baseline_latency": self.baseline_latency,
+            "smoothed_latency": self.smoothed_latency,
+            "decreases": self.decreases,
+        }
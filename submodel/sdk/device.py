@@ -1,24 +1,83 @@
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, AsyncIterator, Iterable, Iterator, Optional, List
+from .async_client import AsyncSubModelClient
+from .bulk import LOOKUP_TTL, BulkResult, alookup_many, lookup_many
+from .models import AreaRecord, BaremetalRecord, DeviceRecord
 from .client import SubModelClient
 
+DEVICE_ACTIONS = [
+    "run", "stop", "release", "remote_cmd", 
+    "set_label", "reset_token", "set_conf", "set_status"
+]
+
+def _device_params(page: int, limit: int, search: Optional[str]) -> Dict[str, Any]:
+    params = {
+        "page": page,
+        "limit": limit
+    }
+    if search:
+        params["search"] = search
+    return params
+
 class Device:
     def __init__(self, client: SubModelClient):
         self.client = client
     
-    def list_devices(self, page: int = 1, limit: int = 10, search: str = None) -> Dict[str, Any]:
-        """Get device list"""
-        params = {
-            "page": page,
-            "limit": limit
-        }
-        if search:
-            params["search"] = search
-        return self.client.get("device/list", params=params)
+    def list_devices(self, page: int = 1, limit: int = 10, search: str = None, lazy: bool = False) -> Dict[str, Any]:
+        """Get device list
+        
+        Pass ``lazy=True`` to get a LazyResponse that decodes the envelope
+        right away and each device only when it is accessed.
+        """
+        if lazy:
+            return self.client.get_lazy("device/list", params=_device_params(page, limit, search))
+        return self.client.get("device/list", params=_device_params(page, limit, search))
+    
+    def stream_devices(self, page: int = 1, limit: int = 1000, search: str = None,
+                       records: bool = False) -> Iterator[Dict[str, Any]]:
+        """Yield the devices of a page while the response is still arriving
+        
+        Unlike ``list_devices``, the page is parsed incrementally, so large
+        ``limit`` values do not delay the first device or hold the whole
+        page in memory. Pass ``records=True`` to get DeviceRecords.
+        """
+        devices = self.client.stream_items("device/list", params=_device_params(page, limit, search))
+        return DeviceRecord.from_items(devices) if records else devices
+    
+    def iter_devices(self, limit: int = 100, search: str = None, prefetch: int = 1,
+                     records: bool = False) -> Iterator[Dict[str, Any]]:
+        """Yield every device, page by page, fetching the next pages in the background
+        
+        Args:
+            limit: Page size
+            search: Search keyword
+            prefetch: Pages fetched ahead while the current one is processed
+            records: Yield compact DeviceRecords instead of dicts
+        """
+        params = {"search": search} if search else {}
+        devices = self.client.paginate("device/list", params=params, limit=limit, prefetch=prefetch)
+        return DeviceRecord.from_items(devices) if records else devices
+    
+    def list_all_devices(self, search: str = None, concurrency: int = 8, records: bool = False) -> List[Dict[str, Any]]:
+        """Get every device, fetching the pages in parallel, as DeviceRecords with ``records=True``"""
+        params = {"search": search} if search else {}
+        devices = self.client.fetch_all("device/list", params=params, concurrency=concurrency)
+        return list(DeviceRecord.from_items(devices)) if records else devices
     
     def get_device(self, device_id: str) -> Dict[str, Any]:
         """Get device details"""
         return self.client.get(f"device/detail/{device_id}")
     
+    def get_many_devices(self, device_ids: Iterable[str], concurrency: int = 8,
+                         cache_ttl: float = LOOKUP_TTL) -> BulkResult:
+        """Get the details of many devices at once
+        
+        Duplicate IDs are fetched once, devices looked up in the last
+        ``cache_ttl`` seconds are served from the client's lookup cache, and
+        the rest are fetched concurrently. Returns a BulkResult mapping each
+        device ID to its details or its error.
+        """
+        return lookup_many(self.client, lambda device_id: f"device/detail/{device_id}", device_ids, concurrency, cache_ttl)
+    
     def control_device(self, action: str, device_id: str, project: str = "global", **kwargs) -> Dict[str, Any]:
         """Control device
         
@@ -33,12 +92,8 @@ class Device:
                 - set_conf: Set configuration
                 - set_status: Set status
         """
-        valid_actions = [
-            "run", "stop", "release", "remote_cmd", 
-            "set_label", "reset_token", "set_conf", "set_status"
-        ]
-        if action not in valid_actions:
-            raise ValueError(f"Invalid action. Must be one of {valid_actions}")
+        if action not in DEVICE_ACTIONS:
+            raise ValueError(f"Invalid action. Must be one of {DEVICE_ACTIONS}")
             
         return self.client.get(f"device/action/{action}/{device_id}/{project}", params=kwargs)
 
@@ -51,6 +106,11 @@ class Area:
         params = {"page": page, "limit": limit}
         return self.client.get("area/list", params=params)
     
+    def iter_areas(self, limit: int = 100, prefetch: int = 1, records: bool = False) -> Iterator[Dict[str, Any]]:
+        """Yield every area, page by page, fetching the next pages in the background"""
+        areas = self.client.paginate("area/list", limit=limit, prefetch=prefetch)
+        return AreaRecord.from_items(areas) if records else areas
+    
     def get_area(self, area_id: str) -> Dict[str, Any]:
         """Get area details"""
         return self.client.get(f"area/detail/{area_id}")
@@ -66,4 +126,98 @@ class Baremetal:
             "limit": limit,
             "mode": mode
         }
-        return self.client.get("baremetal/list", params=params)
\ No newline at end of file
+        return self.client.get("baremetal/list", params=params)
+    
+    def iter_baremetals(self, limit: int = 100, mode: str = "baremetal", prefetch: int = 1,
+                        records: bool = False) -> Iterator[Dict[str, Any]]:
+        """Yield every bare metal server, page by page, fetching the next pages in the background"""
+        servers = self.client.paginate("baremetal/list", params={"mode": mode}, limit=limit, prefetch=prefetch)
+        return BaremetalRecord.from_items(servers) if records else servers
+
+class AsyncDevice:
+    """Device management on the asynchronous client"""
+    
+    def __init__(self, client: AsyncSubModelClient):
+        self.client = client
+    
+    async def list_devices(self, page: int = 1, limit: int = 10, search: str = None, lazy: bool = False) -> Dict[str, Any]:
+        """Get device list, as a LazyResponse with ``lazy=True``"""
+        if lazy:
+            return await self.client.get_lazy("device/list", params=_device_params(page, limit, search))
+        return await self.client.get("device/list", params=_device_params(page, limit, search))
+    
+    def stream_devices(self, page: int = 1, limit: int = 1000, search: str = None,
+                       records: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the devices of a page while the response is still arriving"""
+        devices = self.client.stream_items("device/list", params=_device_params(page, limit, search))
+        return DeviceRecord.afrom_items(devices) if records else devices
+    
+    def iter_devices(self, limit: int = 100, search: str = None, prefetch: int = 1,
+                     records: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """Yield every device, page by page, fetching the next pages on background tasks"""
+        params = {"search": search} if search else {}
+        devices = self.client.paginate("device/list", params=params, limit=limit, prefetch=prefetch)
+        return DeviceRecord.afrom_items(devices) if records else devices
+    
+    async def list_all_devices(self, search: str = None, concurrency: int = 8, records: bool = False) -> List[Dict[str, Any]]:
+        """Get every device, fetching the pages in parallel"""
+        params = {"search": search} if search else {}
+        devices = await self.client.fetch_all("device/list", params=params, concurrency=concurrency)
+        return list(DeviceRecord.from_items(devices)) if records else devices
+    
+    async def get_device(self, device_id: str) -> Dict[str, Any]:
+        """Get device details"""
+        return await self.client.get(f"device/detail/{device_id}")
+    
+    async def get_many_devices(self, device_ids: Iterable[str], concurrency: int = 8,
+                               cache_ttl: float = LOOKUP_TTL) -> BulkResult:
+        """Get the details of many devices at once, see :meth:`Device.get_many_devices`"""
+        return await alookup_many(self.client, lambda device_id: f"device/detail/{device_id}", device_ids, concurrency, cache_ttl)
+    
+    async def control_device(self, action: str, device_id: str, project: str = "global", **kwargs) -> Dict[str, Any]:
+        """Control device, see :meth:`Device.control_device` for the actions"""
+        if action not in DEVICE_ACTIONS:
+            raise ValueError(f"Invalid action. Must be one of {DEVICE_ACTIONS}")
+            
+        return await self.client.get(f"device/action/{action}/{device_id}/{project}", params=kwargs)
+
+class AsyncArea:
+    """Area lookups on the asynchronous client"""
+    
+    def __init__(self, client: AsyncSubModelClient):
+        self.client = client
+    
+    async def list_areas(self, page: int = 1, limit: int = 10) -> Dict[str, Any]:
+        """Get available area list"""
+        params = {"page": page, "limit": limit}
+        return await self.client.get("area/list", params=params)
+    
+    def iter_areas(self, limit: int = 100, prefetch: int = 1, records: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """Yield every area, page by page, fetching the next pages on background tasks"""
+        areas = self.client.paginate("area/list", limit=limit, prefetch=prefetch)
+        return AreaRecord.afrom_items(areas) if records else areas
+    
+    async def get_area(self, area_id: str) -> Dict[str, Any]:
+        """Get area details"""
+        return await self.client.get(f"area/detail/{area_id}")
+
+class AsyncBaremetal:
+    """Bare metal server lookups on the asynchronous client"""
+    
+    def __init__(self, client: AsyncSubModelClient):
+        self.client = client
+    
+    async def list_baremetals(self, page: int = 1, limit: int = 10, mode: str = "baremetal") -> Dict[str, Any]:
+        """Get bare metal server list"""
+        params = {
+            "page": page,
+            "limit": limit,
+            "mode": mode
+        }
+        return await self.client.get("baremetal/list", params=params)
+    
+    def iter_baremetals(self, limit: int = 100, mode: str = "baremetal", prefetch: int = 1,
+                        records: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """Yield every bare metal server, page by page, fetching the next pages on background tasks"""
+        servers = self.client.paginate("baremetal/list", params={"mode": mode}, limit=limit, prefetch=prefetch)
+        return BaremetalRecord.afrom_items(servers) if records else servers
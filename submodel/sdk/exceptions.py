@@ -37,6 +37,24 @@ class NetworkError(SubModelError):
     """Network related error"""
     pass
 
+class HTTPStatusError(NetworkError):
+    """HTTP 4xx/5xx response from a transport without its own error type"""
+    def __init__(self, message: str, status_code: int, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        super().__init__(message, status_code)
+
+class CircuitOpenError(SubModelError):
+    """Request rejected because the circuit breaker of its route is open"""
+    def __init__(self, message: str, route: str, retry_after: float = 0.0):
+        self.route = route
+        self.retry_after = max(0.0, retry_after)
+        super().__init__(message)
+
+class DeadlineExceededError(SubModelError):
+    """Call ran out of time before it could be sent or retried"""
+    pass
+
 class RetryError(SubModelError):
     """Retry failure error"""
     pass
@@ -68,6 +86,8 @@ def raise_for_error(response_data):
         APIError: For other API errors
     """
     code = response_data.get('code', 0)
+    if code == 20000:  # 20000 means success
+        return
     message = response_data.get('message', 'Unknown error')
     
     if code == 40100:
@@ -80,5 +100,5 @@ def raise_for_error(response_data):
         raise ResourceExistsError(message, code)
     elif code >= 50000:
         raise ServerError(message, code)
-    elif code != 20000:  # 20000 means success
+    else:
         raise APIError(message, code)
\ No newline at end of file
@@ -0,0 +1,122 @@
+"""
+Request Hedging
+~~~~~~~~~~~~~~
+
+Hedged requests for idempotent GETs: when an attempt has not answered
+within a percentile of the latency recently seen on its route, a second
+copy is sent and whichever answers first wins. The async client cancels the
+losing attempt; the sync client abandons it (a blocking socket read cannot be
+interrupted) and discards its response.
+
+Hedges are paid for with tokens earned by ordinary requests, so the extra
+load stays below ``max_extra_load`` of the traffic even when the API slows
+down as a whole.
+"""
+
+import threading
+from collections import deque
+from typing import Callable, Deque, Dict, Optional, Union
+
+from .circuit import default_route_key
+
+class HedgingPolicy:
+    """When to hedge GETs, and the budget and metrics of the hedges sent
+
+    Args:
+        percentile: Percentile of recent latency on a route after which a
+            hedge is sent
+        min_samples: Latency samples a route needs before it is hedged
+        window: Number of recent latency samples kept per route
+        min_delay: Shortest wait before hedging, in seconds
+        max_extra_load: Hedges allowed per request, e.g. 0.05 for at most
+            5% extra requests
+        burst: Most hedges that can be saved up while the API is fast
+        max_workers: Threads the sync client runs hedged GETs on
+        route_key: Callable grouping an endpoint into the route its latency
+            is tracked for, defaults to the circuit breaker routes
+    """
+
+    def __init__(self,
+                 percentile: float = 95.0,
+                 min_samples: int = 20,
+                 window: int = 200,
+                 min_delay: float = 0.005,
+                 max_extra_load: float = 0.05,
+                 burst: float = 10.0,
+                 max_workers: int = 16,
+                 route_key: Optional[Callable[[str], str]] = None):
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.window = window
+        self.min_delay = min_delay
+        self.max_extra_load = max_extra_load
+        self.burst = burst
+        self.max_workers = max_workers
+        self.route_key = route_key or default_route_key
+        self._samples: Dict[str, Deque[float]] = {}
+        self._tokens = 0.0
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.skipped = 0
+
+    def hedge_delay(self, endpoint: str) -> Optional[float]:
+        """Get how long to wait for an attempt before hedging it
+
+        Returns:
+            Seconds to wait, None while the route has too few samples
+        """
+        samples = self._samples.get(self.route_key(endpoint))
+        if samples is None or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100.0))
+        return max(self.min_delay, ordered[index])
+
+    def record_latency(self, endpoint: str, latency: float) -> None:
+        """Record how long a successful request to an endpoint took"""
+        route = self.route_key(endpoint)
+        samples = self._samples.get(route)
+        if samples is None:
+            with self._lock:
+                samples = self._samples.setdefault(route, deque(maxlen=self.window))
+        samples.append(latency)
+
+    def record_request(self) -> None:
+        """Count a hedgeable request, earning part of a hedge token"""
+        with self._lock:
+            self.requests += 1
+            self._tokens = min(self.burst, self._tokens + self.max_extra_load)
+
+    def try_hedge(self) -> bool:
+        """Take a hedge token
+
+        Returns:
+            False if hedging would exceed the extra load allowed
+        """
+        with self._lock:
+            if self._tokens < 1.0:
+                self.skipped += 1
+                return False
+            self._tokens -= 1.0
+            self.hedges += 1
+            return True
+
+    def record_win(self, hedge: bool) -> None:
+        """Record which attempt of a hedged request answered first"""
+        if hedge:
+            with self._lock:
+                self.hedge_wins += 1
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """Get how often requests were hedged and how often hedges won"""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "hedges": self.hedges,
+                "hedge_wins": self.hedge_wins,
+                "skipped": self.skipped,
+                "hedge_rate": self.hedges / self.requests if self.requests else 0.0,
+                "hedge_win_rate": self.hedge_wins / self.hedges if self.hedges else 0.0,
+            }
@@ -5,9 +5,32 @@ Instance Management Module
 This module provides functionality for managing SubModel instances.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, AsyncIterator, Iterable, Iterator, Optional, List
+from .bulk import LOOKUP_TTL, BulkResult, Progress, alookup_many, arun_many, lookup_many, run_many
+from .models import InstanceRecord
 from .utils import log_request, log_response
 
+INSTANCE_ACTIONS = [
+    "run", "stop", "release", "restart", "remote_cmd",
+    "setlabel", "set_ports", "change_image", "set_ex_setting", "set_envs"
+]
+
+#: Actions that set a state, so sending one twice has the effect of sending it once
+IDEMPOTENT_ACTIONS = frozenset(INSTANCE_ACTIONS) - {"remote_cmd"}
+
+def _create_payload(billing_method: str, mode: str, plan: str, image: str, pod_num: int,
+                    area: Optional[List[str]], conf: Optional[Dict[str, Any]], **kwargs) -> Dict[str, Any]:
+    return {
+        "billing_method": billing_method,
+        "mode": mode,
+        "plan": plan,
+        "image": image,
+        "pod_num": pod_num,
+        "area": area or [],
+        "conf": conf or {},
+        **kwargs
+    }
+
 class Instance:
     """Instance management class"""
     
@@ -43,32 +66,60 @@ class Instance:
         Returns:
             API response containing instance details
         """
-        data = {
-            "billing_method": billing_method,
-            "mode": mode,
-            "plan": plan,
-            "image": image,
-            "pod_num": pod_num,
-            "area": area or [],
-            "conf": conf or {},
-            **kwargs
-        }
+        data = _create_payload(billing_method, mode, plan, image, pod_num, area, conf, **kwargs)
         return self.client.post("inst/create", json=data)
     
-    def list_instances(self, page: int = 1, limit: int = 10, mode: str = "pod") -> Dict[str, Any]:
+    def list_instances(self, page: int = 1, limit: int = 10, mode: str = "pod", lazy: bool = False) -> Dict[str, Any]:
         """List instances
         
         Args:
             page: Page number for pagination
             limit: Number of items per page
             mode: Instance mode (pod/baremetal)
+            lazy: Return a LazyResponse that decodes instances only when
+                they are accessed
             
         Returns:
             API response containing list of instances
         """
         params = {"page": page, "limit": limit, "mode": mode}
+        if lazy:
+            return self.client.get_lazy("inst/list", params=params)
         return self.client.get("inst/list", params=params)
     
+    def iter_instances(self, limit: int = 100, mode: str = "pod", prefetch: int = 1,
+                       records: bool = False) -> Iterator[Dict[str, Any]]:
+        """Iterate over every instance, page by page
+        
+        The next pages are fetched in the background while the current one
+        is processed.
+        
+        Args:
+            limit: Number of items per page
+            mode: Instance mode (pod/baremetal)
+            prefetch: Number of pages fetched ahead
+            records: Yield compact InstanceRecords instead of dicts
+            
+        Returns:
+            Iterator over the instances
+        """
+        instances = self.client.paginate("inst/list", params={"mode": mode}, limit=limit, prefetch=prefetch)
+        return InstanceRecord.from_items(instances) if records else instances
+    
+    def list_all_instances(self, mode: str = "pod", concurrency: int = 8, records: bool = False) -> List[Dict[str, Any]]:
+        """Get every instance, fetching the pages in parallel
+        
+        Args:
+            mode: Instance mode (pod/baremetal)
+            concurrency: Number of pages fetched at the same time
+            records: Return compact InstanceRecords instead of dicts
+            
+        Returns:
+            List of every instance
+        """
+        instances = self.client.fetch_all("inst/list", params={"mode": mode}, concurrency=concurrency)
+        return list(InstanceRecord.from_items(instances)) if records else instances
+    
     def get_instance(self, inst_id: str) -> Dict[str, Any]:
         """Get instance details
         
@@ -80,6 +131,24 @@ class Instance:
         """
         return self.client.get(f"inst/detail/{inst_id}")
     
+    def get_many_instances(self, inst_ids: Iterable[str], concurrency: int = 8,
+                           cache_ttl: float = LOOKUP_TTL) -> BulkResult:
+        """Get the details of many instances at once
+        
+        Duplicate IDs are fetched once, instances looked up in the last
+        ``cache_ttl`` seconds are served from the client's lookup cache, and
+        the rest are fetched concurrently.
+        
+        Args:
+            inst_ids: Instance IDs
+            concurrency: Number of requests in flight at the same time
+            cache_ttl: Seconds a looked-up instance is reused, 0 to always fetch
+            
+        Returns:
+            BulkResult mapping each instance ID to its details or its error
+        """
+        return lookup_many(self.client, lambda inst_id: f"inst/detail/{inst_id}", inst_ids, concurrency, cache_ttl)
+    
     def delete_instance(self, inst_id: str) -> Dict[str, Any]:
         """Delete an instance
         
@@ -112,14 +181,39 @@ class Instance:
         Returns:
             API response indicating operation status
         """
-        valid_actions = [
-            "run", "stop", "release", "restart", "remote_cmd",
-            "setlabel", "set_ports", "change_image", "set_ex_setting", "set_envs"
-        ]
-        if action not in valid_actions:
-            raise ValueError(f"Invalid action. Must be one of {valid_actions}")
+        if action not in INSTANCE_ACTIONS:
+            raise ValueError(f"Invalid action. Must be one of {INSTANCE_ACTIONS}")
+            
+        return self.client.post(f"inst/action/{action}/{inst_id}", json=kwargs,
+                                idempotent=action in IDEMPOTENT_ACTIONS)
+    
+    def control_many(self, action: str, inst_ids: Iterable[str], concurrency: int = 8,
+                     progress: Progress = None, **kwargs) -> BulkResult:
+        """Apply an action to many instances at once
+        
+        Every instance is controlled with its own request, retried on its
+        own under the client's retry policy. Actions that set a state
+        (everything but ``remote_cmd``) are retried like idempotent requests;
+        ``remote_cmd`` only when it cannot have run, see
+        :class:`~submodel.sdk.retries.RetryPolicy`. Failures are collected
+        per instance rather than stopping the other instances.
+        
+        Args:
+            action: Action type, see :meth:`control_instance`
+            inst_ids: Instance IDs, duplicates are controlled once
+            concurrency: Number of requests in flight at the same time
+            progress: Callback ``progress(done, total)`` called after each
+                instance, or True to show a tqdm progress bar
+            **kwargs: Additional parameters sent for every instance
             
-        return self.client.post(f"inst/action/{action}/{inst_id}", json=kwargs)
+        Returns:
+            BulkResult with the response or exception of every instance
+        """
+        if action not in INSTANCE_ACTIONS:
+            raise ValueError(f"Invalid action. Must be one of {INSTANCE_ACTIONS}")
+        
+        return run_many(lambda inst_id: self.control_instance(action, inst_id, **kwargs),
+                        inst_ids, concurrency, progress, desc=action)
     
     def get_pods(self, inst_id: str) -> Dict[str, Any]:
         """Get instance pods
@@ -132,6 +226,15 @@ class Instance:
         """
         return self.client.get(f"inst/cont/{inst_id}")
     
+    def get_many_pods(self, inst_ids: Iterable[str], concurrency: int = 8,
+                      cache_ttl: float = LOOKUP_TTL) -> BulkResult:
+        """Get the pods of many instances at once, see :meth:`get_many_instances`
+        
+        Returns:
+            BulkResult mapping each instance ID to its pod list or its error
+        """
+        return lookup_many(self.client, lambda inst_id: f"inst/cont/{inst_id}", inst_ids, concurrency, cache_ttl)
+    
     def get_pod_logs(self, inst_id: str, pod_id: str) -> Dict[str, Any]:
         """Get Pod logs
         
@@ -155,3 +258,95 @@ class Instance:
             API response indicating termination status
         """
         return self.client.get(f"inst/{inst_id}/pod/{pod_id}/terminate")
+
+class AsyncInstance:
+    """Instance management on the asynchronous client
+    
+    Mirrors :class:`Instance`, with coroutine methods and async iterators.
+    """
+    
+    def __init__(self, client):
+        """Initialize AsyncInstance manager
+        
+        Args:
+            client: Asynchronous SubModel client instance
+        """
+        self.client = client
+    
+    async def create(self, 
+                     billing_method: str = "payg",
+                     mode: str = "pod",
+                     plan: str = "gpu-rtx4090-24g-1",
+                     image: str = "ubuntu-22.04",
+                     pod_num: int = 1,
+                     area: Optional[List[str]] = None,
+                     conf: Optional[Dict[str, Any]] = None,
+                     **kwargs) -> Dict[str, Any]:
+        """Create a new instance, see :meth:`Instance.create`"""
+        data = _create_payload(billing_method, mode, plan, image, pod_num, area, conf, **kwargs)
+        return await self.client.post("inst/create", json=data)
+    
+    async def list_instances(self, page: int = 1, limit: int = 10, mode: str = "pod", lazy: bool = False) -> Dict[str, Any]:
+        """List instances, as a LazyResponse with ``lazy=True``"""
+        params = {"page": page, "limit": limit, "mode": mode}
+        if lazy:
+            return await self.client.get_lazy("inst/list", params=params)
+        return await self.client.get("inst/list", params=params)
+    
+    def iter_instances(self, limit: int = 100, mode: str = "pod", prefetch: int = 1,
+                       records: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over every instance, fetching the next pages on background tasks"""
+        instances = self.client.paginate("inst/list", params={"mode": mode}, limit=limit, prefetch=prefetch)
+        return InstanceRecord.afrom_items(instances) if records else instances
+    
+    async def list_all_instances(self, mode: str = "pod", concurrency: int = 8, records: bool = False) -> List[Dict[str, Any]]:
+        """Get every instance, fetching the pages in parallel"""
+        instances = await self.client.fetch_all("inst/list", params={"mode": mode}, concurrency=concurrency)
+        return list(InstanceRecord.from_items(instances)) if records else instances
+    
+    async def get_instance(self, inst_id: str) -> Dict[str, Any]:
+        """Get instance details"""
+        return await self.client.get(f"inst/detail/{inst_id}")
+    
+    async def get_many_instances(self, inst_ids: Iterable[str], concurrency: int = 8,
+                                 cache_ttl: float = LOOKUP_TTL) -> BulkResult:
+        """Get the details of many instances at once, see :meth:`Instance.get_many_instances`"""
+        return await alookup_many(self.client, lambda inst_id: f"inst/detail/{inst_id}", inst_ids, concurrency, cache_ttl)
+    
+    async def delete_instance(self, inst_id: str) -> Dict[str, Any]:
+        """Delete an instance"""
+        return await self.client.post(f"inst/delete/{inst_id}")
+    
+    async def control_instance(self, action: str, inst_id: str, **kwargs) -> Dict[str, Any]:
+        """Control instance, see :meth:`Instance.control_instance` for the actions"""
+        if action not in INSTANCE_ACTIONS:
+            raise ValueError(f"Invalid action. Must be one of {INSTANCE_ACTIONS}")
+            
+        return await self.client.post(f"inst/action/{action}/{inst_id}", json=kwargs,
+                                      idempotent=action in IDEMPOTENT_ACTIONS)
+    
+    async def control_many(self, action: str, inst_ids: Iterable[str], concurrency: int = 8,
+                           progress: Progress = None, **kwargs) -> BulkResult:
+        """Apply an action to many instances at once, see :meth:`Instance.control_many`"""
+        if action not in INSTANCE_ACTIONS:
+            raise ValueError(f"Invalid action. Must be one of {INSTANCE_ACTIONS}")
+        
+        return await arun_many(lambda inst_id: self.control_instance(action, inst_id, **kwargs),
+                               inst_ids, concurrency, progress, desc=action)
+    
+    async def get_pods(self, inst_id: str) -> Dict[str, Any]:
+        """Get instance pods"""
+        return await self.client.get(f"inst/cont/{inst_id}")
+    
+    async def get_many_pods(self, inst_ids: Iterable[str], concurrency: int = 8,
+                            cache_ttl: float = LOOKUP_TTL) -> BulkResult:
+        """Get the pods of many instances at once, see :meth:`Instance.get_many_pods`"""
+        return await alookup_many(self.client, lambda inst_id: f"inst/cont/{inst_id}", inst_ids, concurrency, cache_ttl)
+    
+    async def get_pod_logs(self, inst_id: str, pod_id: str) -> Dict[str, Any]:
+        """Get Pod logs"""
+        return await self.client.get(f"inst/{inst_id}/pod/{pod_id}/logs")
+    
+    async def terminate_pod(self, inst_id: str, pod_id: str) -> Dict[str, Any]:
+        """Terminate Pod"""
+        return await self.client.get(f"inst/{inst_id}/pod/{pod_id}/terminate")
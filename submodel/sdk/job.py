@@ -1,5 +1,11 @@
+import asyncio
 from typing import Dict, Any, Optional
+from .async_client import AsyncSubModelClient
 from .client import SubModelClient
+from .models import JobRecord
+
+#: Statuses after which a job no longer changes
+FINAL_STATUSES = ["completed", "failed", "cancelled"]
 
 class Job:
     def __init__(self, client: SubModelClient, inst_id: str, job_id: str):
@@ -7,9 +13,10 @@ class Job:
         self.inst_id = inst_id
         self.job_id = job_id
     
-    def get_status(self) -> Dict[str, Any]:
-        """Get task status"""
-        return self.client.get(f"sl/{self.inst_id}/status/{self.job_id}")
+    def get_status(self, records: bool = False) -> Dict[str, Any]:
+        """Get task status, as a JobRecord with ``records=True``"""
+        status = self.client.get(f"sl/{self.inst_id}/status/{self.job_id}")
+        return JobRecord.from_dict(status) if records else status
     
     def cancel(self) -> Dict[str, Any]:
         """Cancel task"""
@@ -32,10 +39,51 @@ class Job:
         
         while True:
             status = self.get_status()
-            if status.get("status") in ["completed", "failed", "cancelled"]:
+            if status.get("status") in FINAL_STATUSES:
                 return status
                 
             if timeout and (time.time() - start_time) > timeout:
                 raise TimeoutError("Job wait timeout")
                 
-            time.sleep(1)  # Avoid too frequent requests
\ No newline at end of file
+            time.sleep(1)  # Avoid too frequent requests
+
+class AsyncJob:
+    def __init__(self, client: AsyncSubModelClient, inst_id: str, job_id: str):
+        self.client = client
+        self.inst_id = inst_id
+        self.job_id = job_id
+    
+    async def get_status(self, records: bool = False) -> Dict[str, Any]:
+        """Get task status, as a JobRecord with ``records=True``"""
+        status = await self.client.get(f"sl/{self.inst_id}/status/{self.job_id}")
+        return JobRecord.from_dict(status) if records else status
+    
+    async def cancel(self) -> Dict[str, Any]:
+        """Cancel task"""
+        return await self.client.get(f"sl/{self.inst_id}/cancel/{self.job_id}")
+    
+    async def wait(self, timeout: Optional[float] = None, poll_interval: float = 1.0) -> Dict[str, Any]:
+        """Wait for task completion without blocking the event loop
+        
+        Args:
+            timeout: Timeout in seconds, None means no timeout
+            poll_interval: Seconds between status requests
+            
+        Returns:
+            Task result
+            
+        Raises:
+            TimeoutError: When waiting timeout
+        """
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        
+        while True:
+            status = await self.get_status()
+            if status.get("status") in FINAL_STATUSES:
+                return status
+                
+            if timeout and (loop.time() - start_time) > timeout:
+                raise TimeoutError("Job wait timeout")
+                
+            await asyncio.sleep(poll_interval)
@@ -0,0 +1,166 @@
+"""
+Incremental JSON Parsing
+~~~~~~~~~~~~~~~~~~~~~~~
+
+Yields the items of one array in a JSON response, such as ``data.items`` of
+``device/list``, as soon as each item has arrived, instead of after the
+whole body has been read and decoded.
+
+Each item, and every value outside the array, is decoded by the C scanner
+of the standard ``json`` module. Only the unfinished tail of the body is
+kept between chunks, so memory use follows the size of an item rather than
+the size of the response.
+"""
+
+import codecs
+import json
+from typing import Any, Dict, List, Sequence
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = frozenset(_WHITESPACE + ",:]}")
+
+class JSONItemStream:
+    """Incremental parser for the items of an array nested in JSON objects
+
+    Feed it the body chunk by chunk; each call returns the items completed
+    so far. Everything outside the array is collected in :attr:`envelope`,
+    with the array itself left empty.
+
+    Args:
+        path: Keys leading from the top-level object to the array
+
+    Example:
+        parser = JSONItemStream(("data", "items"))
+        for chunk in chunks:
+            for item in parser.feed(chunk):
+                ...
+        parser.close()
+    """
+
+    def __init__(self, path: Sequence[str] = ("data", "items")):
+        self.path = tuple(path)
+        self.envelope: Dict[str, Any] = {}
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._text = ""
+        self._pos = 0
+        self._closed = False
+        self._stack: List[Dict[str, Any]] = []  # Objects being parsed, innermost last
+        self._key: Any = None
+        self._state = "start"  # start, key, colon, value, next, items, item_next, done
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Add a chunk of the body and get the items it completed"""
+        self._text = self._text[self._pos:] + self._utf8.decode(chunk)
+        self._pos = 0
+        return self._parse()
+
+    def close(self) -> List[Any]:
+        """Mark the end of the body and get the remaining items
+
+        Raises:
+            ValueError: If the body is not valid JSON or ends early
+        """
+        self._text = self._text[self._pos:] + self._utf8.decode(b"", final=True)
+        self._pos = 0
+        self._closed = True
+        items = self._parse()
+        if self._state != "done" or self._text[self._pos:].strip(_WHITESPACE):
+            raise ValueError(f"Incomplete or invalid JSON body near: {self._text[self._pos:self._pos + 40]!r}")
+        return items
+
+    def _skip(self) -> bool:
+        """Skip whitespace, returning False at the end of the buffer"""
+        text, pos = self._text, self._pos
+        while pos < len(text) and text[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+        return pos < len(text)
+
+    def _decode(self) -> Any:
+        """Decode the value at the position, raising EOFError if it may be incomplete"""
+        try:
+            value, end = self._decoder.raw_decode(self._text, self._pos)
+        except json.JSONDecodeError:
+            if self._closed:
+                raise ValueError(f"Invalid JSON body near: {self._text[self._pos:self._pos + 40]!r}")
+            raise EOFError
+        if not self._closed and (end == len(self._text) or self._text[end] not in _DELIMITERS):
+            raise EOFError  # A number cut at "1." or "1e" may continue in the next chunk
+        self._pos = end
+        return value
+
+    def _parse(self) -> List[Any]:
+        items = []
+        try:
+            while self._state != "done" and self._skip():
+                char = self._text[self._pos]
+                state = self._state
+                if state == "items":
+                    if char == "]":
+                        self._pos += 1
+                        self._state = "next"
+                    else:
+                        items.append(self._decode())
+                        self._state = "item_next"
+                elif state == "item_next":
+                    if char == ",":
+                        self._pos += 1
+                        self._state = "items"
+                    elif char == "]":
+                        self._pos += 1
+                        self._state = "next"
+                    else:
+                        raise ValueError(f"Expected ',' or ']' in the item array, got {char!r}")
+                elif state == "start":
+                    if char != "{":
+                        raise ValueError(f"Expected a JSON object, got {char!r}")
+                    self._pos += 1
+                    self._stack.append(self.envelope)
+                    self._state = "key"
+                elif state == "key":
+                    if char == "}":
+                        self._close_object()
+                    else:
+                        self._key = self._decode()
+                        self._state = "colon"
+                elif state == "colon":
+                    if char != ":":
+                        raise ValueError(f"Expected ':' after key {self._key!r}, got {char!r}")
+                    self._pos += 1
+                    self._state = "value"
+                elif state == "value":
+                    self._value(char)
+                elif state == "next":
+                    if char == ",":
+                        self._pos += 1
+                        self._state = "key"
+                    elif char == "}":
+                        self._close_object()
+                    else:
+                        raise ValueError(f"Expected ',' or '}}', got {char!r}")
+        except EOFError:
+            pass
+        return items
+
+    def _value(self, char: str) -> None:
+        depth = len(self._stack) - 1
+        on_path = depth < len(self.path) and self._key == self.path[depth]
+        if on_path and depth == len(self.path) - 1 and char == "[":
+            self._stack[-1][self._key] = []
+            self._pos += 1
+            self._state = "items"
+        elif on_path and depth < len(self.path) - 1 and char == "{":
+            child: Dict[str, Any] = {}
+            self._stack[-1][self._key] = child
+            self._stack.append(child)
+            self._pos += 1
+            self._state = "key"
+        else:
+            self._stack[-1][self._key] = self._decode()
+            self._state = "next"
+
+    def _close_object(self) -> None:
+        self._pos += 1
+        self._stack.pop()
+        self._state = "next" if self._stack else "done"
@@ -0,0 +1,273 @@
+"""
+Lazy Response Views
+~~~~~~~~~~~~~~~~~~
+
+Keeps the body of a list response undecoded and decodes its items only when
+they are accessed, for callers polling wide list endpoints that look at the
+envelope and a few items of each page.
+
+The envelope is decoded up to the item array (``data.items`` by default)
+right away, so ``code``, ``message``, ``total`` and friends are available and
+API errors are raised as usual. The array is indexed as far as it is read:
+``array[0]`` decodes one item, ``len(array)`` or members after the array
+scan it once, and decoded items are not kept, so the view holds the body
+text plus an offset per indexed item rather than a tree of dicts.
+
+Values are decoded by the C scanner of the standard ``json`` module, whatever
+codec the client uses. Each item is decoded on its own, so reading every
+item costs more CPU than decoding the whole body at once (up to about three
+times as much for small items); the savings come from the items never read
+and the dicts never held.
+"""
+
+import json
+import re
+import threading
+from array import array
+from collections.abc import Mapping, Sequence
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+_END = object()
+
+def _skip(text: str, pos: int) -> int:
+    return _WHITESPACE.match(text, pos).end()
+
+def _decode(text: str, pos: int) -> Tuple[Any, int]:
+    """Decode the value starting at ``pos``, returning it and the position after it"""
+    return _DECODER.raw_decode(text, pos)
+
+def _plain(value: Any) -> Any:
+    """Convert lazy containers to dicts and lists"""
+    if isinstance(value, LazyObject):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, LazyItems):
+        return list(value)
+    return value
+
+class LazyItems(Sequence):
+    """Items of a JSON array decoded on access
+
+    Indexing and iteration decode the requested items from the body each
+    time; keep the result if it is needed again. Negative indexes,
+    ``len()`` and slices without an end index the whole array first.
+    """
+
+    def __init__(self, text: str, start: int):
+        self._text = text
+        self._starts = array("q")
+        self._next = start + 1  # Just past "[" or the last indexed item
+        self._end: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _advance(self) -> Any:
+        """Decode and index the next item, _END once the array is closed"""
+        text, pos = self._text, _skip(self._text, self._next)
+        if text.startswith("]", pos):
+            self._end = pos + 1
+            return _END
+        if self._starts:
+            if not text.startswith(",", pos):
+                raise json.JSONDecodeError("Expecting ',' delimiter", text, pos)
+            pos = _skip(text, pos + 1)
+        self._starts.append(pos)
+        value, self._next = _decode(text, pos)
+        return value
+
+    def _index(self, count: int) -> int:
+        """Index at least ``count`` items or the whole array, returning the number indexed"""
+        with self._lock:
+            while len(self._starts) < count and self._end is None:
+                self._advance()
+            return len(self._starts)
+
+    def _get(self, index: int) -> Any:
+        with self._lock:
+            while len(self._starts) <= index:
+                value = _END if self._end is not None else self._advance()
+                if value is _END:
+                    raise IndexError("list index out of range")
+                if len(self._starts) == index + 1:
+                    return value
+            start = self._starts[index]
+        return _decode(self._text, start)[0]
+
+    def end(self) -> int:
+        """Position just past the closing bracket, indexing the whole array"""
+        self._index(len(self._text))
+        return self._end
+
+    def __len__(self) -> int:
+        return self._index(len(self._text))
+
+    def __bool__(self) -> bool:
+        return self._index(1) > 0
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            start, stop, step = index.start, index.stop, index.step
+            if stop is None or min(start or 0, stop, step or 1) < 0:
+                return [self._get(i) for i in range(*index.indices(len(self)))]
+            return list(islice(self, start, stop, step))
+        if index < 0:
+            index += len(self)
+            if index < 0:
+                raise IndexError("list index out of range")
+        return self._get(index)
+
+    def __iter__(self) -> Iterator[Any]:
+        index = 0
+        while True:
+            try:
+                yield self._get(index)
+            except IndexError:
+                return
+            index += 1
+
+    def to_list(self) -> List[Any]:
+        """Decode every item"""
+        return list(self)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, (list, LazyItems)):
+            return NotImplemented
+        return list(self) == list(other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        state = f"{len(self._starts)} items" if self._end is not None else f"{len(self._starts)}+ items"
+        return f"LazyItems({state})"
+
+class LazyObject(Mapping):
+    """JSON object of the envelope, decoded up to the lazy item array
+
+    Members after the array are decoded the first time a missing key is
+    looked up or the object is iterated, which indexes the array.
+    """
+
+    def __init__(self, root: "LazyResponse", members: Dict[str, Any]):
+        self._root = root
+        self._members = members
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._members[key]
+        except KeyError:
+            if self._root._finished:
+                raise
+        self._root._finish()
+        return self._members[key]
+
+    def __iter__(self) -> Iterator[str]:
+        self._root._finish()
+        return iter(self._members)
+
+    def __len__(self) -> int:
+        self._root._finish()
+        return len(self._members)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Decode the whole object into dicts and lists"""
+        return _plain(self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(self._members)})"
+
+class LazyResponse(LazyObject):
+    """Response envelope whose item array is decoded on access
+
+    Args:
+        body: Raw JSON body of the response
+        path: Keys leading from the envelope to the item array
+
+    Attributes:
+        text: Body of the response, decoded to text
+        path: Keys leading to the item array
+
+    Example:
+        page = LazyResponse(body)
+        page["data"]["total"]
+        first = page.array[0]
+    """
+
+    def __init__(self, body: Union[bytes, bytearray, str], path: Tuple[str, ...] = ("data", "items")):
+        if not isinstance(body, str):
+            body = bytes(body).decode(json.detect_encoding(body), "surrogatepass")
+        super().__init__(self, {})
+        self.text = body
+        self.path = tuple(path)
+        self._lock = threading.Lock()
+        # Item array and the objects still open around it, where decoding resumes
+        self._resume: Optional[Tuple[LazyItems, List[Tuple[Dict[str, Any], int]]]] = None
+        pos = _skip(body, 0)
+        if not body.startswith("{", pos):
+            raise json.JSONDecodeError("Expecting '{'", body, pos)
+        self._parse(pos + 1, [(self._members, 0)])
+        # Set once every member is decoded, so lookups of missing keys can fail
+        self._finished = self._resume is None
+
+    def _parse(self, pos: int, stack: List[Tuple[Dict[str, Any], int]]) -> None:
+        """Decode members until the item array or the end of the envelope
+
+        ``stack`` holds the open objects with their depth along the path.
+        """
+        text, path = self.text, self.path
+        while stack:
+            members, depth = stack[-1]
+            pos = _skip(text, pos)
+            if text.startswith("}", pos):
+                stack.pop()
+                pos += 1
+                continue
+            if members:
+                if not text.startswith(",", pos):
+                    raise json.JSONDecodeError("Expecting ',' delimiter", text, pos)
+                pos = _skip(text, pos + 1)
+            if not text.startswith('"', pos):
+                raise json.JSONDecodeError("Expecting property name enclosed in double quotes", text, pos)
+            key, pos = _decode(text, pos)
+            pos = _skip(text, pos)
+            if not text.startswith(":", pos):
+                raise json.JSONDecodeError("Expecting ':' delimiter", text, pos)
+            pos = _skip(text, pos + 1)
+            if depth < len(path) and key == path[depth]:
+                if depth == len(path) - 1 and text.startswith("[", pos):
+                    items = LazyItems(text, pos)
+                    members[key] = items
+                    self._resume = (items, stack)
+                    return
+                if depth < len(path) - 1 and text.startswith("{", pos):
+                    child: Dict[str, Any] = {}
+                    members[key] = LazyObject(self, child)
+                    stack.append((child, depth + 1))
+                    pos += 1
+                    continue
+            members[key], pos = _decode(text, pos)
+        if _skip(text, pos) != len(text):
+            raise json.JSONDecodeError("Extra data", text, pos)
+
+    def _finish(self) -> None:
+        """Decode the members after the item array
+
+        A body that fails to decode raises again on every call.
+        """
+        with self._lock:
+            if self._finished:
+                return
+            items, stack = self._resume
+            self._parse(items.end(), list(stack))
+            self._finished = True
+
+    @property
+    def array(self) -> Sequence:
+        """Items of the array at ``path``, empty if the response has none"""
+        value: Any = self
+        for key in self.path:
+            value = value.get(key) if isinstance(value, Mapping) else None
+        return value if isinstance(value, (LazyItems, list)) else []
+
+    def __repr__(self) -> str:
+        return f"LazyResponse(code={self._members.get('code')!r}, {len(self.text)} characters)"
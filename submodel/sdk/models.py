@@ -0,0 +1,169 @@
+"""
+Record Models
+~~~~~~~~~~~~
+
+Compact typed records for instance, device, area, bare metal and job
+payloads, for callers holding large inventories in memory.
+
+A record stores its known fields in ``__slots__`` instead of a per-object
+dict, and interns short categorical strings (statuses, modes, plans) so
+thousands of records share one copy of each value. Lists become tuples.
+Fields the API adds that a record does not know are kept in ``extra``, so
+nothing is dropped; a record whose payload has only known keys holds no
+dict at all.
+
+Records are opt-in: SDK methods return raw dicts unless asked for records
+(``records=True`` on the list iterators and bulk list helpers), and
+``Record.from_dict`` converts any payload.
+"""
+
+import sys
+from typing import Any, AsyncIterable, AsyncIterator, Dict, FrozenSet, Iterable, Iterator, Optional, Tuple, Type, TypeVar
+
+R = TypeVar("R", bound="Record")
+
+class Record:
+    """Base class of the typed records
+
+    Subclasses list their fields in ``__slots__``; fields missing from a
+    payload are None. Records also support ``record["field"]`` and
+    ``record.get("field")`` so code written against the raw dicts keeps
+    working.
+
+    Attributes:
+        extra: Payload keys the record has no field for, None if there are none
+    """
+
+    __slots__ = ("extra",)
+
+    #: Names of the typed fields
+    _fields: Tuple[str, ...] = ()
+    _field_set: FrozenSet[str] = frozenset()
+    #: Fields whose string values are interned
+    _interned: FrozenSet[str] = frozenset()
+    #: Fields holding a list, stored as a tuple
+    _tuples: FrozenSet[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        cls._fields = tuple(cls.__dict__.get("__slots__", ()))
+        cls._field_set = frozenset(cls._fields)
+
+    def __init__(self, **fields: Any):
+        for name in self._fields:
+            setattr(self, name, fields.pop(name, None))
+        self.extra: Optional[Dict[str, Any]] = fields or None
+
+    @classmethod
+    def fields(cls) -> Tuple[str, ...]:
+        """Names of the record's typed fields"""
+        return cls._fields
+
+    @classmethod
+    def from_dict(cls: Type[R], data: Dict[str, Any]) -> R:
+        """Build a record from an API payload"""
+        record = cls.__new__(cls)
+        interned, tuples = cls._interned, cls._tuples
+        for name in cls._fields:
+            value = data.get(name)
+            kind = type(value)
+            if kind is str and name in interned:
+                value = sys.intern(value)
+            elif kind is list and name in tuples:
+                value = tuple(value)
+            setattr(record, name, value)
+        known = cls._field_set
+        record.extra = {key: value for key, value in data.items() if key not in known} or None
+        return record
+
+    @classmethod
+    def from_items(cls: Type[R], items: Iterable[Dict[str, Any]]) -> Iterator[R]:
+        """Convert an iterable of payloads lazily"""
+        from_dict = cls.from_dict
+        for item in items:
+            yield from_dict(item)
+
+    @classmethod
+    async def afrom_items(cls: Type[R], items: AsyncIterable[Dict[str, Any]]) -> AsyncIterator[R]:
+        """Convert an async iterable of payloads lazily"""
+        from_dict = cls.from_dict
+        async for item in items:
+            yield from_dict(item)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the payload back as a dict, leaving out fields that are None"""
+        data = {}
+        for name in self._fields:
+            value = getattr(self, name)
+            if type(value) is tuple and name in self._tuples:
+                value = list(value)
+            if value is not None:
+                data[name] = value
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._field_set:
+            return getattr(self, key)
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a field or extra key like ``dict.get``"""
+        try:
+            value = self[key]
+        except KeyError:
+            return default
+        return default if value is None else value
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields if getattr(self, name) is not None)
+        return f"{type(self).__name__}({fields})"
+
+class AreaRecord(Record):
+    """Area from ``area/list`` or ``area/detail``"""
+
+    __slots__ = ("id", "name", "status")
+    _interned = frozenset({"name", "status"})
+
+class InstanceRecord(Record):
+    """Instance from ``inst/list`` or ``inst/detail``"""
+
+    __slots__ = ("inst_id", "inst_label", "status", "mode", "plan", "image", "billing_method",
+                 "pod_num", "area", "created_at")
+    _interned = frozenset({"status", "mode", "plan", "image", "billing_method"})
+    _tuples = frozenset({"area"})
+
+class DeviceRecord(Record):
+    """Device from ``device/list`` or ``device/detail``"""
+
+    __slots__ = ("id", "machine_id", "status")
+    _interned = frozenset({"status"})
+
+class BaremetalRecord(Record):
+    """Bare metal server from ``baremetal/list``"""
+
+    __slots__ = ("id", "type")
+    _interned = frozenset({"type"})
+
+class JobRecord(Record):
+    """Serverless job status from ``sl/{inst_id}/status/{job_id}``
+
+    ``from_dict`` takes the response envelope or the status nested in its
+    ``data``.
+    """
+
+    __slots__ = ("id", "status", "progress", "result", "error")
+    _interned = frozenset({"status"})
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "JobRecord":
+        nested = data.get("data")
+        return super().from_dict(nested if isinstance(nested, dict) else data)
@@ -0,0 +1,225 @@
+"""
+Pagination
+~~~~~~~~~
+
+Walks paginated list endpoints (``page``/``limit`` parameters answered with
+``data.items`` and ``data.total``) while prefetching the next pages: page
+N+1 is already being fetched while the caller processes page N.
+
+Sync iterators prefetch on a small thread pool, async iterators on tasks.
+Up to ``prefetch`` pages are requested ahead; once the first page reports
+the total, no page past the last one is requested.
+
+``fetch_all`` instead reads the total from the first page and then fetches
+all remaining pages at once with bounded concurrency (see :class:`PagePlan`).
+"""
+
+import asyncio
+import math
+import sys
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+def page_items(response: Dict[str, Any]) -> List[Any]:
+    """Get the items of a list response"""
+    return (response.get("data") or {}).get("items") or []
+
+def last_page(response: Dict[str, Any], limit: int) -> Optional[int]:
+    """Get the number of the last page from a list response's total, if it has one"""
+    total = (response.get("data") or {}).get("total")
+    if not isinstance(total, int) or limit <= 0:
+        return None
+    return max(1, -(-total // limit))
+
+class _PageWalk:
+    """Bookkeeping shared by the sync and async page iterators"""
+
+    def __init__(self, limit: int, first_page: int, prefetch: int):
+        self.limit = limit
+        self.prefetch = max(0, prefetch)
+        self.next_page = first_page
+        self.last: Optional[int] = None
+        self.done = False
+
+    def record(self, page: int, response: Dict[str, Any]) -> None:
+        """Update the walk with a received page"""
+        if self.last is None:
+            self.last = last_page(response, self.limit)
+        if len(page_items(response)) < self.limit or (self.last is not None and page >= self.last):
+            self.done = True
+
+    def take(self) -> Optional[int]:
+        """Claim the next page to request, None once past the end"""
+        if self.done or (self.last is not None and self.next_page > self.last):
+            return None
+        page = self.next_page
+        self.next_page += 1
+        return page
+
+    def ahead(self, pending: int) -> List[int]:
+        """Claim pages to request so that ``prefetch`` pages are pending"""
+        pages = []
+        while pending + len(pages) < self.prefetch:
+            page = self.take()
+            if page is None:
+                break
+            pages.append(page)
+        return pages
+
+def iter_pages(fetch: Callable[[int], Dict[str, Any]],
+               limit: int,
+               first_page: int = 1,
+               prefetch: int = 1) -> Iterator[Dict[str, Any]]:
+    """Yield the responses of every page in order, fetching ahead on threads
+
+    Args:
+        fetch: Callable fetching the response of a page number
+        limit: Page size the pages are fetched with
+        first_page: Page to start at
+        prefetch: Pages fetched ahead of the one being processed, 0 to fetch
+            each page only when it is needed
+    """
+    walk = _PageWalk(limit, first_page, prefetch)
+    if walk.prefetch == 0:
+        page = walk.take()
+        while page is not None:
+            response = fetch(page)
+            walk.record(page, response)
+            yield response
+            page = walk.take()
+        return
+
+    executor = ThreadPoolExecutor(max_workers=walk.prefetch, thread_name_prefix="submodel-prefetch")
+    page = walk.take()
+    pending: Deque[Tuple[int, Any]] = deque([(page, executor.submit(fetch, page))])
+    try:
+        while pending:
+            page, future = pending.popleft()
+            response = future.result()
+            walk.record(page, response)
+            for ahead in walk.ahead(len(pending)):
+                pending.append((ahead, executor.submit(fetch, ahead)))
+            yield response
+            if walk.done:
+                break
+    finally:
+        shutdown_executor(executor, (future for _, future in pending))
+
+async def aiter_pages(fetch: Callable[[int], Awaitable[Dict[str, Any]]],
+                      limit: int,
+                      first_page: int = 1,
+                      prefetch: int = 1) -> AsyncIterator[Dict[str, Any]]:
+    """Yield the responses of every page in order, fetching ahead on tasks
+
+    Args:
+        fetch: Coroutine function fetching the response of a page number
+        limit: Page size the pages are fetched with
+        first_page: Page to start at
+        prefetch: Pages fetched ahead of the one being processed, 0 to fetch
+            each page only when it is needed
+    """
+    walk = _PageWalk(limit, first_page, prefetch)
+    page = walk.take()
+    pending: Deque[Tuple[int, "asyncio.Future[Dict[str, Any]]"]] = deque([(page, asyncio.ensure_future(fetch(page)))])
+    try:
+        while pending:
+            page, task = pending.popleft()
+            response = await task
+            walk.record(page, response)
+            for ahead in walk.ahead(len(pending)):
+                pending.append((ahead, asyncio.ensure_future(fetch(ahead))))
+            yield response
+            if walk.done:
+                break
+            if not pending:
+                page = walk.take()
+                if page is not None:
+                    pending.append((page, asyncio.ensure_future(fetch(page))))
+    finally:
+        cancel_tasks(task for _, task in pending)
+
+def shutdown_executor(executor: ThreadPoolExecutor, futures: Iterable[Future] = ()) -> None:
+    """Cancel the calls that have not started and stop the pool without waiting
+
+    ``futures`` are cancelled explicitly because ``shutdown(cancel_futures=True)``
+    needs Python 3.9; on 3.8 other queued calls still run.
+    """
+    for future in futures:
+        future.cancel()
+    if sys.version_info >= (3, 9):
+        executor.shutdown(wait=False, cancel_futures=True)
+    else:
+        executor.shutdown(wait=False)
+
+def cancel_tasks(tasks: Iterable["asyncio.Future[Any]"]) -> None:
+    """Cancel page tasks that are no longer needed"""
+    for task in tasks:
+        if not task.done():
+            task.cancel()
+        elif not task.cancelled():
+            task.exception()  # Mark the error of an unneeded page as retrieved
+
+#: Page size of the first page of ``fetch_all`` when it picks the page size
+FIRST_PAGE_LIMIT = 100
+
+def choose_page_size(total: int, concurrency: int, max_limit: int) -> int:
+    """Pick the page size that fetches ``total`` items in the least wall time
+
+    With ``concurrency`` pages in flight, the items are fetched in rounds
+    and each round costs one page's latency, which grows with the page size.
+    The fewest rounds possible with pages of at most ``max_limit`` items is
+    the best achievable, and the smallest page size that still needs only
+    that many rounds keeps each round as short as possible.
+
+    Args:
+        total: Items to fetch
+        concurrency: Pages fetched at the same time
+        max_limit: Largest page size the API serves
+    """
+    concurrency = max(1, concurrency)
+    rounds = max(1, math.ceil(total / (concurrency * max_limit)))
+    return max(1, min(max_limit, math.ceil(total / (rounds * concurrency))))
+
+class PagePlan:
+    """Remaining pages of a list once its first page is known
+
+    The rest of the list is fetched with one page size, which may differ
+    from the first page's. The page overlapping the items already received
+    is trimmed when the pages are assembled.
+
+    Args:
+        first: Response of page 1
+        first_limit: Page size page 1 was fetched with
+        limit: Page size for the remaining pages, None to choose one
+        concurrency: Pages fetched at the same time
+        max_limit: Largest page size the API serves
+    """
+
+    def __init__(self,
+                 first: Dict[str, Any],
+                 first_limit: int,
+                 limit: Optional[int],
+                 concurrency: int,
+                 max_limit: int):
+        self.first_items = list(page_items(first))
+        total = (first.get("data") or {}).get("total")
+        self.total: Optional[int] = total if isinstance(total, int) else None
+        received = len(self.first_items)
+        if self.total is not None and received < min(first_limit, self.total):
+            max_limit = limit = max(1, received)  # The API capped the page size
+        # Sized on the whole list: the page overlapping the first is fetched again
+        # whenever the page size exceeds the first page's, so it counts as a page
+        self.limit = limit or choose_page_size(self.total or 0, concurrency, max_limit)
+        if self.total is None or received >= self.total:
+            self.pages: List[int] = []
+        else:
+            self.pages = list(range(received // self.limit + 1, math.ceil(self.total / self.limit) + 1))
+
+    def assemble(self, responses: List[Dict[str, Any]]) -> List[Any]:
+        """Join the first page and the responses of :attr:`pages`, in order"""
+        items = list(self.first_items)
+        for page, response in zip(self.pages, responses):
+            skip = max(0, len(self.first_items) - (page - 1) * self.limit)
+            items.extend(page_items(response)[skip:])
+        return items
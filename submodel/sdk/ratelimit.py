@@ -0,0 +1,209 @@
+"""
+Client-side Rate Limiting
+~~~~~~~~~~~~~~~~~~~~~~~~
+
+Token-bucket limiter shared by threads and coroutines, with limits per
+endpoint group, that backs off when the API reports rate limiting
+(code 40300, HTTP 429, ``Retry-After``) and recovers gradually afterwards.
+
+Waiting callers reserve their slot up front (the bucket may go negative),
+so sync threads sleep and async tasks ``await asyncio.sleep`` for exactly
+their turn instead of polling.
+"""
+
+import asyncio
+import threading
+import time
+from fnmatch import fnmatchcase
+from typing import Dict, Optional
+
+#: Requests per second allowed for each endpoint group by default
+DEFAULT_RATE_LIMITS: Dict[str, float] = {
+    "sl/*": 20.0,
+    "inst/*": 10.0,
+    "device/*": 10.0,
+    "*": 10.0,
+}
+
+class TokenBucket:
+    """Thread-safe token bucket with an adjustable refill rate
+
+    Args:
+        rate: Tokens added per second
+        capacity: Maximum burst size, defaults to ``max(1, rate)``
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.blocked_until = 0.0
+        self.decreased_at = float("-inf")
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take a token, returning how many seconds to wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= 1
+            wait = 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+            return max(wait, self.blocked_until - now)
+
+    def acquire(self) -> float:
+        """Wait for a token in the calling thread
+
+        Returns:
+            Seconds waited
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """Wait for a token without blocking the event loop
+
+        Returns:
+            Seconds waited
+        """
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def set_rate(self, rate: float) -> None:
+        """Change the refill rate, keeping the tokens earned so far"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+
+    def decrease_rate(self, factor: float, min_rate: float, interval: float) -> bool:
+        """Multiply the refill rate by ``factor`` unless it was decreased within ``interval`` seconds
+
+        Returns:
+            Whether the rate was decreased
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now - self.decreased_at < interval:
+                return False
+            self._refill(now)
+            self.rate = max(min_rate, self.rate * factor)
+            self.decreased_at = now
+            return True
+
+    def block(self, seconds: float) -> None:
+        """Hand out no tokens for the given number of seconds"""
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+class RateLimiter:
+    """Rate limits per endpoint group, adapted to server feedback
+
+    Endpoint groups are shell-style patterns matched against the API path
+    relative to the base URL; the first matching pattern wins and all
+    endpoints matching it share one bucket. The same limiter can be passed
+    to several sync and async clients.
+
+    On a rate limit response the group's rate is multiplied by
+    ``decrease_factor`` (not below ``min_rate``) and, with ``Retry-After``,
+    the group is paused for that long. Rate limit responses within
+    ``decrease_interval`` seconds of a decrease answer requests sent before
+    it, so they do not decrease the rate again. Each later success raises
+    the rate by ``recovery_step`` times the configured limit until it is
+    restored.
+
+    Args:
+        limits: Mapping of endpoint patterns to requests per second.
+            Defaults to DEFAULT_RATE_LIMITS.
+        burst: Bucket capacity multiplier of the per-second rate
+        decrease_factor: Rate multiplier applied on rate limit responses
+        recovery_step: Share of the configured rate regained per success
+        min_rate: Lowest rate a group is throttled down to
+        decrease_interval: Seconds after a decrease during which the rate
+            is not decreased again
+    """
+
+    def __init__(self,
+                 limits: Optional[Dict[str, float]] = None,
+                 burst: float = 1.0,
+                 decrease_factor: float = 0.5,
+                 recovery_step: float = 0.05,
+                 min_rate: float = 0.1,
+                 decrease_interval: float = 1.0):
+        self.limits = dict(DEFAULT_RATE_LIMITS if limits is None else limits)
+        self.burst = burst
+        self.decrease_factor = decrease_factor
+        self.recovery_step = recovery_step
+        self.min_rate = min_rate
+        self.decrease_interval = decrease_interval
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        self.throttled = 0
+
+    def group(self, endpoint: str) -> Optional[str]:
+        """Get the endpoint group (matching pattern) of an endpoint"""
+        endpoint = endpoint.strip("/")
+        for pattern in self.limits:
+            if fnmatchcase(endpoint, pattern):
+                return pattern
+        return None
+
+    def bucket(self, endpoint: str) -> Optional[TokenBucket]:
+        """Get the bucket of an endpoint's group, None if it is unlimited"""
+        group = self.group(endpoint)
+        if group is None:
+            return None
+        bucket = self._buckets.get(group)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(group)
+                if bucket is None:
+                    rate = self.limits[group]
+                    bucket = self._buckets[group] = TokenBucket(rate, max(1.0, rate * self.burst))
+        return bucket
+
+    def acquire(self, endpoint: str) -> float:
+        """Wait in the calling thread until a request to ``endpoint`` may be sent"""
+        bucket = self.bucket(endpoint)
+        return bucket.acquire() if bucket else 0.0
+
+    async def acquire_async(self, endpoint: str) -> float:
+        """Wait on the event loop until a request to ``endpoint`` may be sent"""
+        bucket = self.bucket(endpoint)
+        return await bucket.acquire_async() if bucket else 0.0
+
+    def penalize(self, endpoint: str, retry_after: Optional[float] = None) -> None:
+        """Slow down an endpoint group after a rate limit response
+
+        Args:
+            endpoint: API endpoint that was rate limited
+            retry_after: Seconds the server asked to wait, if any
+        """
+        bucket = self.bucket(endpoint)
+        if bucket is None:
+            return
+        self.throttled += 1
+        bucket.decrease_rate(self.decrease_factor, self.min_rate, self.decrease_interval)
+        if retry_after:
+            bucket.block(retry_after)
+
+    def record_success(self, endpoint: str) -> None:
+        """Recover an endpoint group's rate after a successful request"""
+        group = self.group(endpoint)
+        bucket = self._buckets.get(group) if group else None
+        if bucket is None:
+            return
+        limit = self.limits[group]
+        if bucket.rate < limit:
+            bucket.set_rate(min(limit, bucket.rate + limit * self.recovery_step))
+
+    def rates(self) -> Dict[str, float]:
+        """Get the current rate of every endpoint group in use"""
+        return {group: bucket.rate for group, bucket in self._buckets.items()}
@@ -0,0 +1,243 @@
+"""
+Retry Policy
+~~~~~~~~~~~
+
+Retry policy shared by the sync and async clients.
+
+Errors are classified by exception type and HTTP status: authentication,
+validation, not-found and other client errors fail immediately, while server
+errors, rate limiting, timeouts and connection failures are retried with
+full-jitter exponential backoff (``uniform(0, backoff_factor * 2 ** attempt)``),
+waiting at least as long as a ``Retry-After`` header asks.
+
+Requests with a non-idempotent method (POST, PATCH) may have been applied
+before they failed, so they are only retried when the server never saw them
+(failures while connecting), when the API rate limited them (code 40300) or
+when it refused them with a 429 or 503 carrying ``Retry-After``.
+
+A :class:`RetryBudget` caps retries to a share of recent traffic, so a
+failing API is not hit with several times its normal load by every client
+retrying at once.
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple, Union
+
+from .exceptions import (
+    AuthenticationError,
+    CircuitOpenError,
+    DeadlineExceededError,
+    QuotaExceededError,
+    RateLimitError,
+    ResourceExistsError,
+    ResourceNotFoundError,
+    ServerError,
+    ValidationError,
+)
+from .utils import get_error_headers, get_http_status, parse_retry_after
+
+#: HTTP statuses worth retrying
+RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+#: HTTP methods whose requests can be repeated without changing their effect
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+#: Errors that fail the same way when retried
+NON_RETRYABLE_ERRORS: Tuple[type, ...] = (
+    AuthenticationError,
+    ValidationError,
+    ResourceNotFoundError,
+    ResourceExistsError,
+    QuotaExceededError,
+    CircuitOpenError,
+    DeadlineExceededError,
+)
+
+#: Errors that signal a transient server-side condition
+RETRYABLE_ERRORS: Tuple[type, ...] = (ServerError, RateLimitError)
+
+#: HTTP statuses that reject a request unprocessed when sent with Retry-After
+REJECTED_STATUSES = frozenset({429, 503})
+
+def _caused_by(error: BaseException, types: Tuple[type, ...]) -> bool:
+    """Whether an error or one of the errors it wraps is of one of ``types``"""
+    seen = set()
+    pending: List[Optional[BaseException]] = [error]
+    while pending:
+        current = pending.pop()
+        if current is None or id(current) in seen:
+            continue
+        if isinstance(current, types):
+            return True
+        seen.add(id(current))
+        reason = getattr(current, "reason", None)
+        pending.extend((current.__cause__, current.__context__,
+                        reason if isinstance(reason, BaseException) else None))
+    return False
+
+class RetryBudget:
+    """Cap on the share of requests that may be retries
+
+    Over a sliding window of ``window`` seconds, retries are allowed while
+    their number stays below ``min_retries_per_second * window`` plus
+    ``ratio`` times the requests sent in the window. Thread-safe, so one
+    budget can be shared by several clients.
+
+    Args:
+        ratio: Retries allowed per request sent
+        min_retries_per_second: Retries always allowed, so low-traffic
+            clients can still retry
+        window: Seconds of traffic the budget is computed over
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries_per_second: float = 1.0, window: float = 10.0):
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.window = window
+        self._slots: Deque[List[float]] = deque()  # [second, requests, retries]
+        self._lock = threading.Lock()
+        self.exhausted = 0
+
+    def _slot(self, now: float) -> List[float]:
+        second = int(now)
+        while self._slots and self._slots[0][0] <= now - self.window:
+            self._slots.popleft()
+        if not self._slots or self._slots[-1][0] != second:
+            self._slots.append([second, 0, 0])
+        return self._slots[-1]
+
+    def record_request(self) -> None:
+        """Count a request (not a retry) towards the budget"""
+        with self._lock:
+            self._slot(time.monotonic())[1] += 1
+
+    def try_withdraw(self) -> bool:
+        """Take one retry from the budget
+
+        Returns:
+            False if the budget is exhausted and the request must not be retried
+        """
+        with self._lock:
+            slot = self._slot(time.monotonic())
+            requests = sum(s[1] for s in self._slots)
+            retries = sum(s[2] for s in self._slots)
+            if retries >= self.min_retries_per_second * self.window + self.ratio * requests:
+                self.exhausted += 1
+                return False
+            slot[2] += 1
+            return True
+
+    def stats(self) -> Dict[str, int]:
+        """Get the requests and retries in the current window"""
+        with self._lock:
+            self._slot(time.monotonic())
+            return {
+                "requests": int(sum(s[1] for s in self._slots)),
+                "retries": int(sum(s[2] for s in self._slots)),
+                "exhausted": self.exhausted,
+            }
+
+class RetryPolicy:
+    """Decides whether and when a failed request is retried
+
+    Args:
+        max_retries: Retries after the initial attempt, None to use the
+            client's ``max_retries``
+        backoff_factor: Base delay in seconds, None to use the client's
+            ``backoff_factor``
+        max_backoff: Upper bound of the backoff before jitter
+        max_retry_after: Longest ``Retry-After`` honoured; the request fails
+            instead of retrying when the server asks for a longer wait
+        budget: Retry budget shared by every request of the policy, False to
+            retry without a budget. Defaults to a RetryBudget with the
+            default settings.
+    """
+
+    def __init__(self,
+                 max_retries: Optional[int] = None,
+                 backoff_factor: Optional[float] = None,
+                 max_backoff: float = 30.0,
+                 max_retry_after: float = 60.0,
+                 budget: Union[RetryBudget, bool, None] = None):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.budget = RetryBudget() if budget is None or budget is True else (budget or None)
+
+    def is_retryable(self,
+                     error: BaseException,
+                     network_errors: Tuple[type, ...] = (),
+                     idempotent: bool = True,
+                     connect_errors: Tuple[type, ...] = ()) -> bool:
+        """Whether an error is worth retrying
+
+        Args:
+            error: Error raised by the attempt
+            network_errors: Exception types the transport raises on network failures
+            idempotent: Whether the request can be sent again without
+                changing its effect
+            connect_errors: Exception types the transport raises when a
+                connection could not be established
+        """
+        if isinstance(error, NON_RETRYABLE_ERRORS):
+            return False
+        if not idempotent:
+            if connect_errors and _caused_by(error, connect_errors):
+                return True
+            if isinstance(error, RateLimitError):
+                return True  # The API rejects rate limited calls before running them
+            return (get_http_status(error) in REJECTED_STATUSES
+                    and parse_retry_after(get_error_headers(error)) is not None)
+        if isinstance(error, RETRYABLE_ERRORS):
+            return True
+        status = get_http_status(error)
+        if status is not None and status >= 400:
+            return status in RETRYABLE_STATUSES
+        return isinstance(error, network_errors)
+
+    def record_request(self) -> None:
+        """Count a new request (not a retry) towards the budget"""
+        if self.budget is not None:
+            self.budget.record_request()
+
+    def next_delay(self,
+                   attempt: int,
+                   error: BaseException,
+                   network_errors: Tuple[type, ...] = (),
+                   max_retries: int = 3,
+                   backoff_factor: float = 0.5,
+                   idempotent: bool = True,
+                   connect_errors: Tuple[type, ...] = ()) -> Optional[float]:
+        """Get the delay before retrying a failed attempt
+
+        Args:
+            attempt: Zero-based number of the attempt that failed
+            error: Error raised by the attempt
+            network_errors: Exception types the transport raises on network failures
+            max_retries: Client retry limit, used unless the policy sets one
+            backoff_factor: Client backoff factor, used unless the policy sets one
+            idempotent: Whether the request can be sent again without
+                changing its effect
+            connect_errors: Exception types the transport raises when a
+                connection could not be established
+
+        Returns:
+            Seconds to wait before the next attempt, None to give up
+        """
+        if self.max_retries is not None:
+            max_retries = self.max_retries
+        if self.backoff_factor is not None:
+            backoff_factor = self.backoff_factor
+        if attempt >= max_retries or not self.is_retryable(error, network_errors, idempotent, connect_errors):
+            return None
+        retry_after = parse_retry_after(get_error_headers(error))
+        if retry_after is not None and retry_after > self.max_retry_after:
+            return None
+        if self.budget is not None and not self.budget.try_withdraw():
+            return None
+        delay = random.uniform(0, min(self.max_backoff, backoff_factor * (2 ** attempt)))
+        return max(delay, retry_after or 0.0)
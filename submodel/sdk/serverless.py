@@ -1,7 +1,9 @@
 import json
 import os
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, Union
+from .async_client import AsyncSubModelClient
 from .client import SubModelClient
+from .codec import JSONCodec, get_codec
 
 class ServerlessEndpoint:
     def __init__(self, client: SubModelClient, inst_id: str):
@@ -36,11 +38,51 @@ class ServerlessEndpoint:
         """Get request list"""
         return self.client.get(f"sl/{self.inst_id}/_requests")
 
+class AsyncServerlessEndpoint:
+    def __init__(self, client: AsyncSubModelClient, inst_id: str):
+        self.client = client
+        self.inst_id = inst_id
+        
+    async def run(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Run task asynchronously"""
+        return await self.client.post(f"sl/{self.inst_id}/run", json={"input": input_data})
+    
+    async def run_sync(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Run task synchronously"""
+        return await self.client.post(f"sl/{self.inst_id}/runsync", json={"input": input_data})
+    
+    async def get_status(self, job_id: str) -> Dict[str, Any]:
+        """Get task status"""
+        return await self.client.get(f"sl/{self.inst_id}/status/{job_id}")
+    
+    async def cancel(self, job_id: str) -> Dict[str, Any]:
+        """Cancel task"""
+        return await self.client.get(f"sl/{self.inst_id}/cancel/{job_id}")
+    
+    async def get_health(self) -> Dict[str, Any]:
+        """Get health status"""
+        return await self.client.get(f"sl/{self.inst_id}/health")
+    
+    async def get_metrics(self) -> Dict[str, Any]:
+        """Get metrics"""
+        return await self.client.get(f"sl/{self.inst_id}/metrics")
+    
+    async def get_requests(self) -> Dict[str, Any]:
+        """Get request list"""
+        return await self.client.get(f"sl/{self.inst_id}/_requests")
+
 class ServerlessHandler:
-    def __init__(self):
+    def __init__(self, json_codec: Union[str, JSONCodec] = "json"):
+        """Initialize the handler
+        
+        Args:
+            json_codec: JSON codec used to write results, by name (``"auto"``,
+                ``"orjson"``, ``"msgspec"``, ``"json"``) or as a JSONCodec
+        """
         self._handler: Optional[Callable] = None
         self._inst_id: Optional[str] = None
         self._max_iterations: int = 100  # Maximum iteration limit
+        self._codec = get_codec(json_codec)
         
     def handler(self, func: Callable) -> Callable:
         """Decorator for registering handler function"""
@@ -128,9 +170,9 @@ class ServerlessHandler:
     def _return_result(self, result: Any) -> None:
         """Return processing result"""
         output = {"output": result}
-        print(json.dumps(output))
+        print(self._codec.dumps_str(output))
 
     def _return_error(self, error: str) -> None:
         """Return error message"""
         error_output = {"error": error}
-        print(json.dumps(error_output))
\ No newline at end of file
+        print(self._codec.dumps_str(error_output))
\ No newline at end of file
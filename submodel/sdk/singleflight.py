@@ -0,0 +1,140 @@
+"""
+Request Coalescing
+~~~~~~~~~~~~~~~~~
+
+In-flight deduplication ("singleflight") of identical idempotent requests.
+
+While a request for a key is running, further callers asking for the same
+key wait for it instead of sending their own request, and all of them get
+the same parsed result. Shared results must be treated as read-only.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+def _freeze(value: Any) -> Hashable:
+    """Turn request parameters into a hashable, order-independent value"""
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, Hashable):
+        return value
+    return repr(value)
+
+def request_key(method: str, url: str, params: Optional[Dict[str, Any]] = None,
+                headers: Optional[Dict[str, str]] = None) -> Tuple:
+    """Build the coalescing key of a request
+
+    Args:
+        method: HTTP method
+        url: Absolute request URL
+        params: Query parameters
+        headers: Extra per-call headers
+
+    Returns:
+        Hashable key identifying the request
+    """
+    return (method.upper(), url, _freeze(params or {}), _freeze(headers or {}))
+
+class _Call:
+    """A request in flight and the callers waiting for it"""
+
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+class SingleFlight:
+    """Thread-safe request coalescing for the sync client"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run ``fn`` once for all concurrent callers with the same key
+
+        Args:
+            key: Request key, see :func:`request_key`
+            fn: Callable sending the request
+
+        Returns:
+            Result of ``fn``, shared by every caller of the flight
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    def stats(self) -> Dict[str, int]:
+        """Get the number of executed and coalesced requests"""
+        return {"executed": self.executed, "coalesced": self.coalesced}
+
+class AsyncSingleFlight:
+    """Request coalescing across tasks of the async client
+
+    The request runs in its own task, so a caller being cancelled does not
+    cancel the request for the other callers waiting on it.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Await ``fn`` once for all concurrent callers with the same key
+
+        Args:
+            key: Request key, see :func:`request_key`
+            fn: Coroutine function sending the request
+
+        Returns:
+            Result of ``fn``, shared by every caller of the flight
+        """
+        task = self._calls.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            self.executed += 1
+            task.add_done_callback(lambda t: self._done(key, t))
+        return await asyncio.shield(task)
+
+    def _done(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()  # Mark retrieved when every caller went away
+
+    def stats(self) -> Dict[str, int]:
+        """Get the number of executed and coalesced requests"""
+        return {"executed": self.executed, "coalesced": self.coalesced}
@@ -0,0 +1,93 @@
+"""
+Timeouts and Deadlines
+~~~~~~~~~~~~~~~~~~~~~
+
+:class:`Timeout` bounds a single request attempt (connecting, waiting for
+data, and in total); :class:`Deadline` bounds a whole call including its
+retries and backoff sleeps. Each attempt's timeout is clipped to the time
+left before the deadline, and retries stop once it has passed.
+"""
+
+import time
+from typing import Optional, Tuple, Union
+
+class Timeout:
+    """Timeouts of a single request attempt, in seconds
+
+    Args:
+        total: Limit on the whole attempt. ``requests`` has no total limit,
+            so sync transports cap the connect and read timeouts at it.
+        connect: Limit on establishing the connection
+        read: Limit on waiting for each chunk of the response
+    """
+
+    __slots__ = ("total", "connect", "read")
+
+    def __init__(self,
+                 total: Optional[float] = None,
+                 connect: Optional[float] = None,
+                 read: Optional[float] = None):
+        self.total = total
+        self.connect = connect
+        self.read = read
+
+    @classmethod
+    def coerce(cls, value: Union["Timeout", float, None]) -> Optional["Timeout"]:
+        """Turn a number of seconds into a total timeout"""
+        if value is None or isinstance(value, Timeout):
+            return value
+        return cls(total=float(value))
+
+    def clip(self, remaining: Optional[float]) -> "Timeout":
+        """Get a copy whose limits all fit into the remaining seconds"""
+        if remaining is None:
+            return self
+        return Timeout(*(remaining if limit is None else min(limit, remaining)
+                         for limit in (self.total, self.connect, self.read)))
+
+    def as_tuple(self) -> Optional[Tuple[Optional[float], Optional[float]]]:
+        """Get the ``(connect, read)`` timeout of ``requests``-style clients"""
+        connect, read = (limit if self.total is None else (self.total if limit is None else min(limit, self.total))
+                         for limit in (self.connect, self.read))
+        if connect is None and read is None:
+            return None
+        return (connect, read)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Timeout):
+            return NotImplemented
+        return (self.total, self.connect, self.read) == (other.total, other.connect, other.read)
+
+    def __repr__(self) -> str:
+        return f"Timeout(total={self.total}, connect={self.connect}, read={self.read})"
+
+#: Timeout of each attempt unless the client or call sets one
+DEFAULT_TIMEOUT = Timeout(connect=10.0, read=300.0)
+
+class Deadline:
+    """Point in time a call, including its retries, must finish by
+
+    Args:
+        seconds: Seconds from now until the deadline
+    """
+
+    __slots__ = ("expires_at",)
+
+    def __init__(self, seconds: float):
+        self.expires_at = time.monotonic() + seconds
+
+    @classmethod
+    def coerce(cls, value: Union["Deadline", float, None]) -> Optional["Deadline"]:
+        """Turn a number of seconds into a deadline starting now"""
+        if value is None or isinstance(value, Deadline):
+            return value
+        return cls(float(value))
+
+    def remaining(self) -> float:
+        """Seconds left, zero once the deadline has passed"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed"""
+        return time.monotonic() >= self.expires_at
@@ -0,0 +1,594 @@
+"""
+HTTP Transport Layer
+~~~~~~~~~~~~~~~~~~~
+
+Pluggable backends the SubModel clients send their requests through.
+
+A transport only moves bytes: it receives a fully prepared request
+(method, absolute URL, headers and ``requests``-style keyword arguments)
+and returns a response exposing ``status_code``, ``headers``, ``content``,
+``json()`` and ``raise_for_status()``. Header building, logging, retries
+and API error mapping stay in the clients.
+
+``stream()`` returns as soon as the headers have arrived, with a
+:class:`StreamedResponse` (or :class:`AsyncStreamedResponse`) whose body is
+read and decompressed chunk by chunk.
+
+Backends:
+    - :class:`RequestsTransport`: sync, pooled ``requests.Session`` (default)
+    - :class:`AiohttpTransport`: async, ``aiohttp`` with a tunable connector (default)
+    - :class:`HTTPXTransport` / :class:`AsyncHTTPXTransport`: optional HTTP/2
+      backends, require ``pip install "httpx[http2]"``
+    - :class:`InMemoryTransport` / :class:`AsyncInMemoryTransport`: no sockets,
+      for tests and for benchmarking SDK overhead
+"""
+
+import asyncio
+import inspect
+import json
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Mapping, Optional, Set, Tuple, Union
+from urllib.parse import urlsplit
+
+import aiohttp
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+
+from .compression import ACCEPT_ENCODING, CompressedBody, accept_encoding
+from .exceptions import HTTPStatusError
+from .timeouts import Timeout
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+_MISSING = object()
+
+class TransportResponse:
+    """Transport-neutral HTTP response
+
+    Args:
+        status_code: HTTP status code
+        headers: Response headers
+        content: Raw response body
+        data: Already decoded JSON body, if the backend decoded it
+    """
+
+    def __init__(self,
+                 status_code: int = 200,
+                 headers: Optional[Mapping[str, str]] = None,
+                 content: Optional[bytes] = None,
+                 data: Any = _MISSING):
+        self.status_code = status_code
+        self.headers = headers if headers is not None else {}
+        self._content = content
+        self._data = data
+
+    @property
+    def content(self) -> bytes:
+        """Raw response body"""
+        if self._content is None:
+            self._content = b"" if self._data is _MISSING else json.dumps(self._data).encode("utf-8")
+        return self._content
+
+    def json(self, loads: Optional[Callable[[bytes], Any]] = None) -> Any:
+        """Decode the response body as JSON
+
+        Args:
+            loads: Decoder to use instead of ``json.loads``
+        """
+        if self._data is _MISSING:
+            self._data = (loads or json.loads)(self.content)
+        return self._data
+
+    def raise_for_status(self) -> None:
+        """Raise HTTPStatusError for 4xx and 5xx responses"""
+        if self.status_code >= 400:
+            raise HTTPStatusError(f"HTTP {self.status_code}", self.status_code, self.headers)
+
+class StreamedResponse:
+    """Response whose body has not been read yet
+
+    Args:
+        status_code: HTTP status code
+        headers: Response headers
+        chunks: Callable taking a chunk size and returning an iterator over
+            the decompressed body
+        close: Callable releasing the connection
+    """
+
+    def __init__(self,
+                 status_code: int,
+                 headers: Mapping[str, str],
+                 chunks: Callable[[int], Iterator[bytes]],
+                 close: Callable[[], None]):
+        self.status_code = status_code
+        self.headers = headers
+        self._chunks = chunks
+        self._close = close
+
+    def iter_bytes(self, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Read the body as it arrives, decompressing each chunk"""
+        return self._chunks(chunk_size)
+
+    def raise_for_status(self) -> None:
+        """Raise HTTPStatusError for 4xx and 5xx responses"""
+        if self.status_code >= 400:
+            raise HTTPStatusError(f"HTTP {self.status_code}", self.status_code, self.headers)
+
+    def close(self) -> None:
+        """Release the connection, discarding any unread body"""
+        self._close()
+
+class AsyncStreamedResponse(StreamedResponse):
+    """Asynchronous variant of :class:`StreamedResponse`
+
+    Args:
+        status_code: HTTP status code
+        headers: Response headers
+        chunks: Callable taking a chunk size and returning an async iterator
+            over the decompressed body
+        close: Callable releasing the connection, may return an awaitable
+    """
+
+    def iter_bytes(self, chunk_size: int = 64 * 1024) -> AsyncIterator[bytes]:
+        """Read the body as it arrives, decompressing each chunk"""
+        return self._chunks(chunk_size)
+
+    async def aclose(self) -> None:
+        """Release the connection, discarding any unread body"""
+        result = self._close()
+        if inspect.isawaitable(result):
+            await result
+
+def _slices(content: bytes, chunk_size: int) -> Iterator[bytes]:
+    for start in range(0, len(content), chunk_size):
+        yield content[start:start + chunk_size]
+
+async def _aslices(content: bytes, chunk_size: int) -> AsyncIterator[bytes]:
+    for chunk in _slices(content, chunk_size):
+        yield chunk
+
+class Transport:
+    """Interface of synchronous transports"""
+
+    #: Exceptions raised by the backend for connection-level failures
+    network_errors: Tuple[type, ...] = ()
+
+    #: Exceptions raised (or wrapped) by the backend when a connection could
+    #: not be established, so the request never reached the server
+    connect_errors: Tuple[type, ...] = ()
+
+    #: Response encodings the backend decodes, advertised by the clients
+    accept_encoding: Optional[str] = ACCEPT_ENCODING
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> Any:
+        """Send a request and return the response
+
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            headers: Request headers
+            **kwargs: ``requests``-style parameters (``params``, ``json``, ``data``, ...)
+        """
+        raise NotImplementedError
+
+    def stream(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> StreamedResponse:
+        """Send a request and return the response once its headers arrive
+
+        The caller reads the body with ``iter_bytes()`` and must ``close()``
+        the response.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support streamed responses")
+
+    def close(self) -> None:
+        """Release resources held by the transport"""
+        pass
+
+class AsyncTransport:
+    """Interface of asynchronous transports"""
+
+    #: Exceptions raised by the backend for connection-level failures
+    network_errors: Tuple[type, ...] = ()
+
+    #: Exceptions raised (or wrapped) by the backend when a connection could
+    #: not be established, so the request never reached the server
+    connect_errors: Tuple[type, ...] = ()
+
+    #: Response encodings the backend decodes, advertised by the clients
+    accept_encoding: Optional[str] = ACCEPT_ENCODING
+
+    def open(self) -> None:
+        """Prepare the transport for use; called from a running event loop"""
+        pass
+
+    async def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> TransportResponse:
+        """Send a request and return the fully read response
+
+        Backends may raise their own HTTP status error before reading the
+        body; otherwise the caller checks ``raise_for_status()``.
+
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            headers: Request headers
+            **kwargs: ``requests``-style parameters (``params``, ``json``, ``data``, ...),
+                plus ``raw_body=True`` to get the body as received in
+                ``content`` from backends that otherwise decode it
+        """
+        raise NotImplementedError
+
+    async def stream(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> AsyncStreamedResponse:
+        """Send a request and return the response once its headers arrive
+
+        The caller reads the body with ``iter_bytes()`` and must ``aclose()``
+        the response.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support streamed responses")
+
+    async def aclose(self) -> None:
+        """Release resources held by the transport"""
+        pass
+
+def _urllib3_accept_encoding() -> str:
+    """Encodings urllib3 decodes, as it advertises them itself"""
+    from urllib3.util.request import ACCEPT_ENCODING as supported
+    names = {name.strip() for name in supported.split(",")}
+    return accept_encoding(has_zstd="zstd" in names, has_brotli="br" in names)
+
+def _aiohttp_accept_encoding() -> str:
+    """Encodings aiohttp decodes: zstd from 3.12, brotli with brotli or brotlicffi"""
+    try:
+        from aiohttp import compression_utils as support
+    except ImportError:  # pragma: no cover - aiohttp < 3.9
+        from aiohttp import http_parser as support
+    return accept_encoding(has_zstd=getattr(support, "HAS_ZSTD", False),
+                           has_brotli=getattr(support, "HAS_BROTLI", False))
+
+def create_session(pool_connections: int = 10,
+                   pool_maxsize: int = 10,
+                   pool_block: bool = False) -> requests.Session:
+    """Create a keep-alive HTTP session with a sized connection pool
+
+    The returned session can be passed to several clients so they share
+    one connection pool.
+
+    Args:
+        pool_connections: Number of host pools to cache
+        pool_maxsize: Maximum number of connections kept per host
+        pool_block: Whether to block when the pool has no free connection
+
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections,
+                          pool_maxsize=pool_maxsize,
+                          pool_block=pool_block)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+class RequestsTransport(Transport):
+    """Synchronous transport backed by a pooled ``requests.Session``
+
+    Args:
+        session: Shared session to send requests with. The transport does
+            not close a session it was given.
+        pool_connections: Number of host pools of the transport-owned session
+        pool_maxsize: Maximum keep-alive connections per host
+        pool_block: Whether the pool blocks when exhausted
+    """
+
+    network_errors = (requests.RequestException,)
+    accept_encoding = _urllib3_accept_encoding()
+    connect_errors = (requests.exceptions.ConnectTimeout, urllib3.exceptions.NewConnectionError)
+
+    def __init__(self,
+                 session: Optional[requests.Session] = None,
+                 pool_connections: int = 10,
+                 pool_maxsize: int = 10,
+                 pool_block: bool = False):
+        self._owns_session = session is None
+        self.session = session or create_session(pool_connections, pool_maxsize, pool_block)
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> requests.Response:
+        if isinstance(kwargs.get("timeout"), Timeout):
+            kwargs["timeout"] = kwargs["timeout"].as_tuple()
+        return self.session.request(method, url, headers=headers, **kwargs)
+
+    def stream(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> StreamedResponse:
+        response = self.request(method, url, headers=headers, stream=True, **kwargs)
+        return StreamedResponse(response.status_code, response.headers, response.iter_content, response.close)
+
+    def close(self) -> None:
+        if self._owns_session:
+            self.session.close()
+
+class AiohttpTransport(AsyncTransport):
+    """Asynchronous transport backed by ``aiohttp`` with a tunable connector
+
+    The session is created lazily on first use and shared by every
+    coroutine on the loop. Creation involves no await, so coroutines racing
+    on first use all end up with the same session. The transport serves one
+    loop at a time: when it is used from another loop (e.g. a second
+    ``asyncio.run()``), the previous session is closed and replaced.
+
+    Args:
+        limit: Maximum number of simultaneous connections (0 for no limit)
+        limit_per_host: Maximum simultaneous connections per host (0 for no limit)
+        dns_cache_ttl: Seconds to cache resolved DNS entries, None to cache forever
+        keepalive_timeout: Seconds an idle connection is kept open for reuse
+        raw_body: Return the body undecoded so the client can decode it
+            with its own JSON codec
+    """
+
+    network_errors = (aiohttp.ClientError, asyncio.TimeoutError)
+    accept_encoding = _aiohttp_accept_encoding()
+    connect_errors = (aiohttp.ClientConnectorError,
+                      getattr(aiohttp, "ConnectionTimeoutError", aiohttp.ClientConnectorError))
+
+    def __init__(self,
+                 limit: int = 100,
+                 limit_per_host: int = 0,
+                 dns_cache_ttl: Optional[int] = 10,
+                 keepalive_timeout: float = 15.0,
+                 raw_body: bool = False):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.raw_body = raw_body
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._session_loop = None
+        self._closing: Set["asyncio.Future[None]"] = set()
+
+    def _create_connector(self) -> aiohttp.TCPConnector:
+        """Create the transport-owned TCP connector"""
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=self.dns_cache_ttl,
+            keepalive_timeout=self.keepalive_timeout,
+        )
+
+    def open(self) -> aiohttp.ClientSession:
+        """Get the shared session, creating it on first use"""
+        loop = asyncio.get_running_loop()
+        if self.session is None or self.session.closed or self._session_loop is not loop:
+            if self.session is not None:
+                self._discard_session()
+            self.session = aiohttp.ClientSession(connector=self._create_connector())
+            self._session_loop = loop
+        return self.session
+
+    def _discard_session(self) -> None:
+        """Close the session of the previous loop without awaiting on the current one"""
+        session, loop = self.session, self._session_loop
+        self.session = None
+        self._session_loop = None
+        if session.closed:
+            return
+        if loop.is_running():
+            # Still running in another thread, which must close it
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+            return
+        # The old loop cannot run the close any more, so this one does; kept
+        # referenced until done so the task is not collected half-way
+        task = asyncio.ensure_future(session.close())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    def _request_kwargs(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        timeout = kwargs.get("timeout")
+        if isinstance(timeout, Timeout):
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout.total, sock_connect=timeout.connect, sock_read=timeout.read)
+        return kwargs
+
+    async def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> TransportResponse:
+        session = self.open()
+        raw_body = kwargs.pop("raw_body", self.raw_body)
+        async with session.request(method, url, headers=headers, **self._request_kwargs(kwargs)) as response:
+            response.raise_for_status()
+            if raw_body:
+                return TransportResponse(response.status, response.headers, content=await response.read())
+            data = None if response.status == 304 else await response.json()
+            return TransportResponse(response.status, response.headers, data=data)
+
+    async def stream(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> AsyncStreamedResponse:
+        response = await self.open().request(method, url, headers=headers, **self._request_kwargs(kwargs))
+        return AsyncStreamedResponse(response.status, response.headers, response.content.iter_chunked, response.release)
+
+    async def aclose(self) -> None:
+        if self.session:
+            await self.session.close()
+        self.session = None
+        self._session_loop = None
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+
+def _httpx_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Translate ``requests``-style keyword arguments to httpx ones"""
+    kwargs = dict(kwargs)
+    if isinstance(kwargs.get("data"), (bytes, bytearray, CompressedBody)):
+        kwargs["content"] = kwargs.pop("data")
+    timeout = kwargs.get("timeout")
+    if isinstance(timeout, Timeout):
+        connect, read = timeout.as_tuple() or (None, None)
+        kwargs["timeout"] = httpx.Timeout(None, connect=connect, read=read)
+    return kwargs
+
+def _httpx_accept_encoding() -> str:
+    """Encodings httpx decodes: it uses zstandard rather than backports.zstd"""
+    return accept_encoding(has_zstd=zstandard is not None)
+
+def _require_httpx() -> None:
+    if httpx is None:
+        raise ImportError(
+            "The HTTP/2 transport requires httpx. "
+            "Install it with: pip install \"httpx[http2]\""
+        )
+
+class HTTPXTransport(Transport):
+    """Synchronous HTTP/2 transport backed by ``httpx.Client``
+
+    Args:
+        http2: Negotiate HTTP/2 with the server
+        max_connections: Maximum number of simultaneous connections
+        max_keepalive_connections: Maximum idle connections kept for reuse
+        keepalive_expiry: Seconds an idle connection is kept open
+        transport: httpx transport to send requests through instead of the
+            network, e.g. ``httpx.MockTransport`` in tests
+    """
+
+    def __init__(self,
+                 http2: bool = True,
+                 max_connections: int = 100,
+                 max_keepalive_connections: int = 20,
+                 keepalive_expiry: float = 15.0,
+                 transport: Any = None):
+        _require_httpx()
+        self.network_errors = (httpx.TransportError, HTTPStatusError)
+        self.connect_errors = (httpx.ConnectError, httpx.ConnectTimeout)
+        self.accept_encoding = _httpx_accept_encoding()
+        limits = httpx.Limits(max_connections=max_connections,
+                              max_keepalive_connections=max_keepalive_connections,
+                              keepalive_expiry=keepalive_expiry)
+        self.client = httpx.Client(http2=http2, limits=limits, transport=transport)
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> TransportResponse:
+        response = self.client.request(method, url, headers=headers, **_httpx_kwargs(kwargs))
+        return TransportResponse(response.status_code, response.headers, content=response.content)
+
+    def stream(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> StreamedResponse:
+        request = self.client.build_request(method, url, headers=headers, **_httpx_kwargs(kwargs))
+        response = self.client.send(request, stream=True)
+        return StreamedResponse(response.status_code, response.headers, response.iter_bytes, response.close)
+
+    def close(self) -> None:
+        self.client.close()
+
+class AsyncHTTPXTransport(AsyncTransport):
+    """Asynchronous HTTP/2 transport backed by ``httpx.AsyncClient``
+
+    Args:
+        http2: Negotiate HTTP/2 with the server
+        max_connections: Maximum number of simultaneous connections
+        max_keepalive_connections: Maximum idle connections kept for reuse
+        keepalive_expiry: Seconds an idle connection is kept open
+        transport: httpx transport to send requests through instead of the
+            network, e.g. ``httpx.MockTransport`` in tests
+    """
+
+    def __init__(self,
+                 http2: bool = True,
+                 max_connections: int = 100,
+                 max_keepalive_connections: int = 20,
+                 keepalive_expiry: float = 15.0,
+                 transport: Any = None):
+        _require_httpx()
+        self.network_errors = (httpx.TransportError, asyncio.TimeoutError, HTTPStatusError)
+        self.connect_errors = (httpx.ConnectError, httpx.ConnectTimeout)
+        self.accept_encoding = _httpx_accept_encoding()
+        self.http2 = http2
+        self.limits = httpx.Limits(max_connections=max_connections,
+                                   max_keepalive_connections=max_keepalive_connections,
+                                   keepalive_expiry=keepalive_expiry)
+        self.transport = transport
+        self.client = None
+
+    def open(self) -> Any:
+        if self.client is None or self.client.is_closed:
+            self.client = httpx.AsyncClient(http2=self.http2, limits=self.limits, transport=self.transport)
+        return self.client
+
+    async def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> TransportResponse:
+        kwargs.pop("raw_body", None)  # The body is always kept as received
+        response = await self.open().request(method, url, headers=headers, **_httpx_kwargs(kwargs))
+        return TransportResponse(response.status_code, response.headers, content=response.content)
+
+    async def stream(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> AsyncStreamedResponse:
+        client = self.open()
+        request = client.build_request(method, url, headers=headers, **_httpx_kwargs(kwargs))
+        response = await client.send(request, stream=True)
+        return AsyncStreamedResponse(response.status_code, response.headers, response.aiter_bytes, response.aclose)
+
+    async def aclose(self) -> None:
+        if self.client is not None:
+            await self.client.aclose()
+        self.client = None
+
+Handler = Callable[..., Any]
+RouteResponse = Union[Dict[str, Any], TransportResponse, Handler]
+
+class InMemoryTransport(Transport):
+    """Transport answering requests from registered routes without sockets
+
+    Routes are matched on the HTTP method and the end of the URL path, so
+    ``add_route("GET", "inst/list", ...)`` answers requests to
+    ``{base_url}/inst/list``. A route answer is either a JSON-serializable
+    object (returned with status 200), a :class:`TransportResponse`, or a
+    callable ``(method, url, headers, **kwargs)`` returning one of those.
+
+    Args:
+        handler: Fallback callable for requests no route matches
+    """
+
+    network_errors = (HTTPStatusError,)
+
+    def __init__(self, handler: Optional[Handler] = None):
+        self.handler = handler
+        self.routes: Dict[Tuple[str, str], RouteResponse] = {}
+        self.calls: List[Tuple[str, str, Dict[str, Any]]] = []
+
+    def add_route(self, method: str, path: str, response: RouteResponse) -> None:
+        """Register the answer for ``method`` requests to ``path``"""
+        self.routes[(method.upper(), path.strip("/"))] = response
+
+    def _match(self, method: str, url: str) -> Optional[RouteResponse]:
+        path = urlsplit(url).path.strip("/")
+        for (route_method, route_path), response in self.routes.items():
+            if route_method == method and (path == route_path or path.endswith("/" + route_path)):
+                return response
+        return self.handler
+
+    def _dispatch(self, method: str, url: str, headers: Optional[Dict[str, str]], **kwargs) -> TransportResponse:
+        method = method.upper()
+        kwargs.pop("timeout", None)
+        kwargs.pop("raw_body", None)
+        self.calls.append((method, url, kwargs))
+        answer = self._match(method, url)
+        if answer is None:
+            return TransportResponse(404, data={"code": 40400, "message": f"No route for {method} {url}"})
+        if callable(answer):
+            answer = answer(method, url, headers or {}, **kwargs)
+        if isinstance(answer, TransportResponse):
+            return answer
+        return TransportResponse(200, {"Content-Type": "application/json"}, data=answer)
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> TransportResponse:
+        return self._dispatch(method, url, headers, **kwargs)
+
+    def stream(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> StreamedResponse:
+        response = self._dispatch(method, url, headers, **kwargs)
+        content = response.content
+        return StreamedResponse(response.status_code, response.headers,
+                                lambda chunk_size: _slices(content, chunk_size), lambda: None)
+
+class AsyncInMemoryTransport(InMemoryTransport, AsyncTransport):
+    """Asynchronous variant of :class:`InMemoryTransport`"""
+
+    async def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> TransportResponse:
+        return self._dispatch(method, url, headers, **kwargs)
+
+    async def stream(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> AsyncStreamedResponse:
+        response = self._dispatch(method, url, headers, **kwargs)
+        content = response.content
+        return AsyncStreamedResponse(response.status_code, response.headers,
+                                     lambda chunk_size: _aslices(content, chunk_size), lambda: None)
@@ -1,18 +1,27 @@
+import atexit
 import logging
 import json
+import queue
+import random
+import sys
 import time
-from typing import Any, Dict, Optional, Callable, Type, Union
+import warnings
+from email.utils import parsedate_to_datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, List, Mapping, Optional, Callable, Type, Union
 from functools import wraps
 from requests.exceptions import RequestException
 
-# Configure logging
+# The SDK only emits records; applications decide where they go (see configure_logging)
 logger = logging.getLogger("submodel")
-handler = logging.StreamHandler()
-handler.setFormatter(logging.Formatter(
-    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-))
+handler = logging.NullHandler()
 logger.addHandler(handler)
-logger.setLevel(logging.INFO)
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Body logging settings, see set_body_logging()
+_body_sample_rate = 1.0
+_max_body_length: Optional[int] = 2048
 
 def set_log_level(level: int) -> None:
     """Set logging level
@@ -21,29 +30,230 @@ def set_log_level(level: int) -> None:
         level: Log level, e.g., logging.DEBUG, logging.INFO, etc.
     """
     logger.setLevel(level)
-    handler.setLevel(level)
+
+def set_body_logging(sample_rate: float = 1.0, max_length: Optional[int] = 2048) -> None:
+    """Configure how request and response bodies are logged at DEBUG level
+    
+    Args:
+        sample_rate: Share of bodies logged, from 0 (none) to 1 (all)
+        max_length: Characters of each body logged, None for no limit
+    """
+    global _body_sample_rate, _max_body_length
+    _body_sample_rate = sample_rate
+    _max_body_length = max_length
+
+def _sample_body() -> bool:
+    """Decide whether to log a body according to the sample rate"""
+    return _body_sample_rate >= 1.0 or (_body_sample_rate > 0 and random.random() < _body_sample_rate)
+
+def _format_body(body: Any) -> str:
+    """Serialize a body for logging, truncated to the configured length
+    
+    Large bodies are never serialized in full: strings are cut before they
+    are encoded and containers are encoded incrementally until the limit.
+    """
+    if _max_body_length is None:
+        return json.dumps(body, ensure_ascii=False, default=str)
+    if isinstance(body, str):
+        if len(body) <= _max_body_length:
+            return json.dumps(body, ensure_ascii=False)
+        text = json.dumps(body[:_max_body_length], ensure_ascii=False)[:_max_body_length]
+        return f"{text}... ({len(body) - _max_body_length} more characters)"
+    chunks = []
+    length = 0
+    for chunk in json.JSONEncoder(ensure_ascii=False, default=str).iterencode(body):
+        chunks.append(chunk)
+        length += len(chunk)
+        if length > _max_body_length:
+            text = "".join(chunks)[:_max_body_length]
+            size = f" of length {len(body)}" if isinstance(body, (dict, list, tuple)) else ""
+            return f"{text}... (truncated {type(body).__name__}{size})"
+    return "".join(chunks)
 
 def log_request(method: str, url: str, **kwargs) -> None:
     """Log HTTP request
     
+    Does nothing unless DEBUG logging is enabled; bodies are sampled and
+    truncated according to set_body_logging().
+    
     Args:
         method: HTTP method
         url: Request URL
         **kwargs: Request parameters
     """
-    logger.debug(f"Request: {method} {url}")
-    if "json" in kwargs:
-        logger.debug(f"Request Body: {json.dumps(kwargs['json'], ensure_ascii=False)}")
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    logger.debug("Request: %s %s", method, url)
+    if "json" in kwargs and _sample_body():
+        logger.debug("Request Body: %s", _format_body(kwargs["json"]))
     if "params" in kwargs:
-        logger.debug(f"Request Params: {kwargs['params']}")
+        logger.debug("Request Params: %s", kwargs["params"])
 
 def log_response(response_data: Dict[str, Any]) -> None:
     """Log API response
     
+    Does nothing unless DEBUG logging is enabled; bodies are sampled and
+    truncated according to set_body_logging().
+    
     Args:
         response_data: API response data
     """
-    logger.debug(f"Response: {json.dumps(response_data, ensure_ascii=False)}")
+    if logger.isEnabledFor(logging.DEBUG) and _sample_body():
+        logger.debug("Response: %s", _format_body(response_data))
+
+class _DroppingQueueHandler(QueueHandler):
+    """Queue handler that drops records instead of blocking when the queue is full"""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+_queue_listener: Optional[QueueListener] = None
+_replaced_handlers: List[logging.Handler] = []
+
+def enable_async_logging(*handlers: logging.Handler, queue_size: int = 10000) -> QueueListener:
+    """Write SDK log records from a background thread
+    
+    Records are put on a queue and written by a QueueListener thread, so a
+    slow sink (console, file, network) never blocks request threads or the
+    event loop. Records are dropped, not waited for, if the queue is full.
+    
+    Args:
+        *handlers: Handlers the listener writes to. Defaults to the
+            handlers currently attached to the SDK logger, or stderr if
+            there are none.
+        queue_size: Maximum number of records waiting to be written
+        
+    Returns:
+        The running listener
+    """
+    global _queue_listener, _replaced_handlers
+    disable_async_logging()
+    _replaced_handlers = list(logger.handlers)
+    targets = handlers or [h for h in _replaced_handlers if not isinstance(h, logging.NullHandler)] or [_stderr_handler()]
+    log_queue: queue.Queue = queue.Queue(queue_size)
+    _queue_listener = QueueListener(log_queue, *targets, respect_handler_level=True)
+    for existing in _replaced_handlers:
+        logger.removeHandler(existing)
+    logger.addHandler(_DroppingQueueHandler(log_queue))
+    _queue_listener.start()
+    return _queue_listener
+
+def disable_async_logging() -> None:
+    """Flush queued records, stop the background thread and restore the handlers"""
+    global _queue_listener, _replaced_handlers
+    if _queue_listener is None:
+        return
+    _queue_listener.stop()
+    for existing in list(logger.handlers):
+        if isinstance(existing, _DroppingQueueHandler):
+            logger.removeHandler(existing)
+    for previous in _replaced_handlers:
+        logger.addHandler(previous)
+    _queue_listener, _replaced_handlers = None, []
+
+atexit.register(disable_async_logging)
+
+class _StderrHandler(logging.StreamHandler):
+    """Stream handler writing to whatever ``sys.stderr`` is at the time"""
+
+    def __init__(self):
+        super().__init__()
+        self.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    @property
+    def stream(self):
+        return sys.stderr
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+def _stderr_handler() -> logging.Handler:
+    return _StderrHandler()
+
+_configured_handler: Optional[logging.Handler] = None
+
+def configure_logging(level: int = logging.INFO,
+                      handler: Optional[logging.Handler] = None,
+                      background: bool = True) -> logging.Handler:
+    """Output the SDK's log messages
+    
+    Attaches a handler to the ``submodel`` logger and stops its records
+    from also reaching the root logger, so messages are not duplicated when
+    the application configures logging too. Calling it again replaces the
+    previous configuration.
+    
+    Args:
+        level: Log level of the SDK logger
+        handler: Handler to write to, defaults to stderr
+        background: Write records from a queue listener thread, so retry
+            and error messages never block request threads or the event loop
+        
+    Returns:
+        The handler records are written to
+    """
+    global _configured_handler
+    disable_async_logging()
+    if _configured_handler is not None:
+        logger.removeHandler(_configured_handler)
+    _configured_handler = handler or _stderr_handler()
+    logger.addHandler(_configured_handler)
+    logger.propagate = False
+    set_log_level(level)
+    if background:
+        enable_async_logging(_configured_handler)
+    return _configured_handler
+
+def get_http_status(error: BaseException) -> Optional[int]:
+    """Get the HTTP status code carried by a transport exception
+    
+    Args:
+        error: Exception raised by requests, aiohttp, httpx or a SubModel transport
+        
+    Returns:
+        HTTP status code, None if the exception has none
+    """
+    response = getattr(error, "response", None)
+    for source, attr in ((error, "status_code"), (error, "status"), (response, "status_code")):
+        status = getattr(source, attr, None)
+        if isinstance(status, int):
+            return status
+    return None
+
+def get_error_headers(error: BaseException) -> Mapping[str, str]:
+    """Get the response headers carried by a transport exception"""
+    headers = getattr(error, "headers", None)
+    if headers is None:
+        headers = getattr(getattr(error, "response", None), "headers", None)
+    return headers if isinstance(headers, Mapping) else {}
+
+def parse_retry_after(headers: Optional[Mapping[str, str]]) -> Optional[float]:
+    """Parse a Retry-After header
+    
+    Args:
+        headers: Response headers
+        
+    Returns:
+        Seconds to wait, None if the header is missing or invalid
+    """
+    value = headers.get("Retry-After") if headers else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
 
 def validate_params(params: Dict[str, Any], required: Dict[str, type]) -> None:
     """Validate parameters
@@ -81,19 +291,30 @@ def retry(
     max_retries: int = 3,
     delay: float = 0.5,
     retryable_exceptions: Union[Type[Exception], tuple] = Exception,
-    backoff_factor: float = 2
+    backoff_factor: float = 2,
+    non_retryable_exceptions: Union[Type[Exception], tuple] = ()
 ) -> Callable:
     """Retry decorator
+
+    .. deprecated::
+        The clients retry through :class:`~submodel.sdk.retries.RetryPolicy`,
+        which also honours ``Retry-After``, a retry budget and whether the
+        request is safe to repeat. This decorator retries whatever it wraps
+        and will be removed in a future release.
     
     Args:
         max_retries: Maximum number of retry attempts
         delay: Initial delay time (seconds)
         retryable_exceptions: Exception types that should trigger a retry
         backoff_factor: Multiplier for delay time between retries
+        non_retryable_exceptions: Exception types re-raised immediately even
+            if they are also retryable
         
     Returns:
         Decorated function
     """
+    warnings.warn("submodel.sdk.utils.retry is deprecated, use RetryPolicy instead",
+                  DeprecationWarning, stacklevel=2)
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
@@ -101,14 +322,16 @@ def retry(
             for attempt in range(max_retries + 1):  # +1 includes the initial attempt
                 try:
                     return func(*args, **kwargs)
+                except non_retryable_exceptions:
+                    raise
                 except retryable_exceptions as e:
                     last_exception = e
                     if attempt == max_retries:  # This is the last attempt
-                        logger.error(f"Maximum retry attempts exceeded ({max_retries})")
+                        logger.error("Maximum retry attempts exceeded (%d)", max_retries)
                         raise last_exception
                     
                     retry_delay = delay * (backoff_factor ** attempt)
-                    logger.warning(f"Request failed ({str(e)}), retrying in {retry_delay:.2f} seconds (attempt {attempt + 1})")
+                    logger.warning("Request failed (%s), retrying in %.2f seconds (attempt %d)", e, retry_delay, attempt + 1)
                     time.sleep(retry_delay)
             
             if last_exception:
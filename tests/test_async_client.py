@@ -14,6 +14,7 @@ class TestAsyncClient(unittest.IsolatedAsyncioTestCase):
     async def asyncTearDown(self):
         """Async cleanup method"""
         await self.client.__aexit__(None, None, None)
+        await self.client.aclose()
 
     @patch('aiohttp.ClientSession.request')
     async def test_authentication_error(self, mock_request):
@@ -103,7 +104,7 @@ class TestAsyncClient(unittest.IsolatedAsyncioTestCase):
         mock_request.return_value = mock_context
 
         # Create new client using context manager
-        async with create_async_client(token="test-token") as client:
+        async with create_async_client(token="test-token", close_on_exit=True) as client:
             result = await client.get("test/endpoint")
             self.assertEqual(result["code"], 20000)
             self.assertTrue(client._session is not None)
@@ -161,14 +162,77 @@ class TestAsyncClient(unittest.IsolatedAsyncioTestCase):
     
     @patch('aiohttp.ClientSession.request')
     async def test_request_without_session(self, mock_request):
-        """Test request when session is not initialized"""
+        """Test session is created lazily when the context manager is not used"""
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.json = AsyncMock(return_value={"code": 20000})
+        mock_response.raise_for_status = Mock()
+        
+        mock_context = AsyncMock()
+        mock_context.__aenter__.return_value = mock_response
+        mock_request.return_value = mock_context
+
         client = AsyncSubModelClient(token="test-token")
-        # Don't enter context manager to keep _session as None
+        self.assertIsNone(client._session)
         
-        with self.assertRaises(RuntimeError) as context:
-            await client.get("test/endpoint")
+        result = await client.get("test/endpoint")
+        self.assertEqual(result["code"], 20000)
+        self.assertIsNotNone(client._session)
         
-        self.assertIn("Client not initialized", str(context.exception))
+        await client.aclose()
+        self.assertIsNone(client._session)
+    
+    async def test_connector_configuration(self):
+        """Test the client-owned connector uses the configured limits"""
+        client = AsyncSubModelClient(
+            token="test-token",
+            connector_limit=20,
+            connector_limit_per_host=5,
+            dns_cache_ttl=60,
+            keepalive_timeout=30.0,
+        )
+        async with client:
+            connector = client._session.connector
+            self.assertEqual(connector.limit, 20)
+            self.assertEqual(connector.limit_per_host, 5)
+            self.assertTrue(connector.use_dns_cache)
+    
+    async def test_session_kept_across_entries(self):
+        """Test warm session survives context exits by default"""
+        client = AsyncSubModelClient(token="test-token")
+        
+        async with client:
+            session = client._session
+        async with client:
+            self.assertIs(client._session, session)
+        self.assertFalse(session.closed)
+        
+        await client.aclose()
+        self.assertTrue(session.closed)
+        self.assertIsNone(client._session)
+    
+    async def test_nested_entries_close_once(self):
+        """Test leaving an inner context does not close the outer session"""
+        client = AsyncSubModelClient(token="test-token", close_on_exit=True)
+        
+        async with client:
+            session = client._session
+            async with client:
+                pass
+            self.assertFalse(session.closed)
+        self.assertTrue(session.closed)
+    
+    async def test_concurrent_lazy_session(self):
+        """Test concurrent first requests share one session"""
+        client = AsyncSubModelClient(token="test-token")
+        
+        async def grab():
+            await asyncio.sleep(0)
+            return client.transport.open()
+        
+        sessions = await asyncio.gather(*(grab() for _ in range(10)))
+        self.assertEqual(len({id(s) for s in sessions}), 1)
+        await client.aclose()
     
     @patch('aiohttp.ClientSession.request')
     async def test_retry_mechanism_with_timeout(self, mock_request):
@@ -208,7 +272,7 @@ class TestAsyncClient(unittest.IsolatedAsyncioTestCase):
     async def test_retry_mechanism_max_retries_exceeded(self, mock_request):
         """Test retry mechanism when max retries exceeded"""
         # Create client with fewer retries for faster test
-        async with AsyncSubModelClient(token="test-token", max_retries=1) as client:
+        async with AsyncSubModelClient(token="test-token", close_on_exit=True, max_retries=1) as client:
             # Mock all requests to fail
             mock_request.side_effect = aiohttp.ClientError("Connection failed")
             
@@ -355,7 +419,7 @@ class TestAsyncClient(unittest.IsolatedAsyncioTestCase):
     
     async def test_session_cleanup_on_exception(self):
         """Test that session is cleaned up even when exception occurs in context"""
-        client = AsyncSubModelClient(token="test-token")
+        client = AsyncSubModelClient(token="test-token", close_on_exit=True)
         
         try:
             async with client:
@@ -367,5 +431,26 @@ class TestAsyncClient(unittest.IsolatedAsyncioTestCase):
         # Session should be cleaned up
         self.assertIsNone(client._session)
 
+class TestSessionAcrossLoops(unittest.TestCase):
+    def test_session_of_finished_loop_closed(self):
+        """Test using the client from a new event loop closes the old loop's session"""
+        client = AsyncSubModelClient(token="test-token", close_on_exit=False)
+
+        async def open_session():
+            return client.transport.open()
+
+        async def reopen_and_close():
+            session = client.transport.open()
+            await client.aclose()
+            return session
+
+        first = asyncio.run(open_session())
+        second = asyncio.run(reopen_and_close())
+
+        self.assertIsNot(first, second)
+        self.assertTrue(first.closed)
+        self.assertTrue(second.closed)
+        self.assertEqual(client.transport._closing, set())
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
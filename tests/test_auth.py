@@ -2,12 +2,14 @@ import unittest
 from unittest.mock import patch, MagicMock
 from submodel.sdk.client import create_client
 from submodel.sdk.exceptions import AuthenticationError
+from submodel.sdk.async_client import AsyncSubModelClient
+from submodel.sdk.transport import AsyncInMemoryTransport
 
 class TestAuth(unittest.TestCase):
     def setUp(self):
         self.client = create_client(token="test-token", api_key="test-key")
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_register(self, mock_request):
         """Test registration functionality"""
         mock_response = MagicMock()
@@ -30,7 +32,7 @@ class TestAuth(unittest.TestCase):
         self.assertEqual(kwargs["json"]["username"], "testuser")
         self.assertEqual(kwargs["json"]["password"], "testpass")
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_login(self, mock_request):
         """Test login functionality"""
         mock_response = MagicMock()
@@ -48,7 +50,7 @@ class TestAuth(unittest.TestCase):
         self.assertEqual(result["code"], 20000)
         self.assertEqual(result["data"]["token"], "test-token")
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_get_user_info(self, mock_request):
         """Test getting user information"""
         mock_response = MagicMock()
@@ -67,7 +69,7 @@ class TestAuth(unittest.TestCase):
         self.assertEqual(result["code"], 20000)
         self.assertEqual(result["data"]["username"], "testuser")
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_authentication_error(self, mock_request):
         """Test authentication error handling"""
         mock_response = MagicMock()
@@ -82,7 +84,7 @@ class TestAuth(unittest.TestCase):
             self.client.auth.get_user_info()
         self.assertEqual(str(context.exception), "Authentication failed")
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_api_key_operations(self, mock_request):
         """Test API Key related operations"""
         # 测试生成 API Key
@@ -114,5 +116,21 @@ class TestAuth(unittest.TestCase):
         result = self.client.auth.active_api_key("key1", True)
         self.assertEqual(result["code"], 20000)
 
+class TestAsyncAuth(unittest.IsolatedAsyncioTestCase):
+    async def test_auth_calls(self):
+        """Test async auth calls and error handling"""
+        transport = AsyncInMemoryTransport()
+        transport.add_route("POST", "user/login", {"code": 20000, "data": {"token": "t"}})
+        transport.add_route("GET", "user/active_api_key/key1/true", {"code": 20000})
+        transport.add_route("GET", "user/info", {"code": 40100, "message": "Unauthorized"})
+        client = AsyncSubModelClient(token="test-token", transport=transport)
+
+        result = await client.auth.login("user", "pass")
+        self.assertEqual(result["data"]["token"], "t")
+        self.assertEqual(transport.calls[-1][2]["json"], {"username": "user", "password": "pass"})
+        self.assertEqual((await client.auth.active_api_key("key1", True))["code"], 20000)
+        with self.assertRaises(AuthenticationError):
+            await client.auth.get_user_info()
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
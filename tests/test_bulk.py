@@ -0,0 +1,196 @@
+import asyncio
+import io
+import threading
+import time
+import unittest
+from unittest.mock import patch
+from submodel.sdk.async_client import AsyncSubModelClient
+from submodel.sdk.bulk import BulkResult, arun_many, run_many
+from submodel.sdk.client import SubModelClient
+from submodel.sdk.exceptions import ResourceNotFoundError, ServerError
+from submodel.sdk.transport import AsyncInMemoryTransport, InMemoryTransport
+
+def action_route(failures):
+    """Route failing each instance the given number of times, or always for 404s"""
+    attempts = {}
+    lock = threading.Lock()
+
+    def handler(method, url, headers, **kwargs):
+        inst_id = url.rstrip("/").rsplit("/", 1)[-1]
+        with lock:
+            attempts[inst_id] = attempts.get(inst_id, 0) + 1
+            count = attempts[inst_id]
+        if failures.get(inst_id) == "missing":
+            return {"code": 40400, "message": f"{inst_id} not found"}
+        if count <= failures.get(inst_id, 0):
+            return {"code": 50000, "message": "busy"}
+        return {"code": 20000, "data": {"inst_id": inst_id, "params": kwargs.get("json")}}
+    return handler, attempts
+
+class TestRunMany(unittest.TestCase):
+    def test_collects_every_outcome(self):
+        """Test results and errors are collected per ID in request order"""
+        def call(key):
+            time.sleep(0.001 * (5 - key))  # Later IDs finish first
+            if key % 2:
+                raise ServerError(f"failed {key}", 50000)
+            return key * 10
+
+        result = run_many(call, [0, 1, 2, 3, 4, 2, 0], concurrency=4)
+        self.assertEqual(list(result.results.items()), [(0, 0), (2, 20), (4, 40)])
+        self.assertEqual(list(result.errors), [1, 3])
+        self.assertIsInstance(result.errors[1], ServerError)
+        self.assertFalse(result.ok)
+        self.assertEqual(len(result), 5)
+
+    def test_concurrency_bound(self):
+        """Test no more than ``concurrency`` calls run at once"""
+        in_flight, peak = 0, 0
+        lock = threading.Lock()
+
+        def call(key):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+
+        self.assertTrue(run_many(call, range(20), concurrency=3).ok)
+        self.assertEqual(peak, 3)
+
+    def test_progress(self):
+        """Test progress is reported to a callback and to a tqdm bar"""
+        seen = []
+        run_many(lambda key: key, range(4), progress=lambda done, total: seen.append((done, total)))
+        self.assertEqual(seen, [(1, 4), (2, 4), (3, 4), (4, 4)])
+
+        stderr = io.StringIO()
+        with patch("sys.stderr", stderr):
+            run_many(lambda key: key, range(4), progress=True, desc="stop")
+        self.assertIn("stop", stderr.getvalue())
+        self.assertIn("4/4", stderr.getvalue())
+
+class TestControlMany(unittest.TestCase):
+    def test_control_many(self):
+        """Test each instance is retried on its own and failures do not stop the rest"""
+        handler, attempts = action_route({"i2": 1, "i3": "missing"})
+        transport = InMemoryTransport(handler)
+        client = SubModelClient(token="test-token", transport=transport, backoff_factor=0.001)
+
+        result = client.instance.control_many("stop", ["i1", "i2", "i3", "i1"], concurrency=2, force=True)
+        self.assertIsInstance(result, BulkResult)
+        self.assertEqual(list(result.results), ["i1", "i2"])
+        self.assertEqual(result.results["i2"]["data"], {"inst_id": "i2", "params": {"force": True}})
+        self.assertIsInstance(result.errors["i3"], ResourceNotFoundError)
+        self.assertEqual(attempts, {"i1": 1, "i2": 2, "i3": 1})
+
+    def test_remote_cmd_not_resent(self):
+        """Test a command that may have run is not sent again after a server error"""
+        handler, attempts = action_route({"i1": 1})
+        client = SubModelClient(token="test-token", transport=InMemoryTransport(handler), backoff_factor=0.001)
+
+        result = client.instance.control_many("remote_cmd", ["i1", "i2"], cmd="reboot")
+        self.assertIsInstance(result.errors["i1"], ServerError)
+        self.assertEqual(list(result.results), ["i2"])
+        self.assertEqual(attempts, {"i1": 1, "i2": 1})
+
+    def test_invalid_action(self):
+        """Test an invalid action fails before any request is sent"""
+        transport = InMemoryTransport()
+        client = SubModelClient(token="test-token", transport=transport)
+        with self.assertRaises(ValueError):
+            client.instance.control_many("explode", ["i1"])
+        self.assertEqual(transport.calls, [])
+
+def detail_handler(missing=()):
+    """Answer ``{kind}/{id}`` lookups with the ID, or not found for missing IDs"""
+    def handler(method, url, headers, **kwargs):
+        kind, key = url.rstrip("/").rsplit("/", 2)[-2:]
+        if key in missing:
+            return {"code": 40400, "message": f"{key} not found"}
+        return {"code": 20000, "data": {"id": key, "kind": kind}}
+    return handler
+
+class TestGetMany(unittest.TestCase):
+    def setUp(self):
+        self.transport = InMemoryTransport(detail_handler(missing={"i9"}))
+        self.client = SubModelClient(token="test-token", transport=self.transport)
+
+    def test_dedupes_and_maps_errors(self):
+        """Test every ID is fetched once and errors are kept per ID"""
+        result = self.client.instance.get_many_instances(["i1", "i9", "i2", "i1"])
+        self.assertEqual(list(result.results), ["i1", "i2"])
+        self.assertEqual(result.results["i2"]["data"], {"id": "i2", "kind": "detail"})
+        self.assertIsInstance(result.errors["i9"], ResourceNotFoundError)
+        self.assertEqual(len(self.transport.calls), 3)
+
+    def test_cache(self):
+        """Test recent lookups are reused until the TTL expires or a mutation"""
+        self.client.instance.get_many_instances(["i1", "i2"])
+        result = self.client.instance.get_many_instances(["i2", "i1", "i3"])
+        self.assertEqual(list(result.results), ["i2", "i1", "i3"])
+        self.assertEqual(len(self.transport.calls), 3)
+
+        self.client.instance.get_many_instances(["i1"], cache_ttl=0)
+        self.assertEqual(len(self.transport.calls), 4)
+
+        self.client.instance.control_instance("stop", "i1")
+        self.client.instance.get_many_instances(["i1", "i2"])
+        self.assertEqual(len(self.transport.calls), 7)
+
+        with patch("submodel.sdk.cache.time.monotonic", return_value=time.monotonic() + 60):
+            self.client.instance.get_many_instances(["i3"])
+        self.assertEqual(len(self.transport.calls), 8)
+
+class TestAsyncControlMany(unittest.IsolatedAsyncioTestCase):
+    async def test_control_many(self):
+        """Test the async client controls instances concurrently and reports progress"""
+        handler, attempts = action_route({"i1": 2, "i4": "missing"})
+        transport = AsyncInMemoryTransport(handler)
+        seen = []
+        async with AsyncSubModelClient(token="test-token", transport=transport, backoff_factor=0.001) as client:
+            result = await client.instance.control_many(
+                "restart", [f"i{n}" for n in range(6)], concurrency=3,
+                progress=lambda done, total: seen.append(done))
+        self.assertEqual(list(result.results), ["i0", "i1", "i2", "i3", "i5"])
+        self.assertEqual(list(result.errors), ["i4"])
+        self.assertEqual(attempts["i1"], 3)
+        self.assertEqual(seen, [1, 2, 3, 4, 5, 6])
+
+    async def test_get_many(self):
+        """Test the async client looks up devices and pods with the shared cache"""
+        transport = AsyncInMemoryTransport(detail_handler(missing={"d3"}))
+        async with AsyncSubModelClient(token="test-token", transport=transport) as client:
+            devices = await client.device.get_many_devices(["d1", "d2", "d3", "d1"])
+            pods = await client.instance.get_many_pods(["i1", "i2"])
+            again = await client.device.get_many_devices(["d2"])
+        self.assertEqual(list(devices.results), ["d1", "d2"])
+        self.assertEqual(list(devices.errors), ["d3"])
+        self.assertEqual(pods.results["i1"]["data"], {"id": "i1", "kind": "cont"})
+        self.assertIs(again.results["d2"], devices.results["d2"])
+        self.assertEqual(len(transport.calls), 5)
+
+    async def test_arun_many_cancelled(self):
+        """Test cancelling a bulk call cancels the calls still running"""
+        started, cancelled = [], []
+
+        async def call(key):
+            started.append(key)
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(key)
+                raise
+
+        task = asyncio.ensure_future(arun_many(call, range(10), concurrency=4))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertEqual(len(started), 4)
+        self.assertEqual(sorted(cancelled), sorted(started))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,216 @@
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from submodel.sdk.async_client import AsyncSubModelClient
+from submodel.sdk.cache import ResponseCache, ValidatorCache
+from submodel.sdk.client import SubModelClient
+from submodel.sdk.transport import AsyncInMemoryTransport, InMemoryTransport
+
+def ok(data=None):
+    return {"code": 20000, "data": data or {}}
+
+class TestResponseCache(unittest.TestCase):
+    def test_ttl_patterns(self):
+        """Test only configured read endpoints are cacheable"""
+        cache = ResponseCache()
+        self.assertGreater(cache.ttl_for("area/list"), 0)
+        self.assertGreater(cache.ttl_for("/sl/inst-1/models/llama"), 0)
+        self.assertEqual(cache.ttl_for("inst/detail/abc"), 0)
+
+    def test_expiry(self):
+        """Test entries expire after their TTL"""
+        cache = ResponseCache()
+        with patch('time.monotonic', return_value=100.0):
+            cache.set("k", "area/list", "value", ttl=10)
+            self.assertEqual(cache.get("k"), (True, "value"))
+        with patch('time.monotonic', return_value=111.0):
+            self.assertEqual(cache.get("k"), (False, None))
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted first"""
+        cache = ResponseCache(maxsize=2)
+        cache.set("a", "area/list", 1, ttl=60)
+        cache.set("b", "area/list", 2, ttl=60)
+        cache.get("a")
+        cache.set("c", "area/list", 3, ttl=60)
+
+        self.assertEqual(cache.get("b"), (False, None))
+        self.assertEqual(cache.get("a"), (True, 1))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_invalidate_patterns(self):
+        """Test explicit invalidation by endpoint pattern"""
+        cache = ResponseCache()
+        cache.set("a", "area/list", 1, ttl=60)
+        cache.set("b", "sl/x/models", 2, ttl=60)
+
+        self.assertEqual(cache.invalidate("sl/*"), 1)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.invalidate(), 1)
+        self.assertEqual(len(cache), 0)
+
+    def test_stale_generation_dropped(self):
+        """Test a response fetched before an invalidation is not stored"""
+        cache = ResponseCache()
+        generation = cache.generation
+        cache.invalidate()
+        cache.set("a", "area/list", 1, ttl=60, generation=generation)
+        self.assertEqual(len(cache), 0)
+
+    def test_mutations(self):
+        """Test mutating calls are recognised, including action GETs"""
+        self.assertTrue(ResponseCache.is_mutation("POST", "inst/create"))
+        self.assertTrue(ResponseCache.is_mutation("GET", "device/action/stop/d1/global"))
+        self.assertFalse(ResponseCache.is_mutation("GET", "area/list"))
+
+    def test_unknown_gets_are_mutations(self):
+        """Test GETs outside the known read endpoints count as mutations"""
+        for endpoint in ("user/generate_api_key", "user/logout", "sl/i1/cancel/j1",
+                         "inst/i1/pod/p1/terminate", "user/some_new_action"):
+            with self.subTest(endpoint=endpoint):
+                self.assertTrue(ResponseCache.is_mutation("GET", endpoint))
+        for endpoint in ("user/info", "inst/detail/i1", "sl/i1/status/j1", "inst/i1/pod/p1/logs", "sl/i1/models/m1"):
+            with self.subTest(endpoint=endpoint):
+                self.assertFalse(ResponseCache.is_mutation("GET", endpoint))
+
+class TestClientCache(unittest.TestCase):
+    def setUp(self):
+        self.transport = InMemoryTransport()
+        self.transport.add_route("GET", "area/list", ok({"items": ["us-east"]}))
+        self.transport.add_route("GET", "baremetal/list", ok({"items": []}))
+        self.transport.add_route("GET", "inst/detail/abc", ok({"inst_id": "abc"}))
+        self.transport.add_route("POST", "inst/action/stop/abc", ok())
+        self.client = SubModelClient(token="test-token", transport=self.transport, cache=True)
+
+    def test_read_endpoint_cached(self):
+        """Test repeated reads of a cached endpoint hit the cache"""
+        first = self.client.area.list_areas()
+        second = self.client.area.list_areas()
+
+        self.assertIs(first, second)
+        self.assertEqual(len(self.transport.calls), 1)
+        self.assertEqual(self.client.cache.stats()["hits"], 1)
+
+    def test_params_are_part_of_key(self):
+        """Test different pages are cached separately"""
+        self.client.area.list_areas(page=1)
+        self.client.area.list_areas(page=2)
+        self.assertEqual(len(self.transport.calls), 2)
+
+    def test_uncached_endpoint(self):
+        """Test endpoints without a TTL always go to the API"""
+        self.client.instance.get_instance("abc")
+        self.client.instance.get_instance("abc")
+        self.assertEqual(len(self.transport.calls), 2)
+
+    def test_control_instance_invalidates(self):
+        """Test instance mutations drop cached baremetal listings"""
+        self.client.baremetal.list_baremetals()
+        self.client.area.list_areas()
+        self.client.instance.control_instance("stop", "abc")
+        self.client.baremetal.list_baremetals()
+        self.client.area.list_areas()
+
+        urls = [url for _, url, _ in self.transport.calls]
+        self.assertEqual(sum(url.endswith("baremetal/list") for url in urls), 2)
+        self.assertEqual(sum(url.endswith("area/list") for url in urls), 1)
+
+class TestAsyncClientCache(unittest.IsolatedAsyncioTestCase):
+    async def test_read_endpoint_cached(self):
+        """Test the async client serves repeated reads from the cache"""
+        transport = AsyncInMemoryTransport()
+        transport.add_route("GET", "area/detail/a1", ok({"id": "a1"}))
+        client = AsyncSubModelClient(token="test-token", transport=transport, cache=ResponseCache(maxsize=10))
+
+        await client.get("area/detail/a1")
+        result = await client.get("area/detail/a1")
+
+        self.assertEqual(result["data"]["id"], "a1")
+        self.assertEqual(len(transport.calls), 1)
+        await client.aclose()
+
+class ETagHandler(BaseHTTPRequestHandler):
+    """Local stand-in serving a list with an ETag and honouring If-None-Match"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    body = json.dumps({"code": 20000, "data": {"items": [{"inst_id": str(i)} for i in range(200)]}}).encode()
+    etag = '"v1"'
+
+    def do_GET(self):
+        self.server.seen.append(self.headers.get("If-None-Match"))
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.send_header("ETag", self.etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", self.etag)
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format, *args):
+        pass
+
+class TestValidatorCache(unittest.TestCase):
+    def test_lookup_headers(self):
+        """Test remembered validators become conditional headers"""
+        validators = ValidatorCache()
+        validators.store("k", {"ETag": '"abc"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}, {"code": 20000}, 512)
+        headers, data, size = validators.lookup("k")
+
+        self.assertEqual(headers["If-None-Match"], '"abc"')
+        self.assertEqual(headers["If-Modified-Since"], "Wed, 01 Jan 2025 00:00:00 GMT")
+        self.assertEqual(validators.revalidated("k", (headers, data, size)), {"code": 20000})
+        self.assertEqual(validators.stats()["bytes_saved"], 512)
+
+    def test_response_without_validators(self):
+        """Test responses without validators are not remembered"""
+        validators = ValidatorCache()
+        validators.store("k", {}, {"code": 20000})
+        self.assertIsNone(validators.lookup("k"))
+
+class TestConditionalGet(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), ETagHandler)
+        self.server.seen = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = "http://127.0.0.1:%d/api/v1" % self.server.server_address[1]
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_sync_client_revalidates(self):
+        """Test the sync client returns the remembered body on 304"""
+        with SubModelClient(token="test-token", conditional_get=True) as client:
+            client.base_url = self.base_url
+            first = client.instance.list_instances()
+            second = client.instance.list_instances()
+
+        self.assertIs(first, second)
+        self.assertEqual(self.server.seen, [None, '"v1"'])
+        self.assertEqual(client.validators.stats()["not_modified"], 1)
+        self.assertEqual(client.validators.stats()["bytes_saved"], len(ETagHandler.body))
+
+    async def test_async_client_revalidates(self):
+        """Test the async client returns the remembered body on 304"""
+        async with AsyncSubModelClient(token="test-token", close_on_exit=True, conditional_get=True) as client:
+            client.base_url = self.base_url
+            first = await client.instance.list_instances()
+            second = await client.instance.list_instances()
+
+        self.assertIs(first, second)
+        self.assertEqual(len(first["data"]["items"]), 200)
+        self.assertEqual(self.server.seen, [None, '"v1"'])
+        self.assertEqual(client.validators.stats()["bytes_saved"], len(ETagHandler.body))
+
+if __name__ == '__main__':
+    unittest.main()
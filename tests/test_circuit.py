@@ -0,0 +1,135 @@
+import unittest
+from unittest.mock import patch
+from submodel.sdk.async_client import AsyncSubModelClient
+from submodel.sdk.circuit import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitBreakerRegistry, default_route_key
+from submodel.sdk.client import SubModelClient
+from submodel.sdk.exceptions import CircuitOpenError, HTTPStatusError, ResourceNotFoundError
+from submodel.sdk.transport import AsyncInMemoryTransport, InMemoryTransport, TransportResponse
+
+class TestCircuitBreaker(unittest.TestCase):
+    def test_opens_after_threshold(self):
+        """Test consecutive failures open the circuit and requests fail fast"""
+        with patch('time.monotonic', return_value=0.0):
+            breaker = CircuitBreaker("inst/list", failure_threshold=3, recovery_timeout=10)
+            for _ in range(2):
+                breaker.record_failure()
+            self.assertEqual(breaker.state, CLOSED)
+            breaker.record_failure()
+            self.assertEqual(breaker.state, OPEN)
+        with patch('time.monotonic', return_value=4.0):
+            with self.assertRaises(CircuitOpenError) as ctx:
+                breaker.allow()
+        self.assertEqual(ctx.exception.route, "inst/list")
+        self.assertAlmostEqual(ctx.exception.retry_after, 6.0)
+
+    def test_success_resets_failures(self):
+        """Test a success in between keeps the circuit closed"""
+        breaker = CircuitBreaker("inst/list", failure_threshold=2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CLOSED)
+
+    def test_half_open_probe(self):
+        """Test one probe is let through after the timeout and decides the state"""
+        with patch('time.monotonic', return_value=0.0):
+            breaker = CircuitBreaker("inst/list", failure_threshold=1, recovery_timeout=10)
+            breaker.record_failure()
+        with patch('time.monotonic', return_value=10.0):
+            self.assertEqual(breaker.state, HALF_OPEN)
+            breaker.allow()
+            with self.assertRaises(CircuitOpenError):
+                breaker.allow()
+            breaker.record_failure()
+            self.assertEqual(breaker.state, OPEN)
+        with patch('time.monotonic', return_value=20.0):
+            breaker.allow()
+            breaker.record_success()
+            self.assertEqual(breaker.state, CLOSED)
+
+    def test_abandoned_probe_expires(self):
+        """Test a probe that never reports back does not block the route forever"""
+        with patch('time.monotonic', return_value=0.0):
+            breaker = CircuitBreaker("inst/list", failure_threshold=1, recovery_timeout=10)
+            breaker.record_failure()
+        with patch('time.monotonic', return_value=10.0):
+            breaker.allow()
+        with patch('time.monotonic', return_value=20.0):
+            breaker.allow()
+
+    def test_registry_routes(self):
+        """Test endpoints share breakers per route"""
+        self.assertEqual(default_route_key("sl/abc/runsync"), "sl/*/runsync")
+        self.assertEqual(default_route_key("/sl/abc/status/job-1"), "sl/*/status")
+        self.assertEqual(default_route_key("inst/abc/pod/p1/logs"), "inst/*/pod")
+        self.assertEqual(default_route_key("inst/detail"), "inst/detail")
+        registry = CircuitBreakerRegistry()
+        self.assertIs(registry.get("device/action"), registry.get("/device/action"))
+        self.assertIsNot(registry.get("inst/list"), registry.get("inst/detail"))
+
+    def test_registry_bounded_by_operations(self):
+        """Test calls to many instances share one breaker per operation"""
+        registry = CircuitBreakerRegistry()
+        for n in range(1000):
+            registry.get(f"sl/inst-{n}/runsync")
+            registry.get(f"inst/inst-{n}/pod/pod-{n}/logs")
+        self.assertEqual(sorted(registry.states()), ["inst/*/pod", "sl/*/runsync"])
+
+class TestClientCircuitBreaker(unittest.TestCase):
+    @patch('time.sleep')
+    def test_open_circuit_fails_fast(self, mock_sleep):
+        """Test an open route fails fast without retries while other routes still work"""
+        transport = InMemoryTransport()
+        transport.add_route("GET", "inst/list", TransportResponse(503))
+        transport.add_route("GET", "device/list", {"code": 20000})
+        registry = CircuitBreakerRegistry(failure_threshold=2)
+        client = SubModelClient(token="test-token", transport=transport, circuit_breaker=registry)
+
+        with self.assertRaises(CircuitOpenError):
+            client.get("inst/list")
+        self.assertEqual(len(transport.calls), 2)
+        self.assertEqual(registry.states()["inst/list"], OPEN)
+
+        with self.assertRaises(CircuitOpenError):
+            client.get("inst/list")
+        self.assertEqual(len(transport.calls), 2)
+        self.assertEqual(client.get("device/list")["code"], 20000)
+
+    @patch('time.sleep')
+    def test_client_errors_do_not_trip(self, mock_sleep):
+        """Test not-found and other client errors leave the circuit closed"""
+        transport = InMemoryTransport(handler=lambda *args, **kwargs: {"code": 40400, "message": "missing"})
+        registry = CircuitBreakerRegistry(failure_threshold=1)
+        client = SubModelClient(token="test-token", transport=transport, circuit_breaker=registry)
+
+        with self.assertRaises(ResourceNotFoundError):
+            client.get("inst/detail")
+        self.assertEqual(registry.states()["inst/detail"], CLOSED)
+
+class TestAsyncClientCircuitBreaker(unittest.IsolatedAsyncioTestCase):
+    async def test_open_circuit_fails_fast(self):
+        """Test the async client stops retrying once the circuit opens"""
+        transport = AsyncInMemoryTransport(handler=lambda *args, **kwargs: TransportResponse(500))
+        client = AsyncSubModelClient(token="test-token", transport=transport, backoff_factor=0,
+                                     circuit_breaker=CircuitBreakerRegistry(failure_threshold=2))
+
+        with self.assertRaises(CircuitOpenError):
+            await client.get("inst/list")
+        self.assertEqual(len(transport.calls), 2)
+
+        client.circuit_breakers.reset()
+        with self.assertRaises(CircuitOpenError):
+            await client.get("inst/list")
+        self.assertEqual(len(transport.calls), 4)
+
+    async def test_disabled_by_default(self):
+        """Test server errors are retried as before without breakers"""
+        transport = AsyncInMemoryTransport(handler=lambda *args, **kwargs: TransportResponse(500))
+        client = AsyncSubModelClient(token="test-token", transport=transport, backoff_factor=0)
+
+        with self.assertRaises(HTTPStatusError):
+            await client.get("inst/list")
+        self.assertEqual(len(transport.calls), 4)
+
+if __name__ == '__main__':
+    unittest.main()
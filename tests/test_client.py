@@ -0,0 +1,54 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import requests
+from submodel.sdk.client import SubModelClient, create_client, create_session
+
+class TestClientSession(unittest.TestCase):
+    def test_client_owns_pooled_session(self):
+        """Test client creates a keep-alive session with the configured pool"""
+        client = create_client(token="test-token", pool_connections=4, pool_maxsize=32)
+        self.assertIsInstance(client.session, requests.Session)
+        adapter = client.session.get_adapter("https://api.submodel.ai")
+        self.assertEqual(adapter._pool_connections, 4)
+        self.assertEqual(adapter._pool_maxsize, 32)
+
+    @patch('requests.Session.request')
+    def test_requests_reuse_session(self, mock_request):
+        """Test consecutive requests go through the same session"""
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"code": 20000}
+        mock_request.return_value = mock_response
+
+        client = create_client(token="test-token")
+        client.get("test/endpoint")
+        client.get("test/endpoint")
+        self.assertEqual(mock_request.call_count, 2)
+
+    def test_shared_session(self):
+        """Test several clients can share one connection pool"""
+        session = create_session(pool_maxsize=50)
+        client1 = SubModelClient(token="token-1", session=session)
+        client2 = SubModelClient(api_key="key-2", session=session)
+        self.assertIs(client1.session, client2.session)
+
+        with patch.object(session, 'close') as mock_close:
+            client1.close()
+            mock_close.assert_not_called()
+
+    def test_close_owned_session(self):
+        """Test close releases the client-owned session"""
+        client = create_client(token="test-token")
+        with patch.object(client.session, 'close') as mock_close:
+            client.close()
+            mock_close.assert_called_once()
+
+    def test_context_manager(self):
+        """Test client closes its session when leaving the context"""
+        client = create_client(token="test-token")
+        with patch.object(client.session, 'close') as mock_close:
+            with client as entered:
+                self.assertIs(entered, client)
+            mock_close.assert_called_once()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import json
+import unittest
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from submodel.sdk import codec as codec_module
+from submodel.sdk.async_client import AsyncSubModelClient
+from submodel.sdk.client import SubModelClient
+from submodel.sdk.codec import JSONCodec, get_codec
+from submodel.sdk.serverless import ServerlessHandler
+from submodel.sdk.transport import InMemoryTransport, TransportResponse
+
+class RecordingCodec(JSONCodec):
+    """Codec counting its calls"""
+
+    name = "recording"
+
+    def __init__(self):
+        self.encoded = 0
+        self.decoded = 0
+
+    def dumps(self, obj):
+        self.encoded += 1
+        return json.dumps(obj).encode("utf-8")
+
+    def loads(self, data):
+        self.decoded += 1
+        return json.loads(data)
+
+class TestCodecs(unittest.TestCase):
+    def test_round_trip(self):
+        """Test every available codec encodes and decodes the same payload"""
+        payload = {"code": 20000, "data": {"list": [{"inst_id": "a", "gpu": 1.5, "tags": ["x"]}], "total": 1}}
+        for name in codec_module.CODECS:
+            try:
+                codec = get_codec(name)
+            except ImportError:
+                continue
+            with self.subTest(codec=name):
+                self.assertIsInstance(codec.dumps(payload), bytes)
+                self.assertEqual(codec.loads(codec.dumps(payload)), payload)
+                self.assertEqual(json.loads(codec.dumps_str(payload)), payload)
+
+    def test_auto(self):
+        """Test auto prefers orjson, then msgspec, then the standard library"""
+        with patch.object(codec_module, "orjson", None), patch.object(codec_module, "msgspec", None):
+            self.assertEqual(get_codec("auto").name, "json")
+        if codec_module.orjson is not None:
+            self.assertEqual(get_codec().name, "orjson")
+
+    def test_missing_and_unknown(self):
+        """Test unavailable or unknown codecs are reported"""
+        with patch.object(codec_module, "msgspec", None):
+            with self.assertRaises(ImportError):
+                get_codec("msgspec")
+        with self.assertRaises(ValueError):
+            get_codec("yaml")
+        codec = RecordingCodec()
+        self.assertIs(get_codec(codec), codec)
+
+class TestClientCodec(unittest.TestCase):
+    def test_body_encoded_and_decoded_with_codec(self):
+        """Test request bodies and responses go through the client's codec"""
+        seen = {}
+
+        def handler(method, url, headers, **kwargs):
+            seen.update(kwargs)
+            return TransportResponse(200, content=b'{"code": 20000, "data": {"ok": true}}')
+
+        codec = RecordingCodec()
+        client = SubModelClient(token="test-token", transport=InMemoryTransport(handler=handler), json_codec=codec)
+        result = client.post("inst/create", json={"mode": "pod"})
+
+        self.assertEqual(result["data"], {"ok": True})
+        self.assertNotIn("json", seen)
+        self.assertEqual(json.loads(seen["data"]), {"mode": "pod"})
+        self.assertEqual((codec.encoded, codec.decoded), (1, 1))
+
+    @patch('requests.Session.request')
+    def test_requests_response_content(self, mock_request):
+        """Test requests responses are decoded from their raw content"""
+        response = MagicMock()
+        response.status_code = 200
+        response.content = b'{"code": 20000, "data": [1, 2]}'
+        mock_request.return_value = response
+
+        client = SubModelClient(token="test-token", json_codec="json")
+        self.assertEqual(client.get("inst/list")["data"], [1, 2])
+        response.json.assert_not_called()
+
+class TestAsyncClientCodec(unittest.IsolatedAsyncioTestCase):
+    @patch('aiohttp.ClientSession.request')
+    async def test_raw_body_decoded_with_codec(self, mock_request):
+        """Test the async client reads the raw body and decodes it itself"""
+        response = AsyncMock()
+        response.status = 200
+        response.headers = {}
+        response.read = AsyncMock(return_value=b'{"code": 20000, "data": "fast"}')
+        response.json = AsyncMock()
+        response.raise_for_status = Mock()
+        context = AsyncMock()
+        context.__aenter__.return_value = response
+        mock_request.return_value = context
+
+        codec = RecordingCodec()
+        async with AsyncSubModelClient(token="test-token", close_on_exit=True, json_codec=codec) as client:
+            result = await client.post("inst/create", json={"mode": "pod"})
+
+        self.assertEqual(result["data"], "fast")
+        response.json.assert_not_called()
+        self.assertIsInstance(mock_request.call_args.kwargs["data"], bytes)
+        self.assertEqual((codec.encoded, codec.decoded), (1, 1))
+
+class TestServerlessCodec(unittest.TestCase):
+    @patch('builtins.print')
+    def test_return_result_with_codec(self, mock_print):
+        """Test results are written with the handler's codec"""
+        codec = RecordingCodec()
+        handler = ServerlessHandler(json_codec=codec)
+        handler._return_result({"items": [1, 2, 3]})
+        self.assertEqual(json.loads(mock_print.call_args.args[0]), {"output": {"items": [1, 2, 3]}})
+        self.assertEqual(codec.encoded, 1)
+
+if __name__ == '__main__':
+    unittest.main()
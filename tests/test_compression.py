@@ -0,0 +1,193 @@
+import gzip
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from submodel.sdk import compression as compression_module
+from submodel.sdk import transport as transport_module
+from submodel.sdk.async_client import AsyncSubModelClient
+from submodel.sdk.client import SubModelClient
+from submodel.sdk.compression import CompressedBody, RequestCompression, accept_encoding
+from submodel.sdk.exceptions import HTTPStatusError
+from submodel.sdk.transport import AsyncInMemoryTransport, InMemoryTransport, TransportResponse
+
+def recording_handler(seen):
+    def handler(method, url, headers, **kwargs):
+        seen.append((headers, kwargs))
+        return {"code": 20000, "data": {"ok": True}}
+    return handler
+
+class TestRequestCompression(unittest.TestCase):
+    def test_body_compressed_in_chunks(self):
+        """Test the body is compressed slice by slice and can be sent again"""
+        payload = json.dumps({"input": {"prompt": "hello " * 10000}}).encode()
+        body = RequestCompression(chunk_size=1024).body(payload)
+
+        chunks = list(body)
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(gzip.decompress(b"".join(chunks)), payload)
+        self.assertEqual(b"".join(body), b"".join(chunks))
+
+    def test_unknown_and_missing_encodings(self):
+        """Test unknown encodings and missing zstd libraries are reported"""
+        with self.assertRaises(ValueError):
+            RequestCompression("br")
+        with patch.object(compression_module, "zstd", None), patch.object(compression_module, "zstandard", None):
+            with self.assertRaises(ImportError):
+                RequestCompression("zstd")
+
+    def test_client_compresses_large_bodies(self):
+        """Test bodies over the threshold are sent gzip-encoded"""
+        seen = []
+        client = SubModelClient(token="test-token", transport=InMemoryTransport(handler=recording_handler(seen)),
+                                compress_requests=RequestCompression(threshold=1024))
+        data = {"input": {"prompt": "a" * 2048}}
+        client.post("sl/inst-1/runsync", json=data)
+
+        headers, kwargs = seen[0]
+        self.assertEqual(headers["Content-Encoding"], "gzip")
+        self.assertNotIn("json", kwargs)
+        self.assertIsInstance(kwargs["data"], CompressedBody)
+        self.assertEqual(json.loads(gzip.decompress(b"".join(kwargs["data"]))), data)
+
+    def test_small_bodies_sent_as_is(self):
+        """Test bodies under the threshold and clients without compression are untouched"""
+        seen = []
+        for compress in (True, None):
+            client = SubModelClient(token="test-token", transport=InMemoryTransport(handler=recording_handler(seen)),
+                                    compress_requests=compress)
+            client.post("inst/create", json={"mode": "pod"})
+        for headers, kwargs in seen:
+            self.assertNotIn("Content-Encoding", headers)
+            self.assertEqual(kwargs["json"], {"mode": "pod"})
+
+    def test_codec_encoded_body_compressed(self):
+        """Test bodies encoded by a JSON codec are compressed too"""
+        seen = []
+        client = SubModelClient(token="test-token", transport=InMemoryTransport(handler=recording_handler(seen)),
+                                json_codec="json", compress_requests=RequestCompression(threshold=0))
+        client.post("inst/create", json={"mode": "pod"})
+
+        headers, kwargs = seen[0]
+        self.assertEqual(headers["Content-Encoding"], "gzip")
+        self.assertEqual(json.loads(gzip.decompress(b"".join(kwargs["data"]))), {"mode": "pod"})
+
+    def test_retry_resends_whole_body(self):
+        """Test a retried request sends the complete compressed body again"""
+        bodies = []
+
+        def handler(method, url, headers, **kwargs):
+            bodies.append(gzip.decompress(b"".join(kwargs["data"])))
+            if len(bodies) == 1:
+                return TransportResponse(503, {"Retry-After": "0"}, data={"code": 50300, "message": "unavailable"})
+            return {"code": 20000, "data": {}}
+
+        client = SubModelClient(token="test-token", transport=InMemoryTransport(handler=handler),
+                                backoff_factor=0, compress_requests=RequestCompression(threshold=0))
+        client.post("sl/inst-1/run", json={"input": {"n": 1}})
+
+        self.assertEqual(len(bodies), 2)
+        self.assertEqual(bodies[0], bodies[1])
+
+class TestAsyncRequestCompression(unittest.IsolatedAsyncioTestCase):
+    async def test_async_client_compresses_large_bodies(self):
+        """Test the async client sends an async-iterable compressed body"""
+        seen = []
+        async with AsyncSubModelClient(token="test-token", transport=AsyncInMemoryTransport(handler=recording_handler(seen)),
+                                       compress_requests=RequestCompression(threshold=1024)) as client:
+            data = {"input": {"prompt": "a" * 2048}}
+            await client.post("sl/inst-1/run", json=data)
+
+        headers, kwargs = seen[0]
+        self.assertEqual(headers["Content-Encoding"], "gzip")
+        chunks = [chunk async for chunk in kwargs["data"]]
+        self.assertEqual(json.loads(gzip.decompress(b"".join(chunks))), data)
+
+class GzipHandler(BaseHTTPRequestHandler):
+    """Local stand-in answering with a gzip-encoded list when the client accepts it"""
+
+    protocol_version = "HTTP/1.1"
+    body = json.dumps({"code": 20000, "data": {"items": [{"device_id": f"dev-{i}"} for i in range(2000)]}}).encode()
+
+    def do_GET(self):
+        self.server.seen.append(self.headers.get("Accept-Encoding"))
+        if self.path.endswith("missing"):
+            status, payload = 404, b"{}"
+        else:
+            status, payload = 200, gzip.compress(self.body)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if status == 200:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+class TestResponseDecompression(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), GzipHandler)
+        self.server.seen = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = "http://127.0.0.1:%d/api/v1" % self.server.server_address[1]
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_accept_encoding(self):
+        """Test preferred encodings are listed first and gzip is always accepted"""
+        self.assertEqual(accept_encoding(has_zstd=True, has_brotli=True), "zstd, br, gzip, deflate")
+        self.assertEqual(accept_encoding(has_zstd=False, has_brotli=False), "gzip, deflate")
+
+    def test_accept_encoding_follows_library(self):
+        """Test transports only advertise encodings their library decodes"""
+        with patch.object(compression_module, "zstd", object()), patch.object(compression_module, "brotli", object()):
+            with patch("urllib3.util.request.ACCEPT_ENCODING", "gzip,deflate"):
+                self.assertEqual(transport_module._urllib3_accept_encoding(), "gzip, deflate")
+            with patch("urllib3.util.request.ACCEPT_ENCODING", "gzip,deflate,br,zstd"):
+                self.assertEqual(transport_module._urllib3_accept_encoding(), "zstd, br, gzip, deflate")
+            with patch("aiohttp.compression_utils.HAS_ZSTD", False), patch("aiohttp.compression_utils.HAS_BROTLI", True):
+                self.assertEqual(transport_module._aiohttp_accept_encoding(), "br, gzip, deflate")
+
+    def test_sync_get_and_stream(self):
+        """Test the sync client advertises encodings and decodes buffered and streamed bodies"""
+        with SubModelClient(token="test-token") as client:
+            client.base_url = self.base_url
+            self.assertEqual(len(client.get("device/list")["data"]["items"]), 2000)
+            with client.stream("GET", "device/list") as response:
+                chunks = list(response.iter_bytes(1024))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(b"".join(chunks), GzipHandler.body)
+        self.assertEqual(self.server.seen, [client.transport.accept_encoding] * 2)
+
+    async def test_async_get_and_stream(self):
+        """Test the async client advertises encodings and decodes buffered and streamed bodies"""
+        async with AsyncSubModelClient(token="test-token", close_on_exit=True) as client:
+            client.base_url = self.base_url
+            self.assertEqual(len((await client.get("device/list"))["data"]["items"]), 2000)
+            async with client.stream("GET", "device/list") as response:
+                chunks = [chunk async for chunk in response.iter_bytes(1024)]
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(b"".join(chunks), GzipHandler.body)
+        self.assertEqual(self.server.seen, [client.transport.accept_encoding] * 2)
+
+    async def test_stream_error_status(self):
+        """Test a streamed request raises for error statuses without retrying them"""
+        with SubModelClient(token="test-token") as client:
+            client.base_url = self.base_url
+            with self.assertRaises(HTTPStatusError):
+                with client.stream("GET", "missing"):
+                    pass
+        async with AsyncSubModelClient(token="test-token", close_on_exit=True) as client:
+            client.base_url = self.base_url
+            with self.assertRaises(HTTPStatusError):
+                async with client.stream("GET", "missing"):
+                    pass
+        self.assertEqual(len(self.server.seen), 2)
+
+if __name__ == "__main__":
+    unittest.main()
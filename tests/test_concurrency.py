@@ -0,0 +1,105 @@
+import asyncio
+import unittest
+from submodel.sdk.async_client import AsyncSubModelClient
+from submodel.sdk.concurrency import AdaptiveConcurrencyLimiter
+from submodel.sdk.exceptions import ServerError
+from submodel.sdk.transport import AsyncInMemoryTransport
+
+class TestAdaptiveConcurrencyLimiter(unittest.IsolatedAsyncioTestCase):
+    async def test_limit_enforced(self):
+        """Test no more than the limit of tasks hold a slot at once"""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=3)
+        peak = 0
+
+        async def work():
+            nonlocal peak
+            await limiter.acquire()
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.001)
+            limiter.release(None)
+
+        await asyncio.gather(*(work() for _ in range(20)))
+        self.assertEqual(peak, 3)
+        self.assertEqual(limiter.in_flight, 0)
+
+    async def test_additive_increase(self):
+        """Test flat latency grows the limit by about one per window"""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4)
+        for _ in range(8):
+            await limiter.acquire()
+            limiter.release(0.05)
+        self.assertEqual(limiter.stats()["limit"], 5)
+
+    async def test_latency_spike_decreases(self):
+        """Test latency well above the baseline cuts the limit"""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=10, decrease_factor=0.5)
+        await limiter.acquire()
+        limiter.release(0.05)
+        await limiter.acquire()
+        limiter.release(0.5)
+        self.assertEqual(limiter.stats()["limit"], 5)
+        self.assertEqual(limiter.decreases, 1)
+
+    async def test_overload_decreases_once_per_round_trip(self):
+        """Test a burst of concurrent failures causes a single decrease"""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=10, decrease_factor=0.5)
+        for _ in range(5):
+            await limiter.acquire()
+        for _ in range(5):
+            limiter.release(1.0, overloaded=True)
+        self.assertEqual(limiter.stats()["limit"], 5)
+
+    async def test_min_limit(self):
+        """Test the limit never drops below the minimum"""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, min_limit=2)
+        await limiter.acquire()
+        limiter.release(0.0, overloaded=True)
+        self.assertEqual(limiter.stats()["limit"], 2)
+
+    async def test_cancelled_waiter(self):
+        """Test a cancelled waiter gives up its place without leaking a slot"""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+        await limiter.acquire()
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiter
+        limiter.release(None)
+        self.assertEqual(limiter.in_flight, 0)
+        self.assertEqual(limiter.stats()["waiting"], 0)
+
+class TestClientAdaptiveConcurrency(unittest.IsolatedAsyncioTestCase):
+    async def test_server_errors_shrink_limit(self):
+        """Test server errors seen by the client reduce its concurrency"""
+        transport = AsyncInMemoryTransport(handler=lambda *args, **kwargs: {"code": 50000, "message": "overloaded"})
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, decrease_factor=0.5)
+        client = AsyncSubModelClient(token="test-token", transport=transport, max_retries=0, adaptive_concurrency=limiter)
+
+        with self.assertRaises(ServerError):
+            await client.get("inst/detail/abc")
+        self.assertEqual(limiter.stats()["limit"], 4)
+        self.assertEqual(limiter.in_flight, 0)
+
+    async def test_sweep_bounded(self):
+        """Test a large gather never exceeds the adaptive limit"""
+        peak = 0
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=6)
+        transport = AsyncInMemoryTransport(handler=lambda *args, **kwargs: {"code": 20000})
+        dispatch = transport.request
+
+        async def slow_request(*args, **kwargs):
+            nonlocal peak
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.001)
+            return await dispatch(*args, **kwargs)
+
+        transport.request = slow_request
+        client = AsyncSubModelClient(token="test-token", transport=transport, max_retries=0, adaptive_concurrency=limiter)
+        await asyncio.gather(*(client.instance.get_instance(str(i)) for i in range(100)))
+
+        self.assertLessEqual(peak, 6)
+        self.assertGreater(limiter.stats()["limit"], 4)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,13 +1,16 @@
 import unittest
 from unittest.mock import patch, MagicMock
 from submodel import create_client
+from submodel.sdk.async_client import AsyncSubModelClient
+from submodel.sdk.device import AsyncArea, AsyncBaremetal, AsyncDevice
+from submodel.sdk.transport import AsyncInMemoryTransport
 
 class TestDevice(unittest.TestCase):
     def setUp(self):
         self.client = create_client(token="test-token")
         self.device = self.client.device
     
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_list_devices(self, mock_request):
         """Test listing devices"""
         mock_response = MagicMock()
@@ -35,7 +38,7 @@ class TestDevice(unittest.TestCase):
         self.assertEqual(kwargs["params"]["page"], 1)
         self.assertEqual(kwargs["params"]["limit"], 10)
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_get_device(self, mock_request):
         """Test getting device details"""
         mock_response = MagicMock()
@@ -54,7 +57,7 @@ class TestDevice(unittest.TestCase):
         self.assertEqual(result["code"], 20000)
         self.assertEqual(result["data"]["id"], "device1")
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_control_device(self, mock_request):
         """Test device control operations"""
         mock_response = MagicMock()
@@ -77,7 +80,7 @@ class TestArea(unittest.TestCase):
         self.client = create_client(token="test-token")
         self.area = self.client.area
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_list_areas(self, mock_request):
         """Test listing available areas"""
         mock_response = MagicMock()
@@ -100,7 +103,7 @@ class TestArea(unittest.TestCase):
         self.assertEqual(result["code"], 20000)
         self.assertEqual(len(result["data"]["items"]), 2)
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_get_area(self, mock_request):
         """Test getting area details"""
         mock_response = MagicMock()
@@ -124,7 +127,7 @@ class TestBaremetal(unittest.TestCase):
         self.client = create_client(token="test-token")
         self.baremetal = self.client.baremetal
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_list_baremetals(self, mock_request):
         """Test listing physical servers"""
         mock_response = MagicMock()
@@ -152,5 +155,50 @@ class TestBaremetal(unittest.TestCase):
         args, kwargs = mock_request.call_args
         self.assertEqual(kwargs["params"]["mode"], "baremetal")
 
+class TestAsyncDevice(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.transport = AsyncInMemoryTransport()
+        self.client = AsyncSubModelClient(token="test-token", transport=self.transport)
+
+    async def test_managers(self):
+        """Test the async client exposes native async managers"""
+        self.assertIsInstance(self.client.device, AsyncDevice)
+        self.assertIsInstance(self.client.area, AsyncArea)
+        self.assertIsInstance(self.client.baremetal, AsyncBaremetal)
+
+    async def test_requests(self):
+        """Test async device, area and baremetal calls hit the same endpoints"""
+        self.transport.add_route("GET", "device/list", {"code": 20000, "data": {"items": [{"id": "dev1"}]}})
+        self.transport.add_route("GET", "device/detail/dev1", {"code": 20000, "data": {"id": "dev1"}})
+        self.transport.add_route("GET", "device/action/run/dev1/global", {"code": 20000})
+        self.transport.add_route("GET", "area/detail/a1", {"code": 20000, "data": {"id": "a1"}})
+        self.transport.add_route("GET", "baremetal/list", {"code": 20000, "data": {"items": []}})
+
+        result = await self.client.device.list_devices(search="gpu")
+        self.assertEqual(result["data"]["items"], [{"id": "dev1"}])
+        self.assertEqual(self.transport.calls[-1][2]["params"], {"page": 1, "limit": 10, "search": "gpu"})
+        self.assertEqual((await self.client.device.get_device("dev1"))["data"]["id"], "dev1")
+        await self.client.device.control_device("run", "dev1", force=True)
+        self.assertEqual(self.transport.calls[-1][2]["params"], {"force": True})
+        self.assertEqual((await self.client.area.get_area("a1"))["data"]["id"], "a1")
+        await self.client.baremetal.list_baremetals()
+        self.assertEqual(self.transport.calls[-1][2]["params"]["mode"], "baremetal")
+
+        with self.assertRaises(ValueError):
+            await self.client.device.control_device("explode", "dev1")
+
+    async def test_iterators(self):
+        """Test async device pagination, streaming and bulk listing"""
+        devices = [{"id": f"dev{i}"} for i in range(25)]
+
+        def handler(method, url, headers, params=None, **kwargs):
+            start = (params["page"] - 1) * params["limit"]
+            return {"code": 20000, "data": {"total": 25, "items": devices[start:start + params["limit"]]}}
+
+        self.transport.add_route("GET", "device/list", handler)
+        self.assertEqual([d async for d in self.client.device.iter_devices(limit=10)], devices)
+        self.assertEqual([d async for d in self.client.device.stream_devices(limit=100)], devices)
+        self.assertEqual(await self.client.device.list_all_devices(), devices)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
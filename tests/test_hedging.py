@@ -0,0 +1,125 @@
+import asyncio
+import threading
+import time
+import unittest
+from submodel.sdk.async_client import AsyncSubModelClient
+from submodel.sdk.client import SubModelClient
+from submodel.sdk.hedging import HedgingPolicy
+from submodel.sdk.transport import AsyncTransport, InMemoryTransport, TransportResponse
+
+STATUS = "sl/abc/status/job-1"
+
+def warmed_policy(latency=0.01, **kwargs):
+    """Hedging policy that has already seen enough fast requests"""
+    kwargs.setdefault("max_extra_load", 1.0)
+    policy = HedgingPolicy(min_samples=5, **kwargs)
+    for _ in range(5):
+        policy.record_latency(STATUS, latency)
+    return policy
+
+class SlowFirstTransport(AsyncTransport):
+    """Async transport whose first request stalls until cancelled"""
+
+    def __init__(self):
+        self.calls = 0
+        self.cancelled = 0
+
+    async def request(self, method, url, headers=None, **kwargs):
+        self.calls += 1
+        number = self.calls
+        if number == 1:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                raise
+        return TransportResponse(200, data={"code": 20000, "attempt": number})
+
+class TestHedgingPolicy(unittest.TestCase):
+    def test_hedge_delay_percentile(self):
+        """Test the delay follows the configured latency percentile"""
+        policy = HedgingPolicy(percentile=90, min_samples=10, min_delay=0)
+        self.assertIsNone(policy.hedge_delay(STATUS))
+        for i in range(1, 11):
+            policy.record_latency(STATUS, i / 100)
+        self.assertAlmostEqual(policy.hedge_delay(STATUS), 0.10)
+        self.assertAlmostEqual(policy.hedge_delay("sl/abc/status/job-2"), 0.10)
+        self.assertIsNone(policy.hedge_delay("inst/detail/abc"))
+
+    def test_extra_load_cap(self):
+        """Test hedges are limited to the configured share of requests"""
+        policy = HedgingPolicy(max_extra_load=0.25)
+        granted = 0
+        for _ in range(20):
+            policy.record_request()
+            granted += policy.try_hedge()
+        self.assertEqual(granted, 5)
+        self.assertEqual(policy.stats()["skipped"], 15)
+
+class TestClientHedging(unittest.TestCase):
+    def test_hedge_wins(self):
+        """Test a stalled GET is answered by the hedge"""
+        release = threading.Event()
+        calls = []
+
+        def handler(method, url, headers, **kwargs):
+            calls.append(url)
+            if len(calls) == 1:
+                release.wait(5)
+            return {"code": 20000, "attempt": len(calls)}
+
+        policy = warmed_policy()
+        transport = InMemoryTransport(handler=handler)
+        client = SubModelClient(token="test-token", transport=transport, hedging=policy)
+        try:
+            start = time.monotonic()
+            result = client.get(STATUS)
+            self.assertLess(time.monotonic() - start, 1)
+        finally:
+            release.set()
+            client.close()
+        self.assertEqual(result["attempt"], 2)
+        self.assertEqual(policy.stats()["hedge_wins"], 1)
+
+    def test_fast_requests_not_hedged(self):
+        """Test requests answering within the percentile are sent once"""
+        policy = warmed_policy(latency=1.0)
+        transport = InMemoryTransport(handler=lambda *args, **kwargs: {"code": 20000})
+        with SubModelClient(token="test-token", transport=transport, hedging=policy) as client:
+            client.get(STATUS)
+        self.assertEqual(len(transport.calls), 1)
+        self.assertEqual(policy.stats()["hedges"], 0)
+
+    def test_mutating_gets_not_hedged(self):
+        """Test GETs that change state and POSTs are never hedged"""
+        client = SubModelClient(token="test-token", hedging=True)
+        self.assertFalse(client._is_hedgeable("GET", client._build_url("sl/abc/cancel/job-1"), {}))
+        self.assertFalse(client._is_hedgeable("POST", client._build_url("sl/abc/runsync"), {"json": {}}))
+        self.assertTrue(client._is_hedgeable("GET", client._build_url(STATUS), {}))
+
+class TestAsyncClientHedging(unittest.IsolatedAsyncioTestCase):
+    async def test_loser_cancelled(self):
+        """Test the hedge answers and the stalled attempt is cancelled"""
+        policy = warmed_policy()
+        transport = SlowFirstTransport()
+        client = AsyncSubModelClient(token="test-token", transport=transport, hedging=policy)
+
+        result = await asyncio.wait_for(client.get(STATUS), 2)
+        await asyncio.sleep(0)
+        self.assertEqual(result["attempt"], 2)
+        self.assertEqual(transport.cancelled, 1)
+        self.assertEqual(policy.stats()["hedge_win_rate"], 1.0)
+
+    async def test_budget_exhausted(self):
+        """Test requests wait for the first attempt once the budget is spent"""
+        policy = warmed_policy(latency=0.001, max_extra_load=0)
+        transport = SlowFirstTransport()
+        client = AsyncSubModelClient(token="test-token", transport=transport, hedging=policy)
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(client.get(STATUS), 0.2)
+        self.assertEqual(transport.calls, 1)
+        self.assertEqual(policy.stats()["skipped"], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,13 +2,16 @@ import unittest
 from unittest.mock import patch, MagicMock
 from submodel.sdk.client import create_client
 from submodel.sdk.exceptions import ResourceNotFoundError
+from submodel.sdk.async_client import AsyncSubModelClient
+from submodel.sdk.instance import AsyncInstance
+from submodel.sdk.transport import AsyncInMemoryTransport
 
 class TestInstance(unittest.TestCase):
     def setUp(self):
         self.client = create_client(token="test-token")
         self.instance = self.client.instance
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_create_instance(self, mock_request):
         """Test instance creation"""
         mock_response = MagicMock()
@@ -44,7 +47,7 @@ class TestInstance(unittest.TestCase):
         self.assertEqual(kwargs["json"]["mode"], "pod")
         self.assertEqual(kwargs["json"]["plan"], "gpu-rtx4090-24g-1")
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_list_instances(self, mock_request):
         """Test list instances"""
         mock_response = MagicMock()
@@ -74,7 +77,7 @@ class TestInstance(unittest.TestCase):
         self.assertEqual(kwargs["params"]["limit"], 10)
         self.assertEqual(kwargs["params"]["mode"], "pod")
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_get_instance(self, mock_request):
         """Test get instance details"""
         mock_response = MagicMock()
@@ -93,7 +96,7 @@ class TestInstance(unittest.TestCase):
         self.assertEqual(result["code"], 20000)
         self.assertEqual(result["data"]["inst_id"], "test-id")
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_control_instance(self, mock_request):
         """Test instance control operations"""
         mock_response = MagicMock()
@@ -114,7 +117,7 @@ class TestInstance(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.instance.control_instance("invalid_action", "test-id")
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_instance_not_found(self, mock_request):
         """Test instance not found error"""
         mock_response = MagicMock()
@@ -129,7 +132,7 @@ class TestInstance(unittest.TestCase):
             self.instance.get_instance("non-existent-id")
         self.assertEqual(str(context.exception), "Instance not found")
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_delete_instance(self, mock_request):
         """Test instance deletion"""
         mock_response = MagicMock()
@@ -149,7 +152,7 @@ class TestInstance(unittest.TestCase):
         self.assertEqual(args[0], "POST")
         self.assertIn("inst/delete/test-id", args[1])
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_get_pods(self, mock_request):
         """Test get instance pods"""
         mock_response = MagicMock()
@@ -175,7 +178,7 @@ class TestInstance(unittest.TestCase):
         self.assertEqual(args[0], "GET")
         self.assertIn("inst/cont/test-inst-id", args[1])
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_get_pod_logs(self, mock_request):
         """Test get pod logs"""
         mock_response = MagicMock()
@@ -198,7 +201,7 @@ class TestInstance(unittest.TestCase):
         self.assertEqual(args[0], "GET")
         self.assertIn("inst/test-inst-id/pod/test-pod-id/logs", args[1])
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_terminate_pod(self, mock_request):
         """Test terminate pod"""
         mock_response = MagicMock()
@@ -218,7 +221,7 @@ class TestInstance(unittest.TestCase):
         self.assertEqual(args[0], "GET")
         self.assertIn("inst/test-inst-id/pod/test-pod-id/terminate", args[1])
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_control_instance_all_actions(self, mock_request):
         """Test all valid control actions"""
         mock_response = MagicMock()
@@ -255,7 +258,7 @@ class TestInstance(unittest.TestCase):
         self.assertIn("Invalid action", str(cm.exception))
         self.assertIn("Must be one of", str(cm.exception))
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_create_instance_with_defaults(self, mock_request):
         """Test instance creation with default parameters"""
         mock_response = MagicMock()
@@ -282,7 +285,7 @@ class TestInstance(unittest.TestCase):
         self.assertEqual(json_data["area"], [])
         self.assertEqual(json_data["conf"], {})
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_create_instance_with_custom_params(self, mock_request):
         """Test instance creation with custom parameters"""
         mock_response = MagicMock()
@@ -321,7 +324,7 @@ class TestInstance(unittest.TestCase):
         self.assertEqual(json_data["custom_param"], "custom_value")
         self.assertEqual(json_data["another_param"], 123)
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_list_instances_with_custom_params(self, mock_request):
         """Test list instances with custom parameters"""
         mock_response = MagicMock()
@@ -344,7 +347,7 @@ class TestInstance(unittest.TestCase):
         self.assertEqual(params["limit"], 25)
         self.assertEqual(params["mode"], "baremetal")
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_control_instance_with_complex_kwargs(self, mock_request):
         """Test control instance with complex kwargs"""
         mock_response = MagicMock()
@@ -375,5 +378,56 @@ class TestInstance(unittest.TestCase):
         self.assertEqual(json_data["env_vars"]["NODE_ENV"], "production")
         self.assertEqual(json_data["working_dir"], "/app")
 
+class TestAsyncInstance(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.transport = AsyncInMemoryTransport()
+        self.client = AsyncSubModelClient(token="test-token", transport=self.transport)
+        self.instance = self.client.instance
+
+    async def test_native_manager(self):
+        """Test the async client's instance manager is natively async"""
+        self.assertIsInstance(self.instance, AsyncInstance)
+
+    async def test_create_and_control(self):
+        """Test async create and control send the same payloads as the sync manager"""
+        self.transport.add_route("POST", "inst/create", {"code": 20000, "data": {"inst_id": "i1"}})
+        self.transport.add_route("POST", "inst/action/run/i1", {"code": 20000})
+        self.transport.add_route("POST", "inst/delete/i1", {"code": 20000})
+
+        result = await self.instance.create(plan="gpu-a100", area=["us"])
+        self.assertEqual(result["data"]["inst_id"], "i1")
+        payload = self.transport.calls[-1][2]["json"]
+        self.assertEqual(payload["plan"], "gpu-a100")
+        self.assertEqual(payload["area"], ["us"])
+        self.assertEqual(payload["conf"], {})
+
+        await self.instance.control_instance("run", "i1", ports=[80])
+        self.assertEqual(self.transport.calls[-1][2]["json"], {"ports": [80]})
+        await self.instance.delete_instance("i1")
+        with self.assertRaises(ValueError):
+            await self.instance.control_instance("explode", "i1")
+
+    async def test_pods(self):
+        """Test async pod calls"""
+        self.transport.add_route("GET", "inst/cont/i1", {"code": 20000, "data": [{"pod_id": "p1"}]})
+        self.transport.add_route("GET", "inst/i1/pod/p1/logs", {"code": 20000, "data": "log"})
+        self.transport.add_route("GET", "inst/i1/pod/p1/terminate", {"code": 20000})
+
+        self.assertEqual((await self.instance.get_pods("i1"))["data"], [{"pod_id": "p1"}])
+        self.assertEqual((await self.instance.get_pod_logs("i1", "p1"))["data"], "log")
+        self.assertEqual((await self.instance.terminate_pod("i1", "p1"))["code"], 20000)
+
+    async def test_list_all_instances(self):
+        """Test every instance is fetched with the requested mode"""
+        def handler(method, url, headers, params=None, **kwargs):
+            start = (params["page"] - 1) * params["limit"]
+            items = list(range(start, min(start + params["limit"], 250)))
+            return {"code": 20000, "data": {"total": 250, "items": items}}
+
+        self.transport.add_route("GET", "inst/list", handler)
+        self.assertEqual(await self.instance.list_all_instances(mode="baremetal"), list(range(250)))
+        self.assertEqual([i async for i in self.instance.iter_instances(limit=100)], list(range(250)))
+        self.assertTrue(all(call[2]["params"]["mode"] in ("baremetal", "pod") for call in self.transport.calls))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
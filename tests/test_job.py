@@ -1,7 +1,9 @@
+import asyncio
 import pytest
 import time
-from unittest.mock import Mock, patch
-from submodel.sdk.job import Job
+from unittest.mock import AsyncMock, Mock, patch
+from submodel.sdk.job import AsyncJob, Job
+from submodel.sdk.async_client import AsyncSubModelClient
 from submodel.sdk.client import SubModelClient
 
 
@@ -119,3 +121,45 @@ class TestJob:
         assert mock_client.get.call_count == 3
         assert mock_sleep.call_count == 2
         assert result == {"status": "completed", "result": "success"}
+
+
+class TestAsyncJob:
+    """Test AsyncJob class"""
+    
+    @pytest.fixture
+    def mock_client(self):
+        """Create mock async client"""
+        client = Mock(spec=AsyncSubModelClient)
+        client.get = AsyncMock()
+        return client
+    
+    def test_wait_with_polling(self, mock_client):
+        """Test wait polls on the event loop until the job completes"""
+        mock_client.get.side_effect = [
+            {"status": "running", "progress": 30},
+            {"status": "completed", "result": "success"}
+        ]
+        job = AsyncJob(mock_client, "test-inst-id", "test-job-id")
+        
+        with patch('asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            result = asyncio.run(job.wait(poll_interval=0.5))
+        
+        mock_client.get.assert_called_with("sl/test-inst-id/status/test-job-id")
+        mock_sleep.assert_awaited_once_with(0.5)
+        assert result == {"status": "completed", "result": "success"}
+    
+    def test_wait_timeout(self, mock_client):
+        """Test wait raises TimeoutError once the timeout has passed"""
+        mock_client.get.return_value = {"status": "running"}
+        job = AsyncJob(mock_client, "test-inst-id", "test-job-id")
+        
+        with pytest.raises(TimeoutError, match="Job wait timeout"):
+            asyncio.run(job.wait(timeout=0.02, poll_interval=0.01))
+    
+    def test_cancel(self, mock_client):
+        """Test cancel method"""
+        mock_client.get.return_value = {"status": "cancelled"}
+        job = AsyncJob(mock_client, "test-inst-id", "test-job-id")
+        
+        assert asyncio.run(job.cancel()) == {"status": "cancelled"}
+        mock_client.get.assert_awaited_once_with("sl/test-inst-id/cancel/test-job-id")
@@ -0,0 +1,92 @@
+import json
+import unittest
+from submodel.sdk.async_client import AsyncSubModelClient
+from submodel.sdk.client import SubModelClient
+from submodel.sdk.exceptions import AuthenticationError
+from submodel.sdk.jsonstream import JSONItemStream
+from submodel.sdk.transport import AsyncInMemoryTransport, InMemoryTransport, TransportResponse
+
+DOCUMENT = {
+    "code": 20000,
+    "message": "ok",
+    "data": {
+        "total": 6,
+        "meta": {"filters": [1, {"tricky": "]},\""}]},
+        "items": [{"id": "dévice-1", "note": "a \"quoted\" ]}"}, [1, 2], 3.5e3, -0.25, None, True],
+        "page": 1,
+    },
+}
+
+def parse(body: bytes, chunk_size: int, path=("data", "items")):
+    parser = JSONItemStream(path)
+    items = []
+    for start in range(0, len(body), chunk_size):
+        items.extend(parser.feed(body[start:start + chunk_size]))
+    items.extend(parser.close())
+    return items, parser
+
+class TestJSONItemStream(unittest.TestCase):
+    def test_any_chunking(self):
+        """Test items and envelope are the same however the body is split"""
+        envelope = json.loads(json.dumps(DOCUMENT))
+        envelope["data"]["items"] = []
+        for indent in (None, 2):
+            body = json.dumps(DOCUMENT, indent=indent, ensure_ascii=False).encode()
+            for chunk_size in (1, 2, 3, 7, 64, len(body)):
+                with self.subTest(indent=indent, chunk_size=chunk_size):
+                    items, parser = parse(body, chunk_size)
+                    self.assertEqual(items, DOCUMENT["data"]["items"])
+                    self.assertEqual(parser.envelope, envelope)
+
+    def test_items_yielded_as_they_complete(self):
+        """Test an item is returned by the chunk that completes it"""
+        parser = JSONItemStream()
+        self.assertEqual(parser.feed(b'{"code": 20000, "data": {"items": [{"id": 1}, {"id"'), [{"id": 1}])
+        self.assertEqual(parser.feed(b': 2}, 1'), [{"id": 2}])
+        self.assertEqual(parser.feed(b'2]}}'), [12])
+        self.assertEqual(parser.close(), [])
+
+    def test_invalid_bodies(self):
+        """Test truncated and malformed bodies raise ValueError"""
+        for body in (b'{"data": {"items": [1, 2', b'[1, 2]', b'{"data": {"items": [1 2]}}', b'{"data": {"items": [1.]}}'):
+            with self.subTest(body=body):
+                with self.assertRaises(ValueError):
+                    parse(body, 4)
+
+    def test_missing_array(self):
+        """Test a body without the array yields nothing but keeps the envelope"""
+        items, parser = parse(b'{"code": 40100, "message": "Unauthorized"}', 5)
+        self.assertEqual(items, [])
+        self.assertEqual(parser.envelope, {"code": 40100, "message": "Unauthorized"})
+
+class TestStreamItems(unittest.TestCase):
+    def test_stream_devices(self):
+        """Test Device.stream_devices yields the items of device/list"""
+        transport = InMemoryTransport()
+        transport.add_route("GET", "device/list", DOCUMENT)
+        client = SubModelClient(token="test-token", transport=transport)
+
+        self.assertEqual(list(client.device.stream_devices(limit=5000)), DOCUMENT["data"]["items"])
+        self.assertEqual(transport.calls[0][2]["params"], {"page": 1, "limit": 5000})
+
+    def test_api_error_raised(self):
+        """Test API error codes in the envelope are raised after the body"""
+        transport = InMemoryTransport()
+        transport.add_route("GET", "device/list", {"code": 40100, "message": "Unauthorized"})
+        client = SubModelClient(token="test-token", transport=transport)
+
+        with self.assertRaises(AuthenticationError):
+            list(client.stream_items("device/list"))
+
+class TestAsyncStreamItems(unittest.IsolatedAsyncioTestCase):
+    async def test_stream_items(self):
+        """Test the async client yields items from the streamed body"""
+        body = json.dumps(DOCUMENT).encode()
+        transport = AsyncInMemoryTransport()
+        transport.add_route("GET", "device/list", TransportResponse(200, content=body))
+        async with AsyncSubModelClient(token="test-token", transport=transport) as client:
+            items = [item async for item in client.stream_items("device/list", chunk_size=16)]
+        self.assertEqual(items, DOCUMENT["data"]["items"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+import json
+import threading
+import time
+import unittest
+from unittest.mock import patch
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from submodel.sdk.async_client import AsyncSubModelClient
+from submodel.sdk.client import SubModelClient
+from submodel.sdk.exceptions import AuthenticationError, ServerError
+from submodel.sdk.lazy import LazyItems, LazyResponse
+from submodel.sdk.retries import RetryPolicy
+from submodel.sdk.transport import AsyncInMemoryTransport, InMemoryTransport, TransportResponse
+
+DOCUMENT = {
+    "code": 20000,
+    "data": {
+        "total": 6,
+        "meta": {"filters": [1, {"tricky": "]},\""}]},
+        "items": [{"id": "dévice-1", "note": "a \"quoted\" ]}"}, [1, 2], 3.5e3, -0.25, None, True],
+        "page": 1,
+    },
+    "message": "ok",
+}
+
+class TestLazyResponse(unittest.TestCase):
+    def test_decodes_like_json(self):
+        """Test the view decodes to the same document however it is formatted"""
+        for indent in (None, 2):
+            with self.subTest(indent=indent):
+                view = LazyResponse(json.dumps(DOCUMENT, indent=indent, ensure_ascii=False).encode())
+                self.assertEqual(view.to_dict(), DOCUMENT)
+                self.assertEqual(view, DOCUMENT)
+                self.assertEqual(list(view.array), DOCUMENT["data"]["items"])
+
+    def test_items_decoded_on_access(self):
+        """Test the array is only indexed as far as it is read"""
+        view = LazyResponse(json.dumps(DOCUMENT))
+        self.assertEqual(view["code"], 20000)
+        self.assertEqual(view["data"]["total"], 6)
+        items = view.array
+        self.assertIsInstance(items, LazyItems)
+        self.assertEqual(len(items._starts), 0)
+        self.assertEqual(items[1], [1, 2])
+        self.assertEqual(len(items._starts), 2)
+        self.assertEqual(items[:3], DOCUMENT["data"]["items"][:3])
+        self.assertEqual(len(items._starts), 3)
+
+    def test_members_after_array(self):
+        """Test members after the array are decoded when first looked up"""
+        view = LazyResponse(json.dumps(DOCUMENT))
+        self.assertNotIn("message", view._members)
+        self.assertEqual(view["message"], "ok")
+        self.assertEqual(view["data"]["page"], 1)
+        self.assertEqual(len(view.array._starts), 6)
+        self.assertNotIn("missing", view)
+
+    def test_concurrent_lookup_waits_for_members(self):
+        """Test a lookup during another thread's decoding waits instead of missing"""
+        view = LazyResponse(json.dumps(DOCUMENT))
+        end = LazyItems.end
+        started = threading.Event()
+
+        def slow_end(items):
+            started.set()
+            time.sleep(0.05)
+            return end(items)
+
+        with patch.object(LazyItems, "end", slow_end):
+            reader = threading.Thread(target=lambda: view["data"]["page"])
+            reader.start()
+            started.wait(5)
+            self.assertEqual(view["message"], "ok")
+            reader.join(5)
+
+    def test_invalid_tail_raises_again(self):
+        """Test a body broken after the array raises on every lookup"""
+        view = LazyResponse(b'{"data": {"items": [1, 2], "total": }}')
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                view["data"]["total"]
+
+    def test_sequence_access(self):
+        """Test negative indexes, slices and out of range indexes"""
+        items = LazyResponse(json.dumps(DOCUMENT)).array
+        expected = DOCUMENT["data"]["items"]
+        self.assertEqual(items[-1], True)
+        self.assertEqual(items[-3:], expected[-3:])
+        self.assertEqual(items[::2], expected[::2])
+        self.assertEqual(len(items), 6)
+        with self.assertRaises(IndexError):
+            items[6]
+        with self.assertRaises(IndexError):
+            items[-7]
+
+    def test_missing_or_empty_array(self):
+        """Test envelopes without items have an empty array"""
+        self.assertEqual(list(LazyResponse(b'{"code": 40100, "message": "Unauthorized"}').array), [])
+        empty = LazyResponse(b'{"code": 20000, "data": {"items": [ ], "total": 0}}')
+        self.assertFalse(empty.array)
+        self.assertEqual(empty["data"]["total"], 0)
+
+    def test_invalid_bodies(self):
+        """Test malformed bodies raise ValueError"""
+        for body in (b'[1, 2]', b'{"code": 1,}', b'{"data": {"items": [1 2]}}', b'{"data": {"items": [1]}} x'):
+            with self.subTest(body=body):
+                with self.assertRaises(ValueError):
+                    LazyResponse(body).to_dict()
+
+class TestGetLazy(unittest.TestCase):
+    def test_list_devices_lazy(self):
+        """Test Device.list_devices(lazy=True) returns a view of device/list"""
+        transport = InMemoryTransport()
+        transport.add_route("GET", "device/list", DOCUMENT)
+        client = SubModelClient(token="test-token", transport=transport)
+
+        page = client.device.list_devices(limit=5000, lazy=True)
+        self.assertIsInstance(page, LazyResponse)
+        self.assertEqual(page["data"]["total"], 6)
+        self.assertEqual(page.array[0], DOCUMENT["data"]["items"][0])
+        self.assertEqual(transport.calls[0][2]["params"], {"page": 1, "limit": 5000})
+
+    def test_api_error_raised(self):
+        """Test API error codes in the envelope are raised"""
+        transport = InMemoryTransport()
+        transport.add_route("GET", "inst/list", {"code": 40100, "message": "Unauthorized"})
+        client = SubModelClient(token="test-token", transport=transport)
+
+        with self.assertRaises(AuthenticationError):
+            client.instance.list_instances(lazy=True)
+
+    def test_retried(self):
+        """Test server error codes are retried like other requests"""
+        answers = [{"code": 50000, "message": "busy"}, DOCUMENT]
+        transport = InMemoryTransport()
+        transport.add_route("GET", "device/list", lambda method, url, headers, **kwargs: answers.pop(0))
+        client = SubModelClient(token="test-token", transport=transport,
+                                retry_policy=RetryPolicy(max_retries=1, backoff_factor=0))
+
+        self.assertEqual(client.get_lazy("device/list").array[-1], True)
+        self.assertEqual(len(transport.calls), 2)
+
+class TestAsyncGetLazy(unittest.IsolatedAsyncioTestCase):
+    async def test_list_instances_lazy(self):
+        """Test the async client returns a view of the response body"""
+        body = json.dumps(DOCUMENT).encode()
+        transport = AsyncInMemoryTransport()
+        transport.add_route("GET", "inst/list", TransportResponse(200, content=body))
+        async with AsyncSubModelClient(token="test-token", transport=transport) as client:
+            page = await client.instance.list_instances(limit=500, lazy=True)
+        self.assertEqual(page["data"]["total"], 6)
+        self.assertEqual(list(page.array), DOCUMENT["data"]["items"])
+
+    async def test_api_error_raised(self):
+        """Test server errors in the envelope are raised"""
+        transport = AsyncInMemoryTransport()
+        transport.add_route("GET", "device/list", TransportResponse(200, data={"code": 50000, "message": "down"}))
+        async with AsyncSubModelClient(token="test-token", transport=transport, max_retries=0) as client:
+            with self.assertRaises(ServerError):
+                await client.device.list_devices(lazy=True)
+
+    async def test_aiohttp_body_not_decoded(self):
+        """Test the default aiohttp transport hands over the body as received"""
+        body = json.dumps(DOCUMENT, indent=1)
+
+        async def handler(request):
+            return web.Response(text=body, content_type="application/json")
+
+        app = web.Application()
+        app.router.add_get("/api/v1/inst/list", handler)
+        async with TestServer(app) as server:
+            async with AsyncSubModelClient(token="test-token", close_on_exit=True) as client:
+                client.base_url = str(server.make_url("/api/v1"))
+                page = await client.get_lazy("inst/list")
+        self.assertEqual(page.text, body)
+        self.assertEqual(list(page.array), DOCUMENT["data"]["items"])
+
+if __name__ == "__main__":
+    unittest.main()
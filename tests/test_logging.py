@@ -0,0 +1,161 @@
+import logging
+import queue
+import unittest
+from unittest.mock import patch
+from submodel.sdk import utils
+from submodel.sdk.client import SubModelClient
+from submodel.sdk.transport import InMemoryTransport
+from submodel.sdk.utils import (
+    configure_logging,
+    disable_async_logging,
+    enable_async_logging,
+    log_request,
+    log_response,
+    logger,
+    set_body_logging,
+    set_log_level,
+)
+
+class ListHandler(logging.Handler):
+    """Handler collecting formatted messages"""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+class TestBodyLogging(unittest.TestCase):
+    def setUp(self):
+        self.level = logger.level
+
+    def tearDown(self):
+        set_body_logging()
+        set_log_level(self.level)
+
+    def test_no_serialization_above_debug(self):
+        """Test bodies are not serialized unless DEBUG is enabled"""
+        set_log_level(logging.INFO)
+        with patch('submodel.sdk.utils._format_body') as mock_format:
+            log_request("POST", "https://example.com", json={"big": list(range(1000))})
+            log_response({"code": 20000})
+            transport = InMemoryTransport(handler=lambda *args, **kwargs: {"code": 20000})
+            SubModelClient(token="test-token", transport=transport).post("inst/create", json={"mode": "pod"})
+        mock_format.assert_not_called()
+
+    def test_truncated_bodies(self):
+        """Test long bodies are cut to the configured length"""
+        set_log_level(logging.DEBUG)
+        set_body_logging(max_length=10)
+        with self.assertLogs("submodel", logging.DEBUG) as logs:
+            log_response({"data": "x" * 100})
+        self.assertEqual(len(logs.records), 1)
+        message = logs.records[0].getMessage()
+        self.assertEqual(message, 'Response: {"data": "... (truncated dict of length 1)')
+
+    def test_large_bodies_not_serialized(self):
+        """Test only the logged prefix of a large body is serialized"""
+        converted = []
+
+        class Item:
+            def __str__(self):
+                converted.append(self)
+                return "item"
+
+        set_log_level(logging.DEBUG)
+        set_body_logging(max_length=20)
+        with self.assertLogs("submodel", logging.DEBUG) as logs:
+            log_request("POST", "https://example.com", json=[Item() for _ in range(10000)])
+            log_response("y" * 100000)
+        self.assertLess(len(converted), 10)
+        self.assertEqual(logs.records[1].getMessage(), 'Request Body: ["item", "item", "it... (truncated list of length 10000)')
+        self.assertEqual(logs.records[2].getMessage(), 'Response: "' + "y" * 19 + '... (99980 more characters)')
+
+    def test_sampled_bodies(self):
+        """Test unsampled bodies are skipped while requests are still logged"""
+        set_log_level(logging.DEBUG)
+        set_body_logging(sample_rate=0)
+        with self.assertLogs("submodel", logging.DEBUG) as logs:
+            log_request("POST", "https://example.com", json={"a": 1})
+            log_response({"code": 20000})
+        self.assertEqual([r.getMessage() for r in logs.records], ["Request: POST https://example.com"])
+
+        set_body_logging(sample_rate=0.5)
+        with patch('random.random', side_effect=[0.2, 0.7]), self.assertLogs("submodel", logging.DEBUG) as logs:
+            log_response({"n": 1})
+            log_response({"n": 2})
+            logger.debug("end")
+        self.assertEqual(len(logs.records), 2)
+
+class TestAsyncLogging(unittest.TestCase):
+    def tearDown(self):
+        disable_async_logging()
+
+    def test_records_written_by_listener(self):
+        """Test records go through the queue and handlers are restored after"""
+        previous = list(logger.handlers)
+        sink = ListHandler()
+        listener = enable_async_logging(sink)
+        self.assertTrue(all(isinstance(h, utils._DroppingQueueHandler) for h in logger.handlers))
+        self.assertIn(sink, listener.handlers)
+
+        logger.warning("retrying %s", "inst/list")
+        disable_async_logging()
+
+        self.assertEqual(sink.messages, ["retrying inst/list"])
+        self.assertEqual(logger.handlers, previous)
+
+    def test_full_queue_drops(self):
+        """Test records are dropped instead of blocking when the queue is full"""
+        sink = ListHandler()
+        enable_async_logging(sink, queue_size=1)
+        queue_handler = logger.handlers[0]
+        with patch.object(queue_handler.queue, 'put_nowait', side_effect=queue.Full):
+            logger.warning("lost")
+        self.assertEqual(queue_handler.dropped, 1)
+
+class TestConfigureLogging(unittest.TestCase):
+    def setUp(self):
+        self.handlers = list(logger.handlers)
+        self.level = logger.level
+
+    def tearDown(self):
+        disable_async_logging()
+        logger.handlers = self.handlers
+        logger.propagate = True
+        set_log_level(self.level)
+        utils._configured_handler = None
+
+    def test_library_default(self):
+        """Test the SDK installs no output handler of its own"""
+        self.assertIsInstance(utils.handler, logging.NullHandler)
+
+    def test_replaces_previous_configuration(self):
+        """Test repeated configuration does not duplicate output"""
+        first = configure_logging(logging.DEBUG, handler=ListHandler(), background=False)
+        second = configure_logging(logging.DEBUG, handler=ListHandler(), background=False)
+        self.assertNotIn(first, logger.handlers)
+        self.assertIn(second, logger.handlers)
+        self.assertFalse(logger.propagate)
+
+        logger.info("once")
+        self.assertEqual((first.messages, second.messages), ([], ["once"]))
+
+    def test_background_pipeline(self):
+        """Test retry messages are written by the listener thread"""
+        sink = ListHandler()
+        configure_logging(logging.INFO, handler=sink)
+        self.assertNotIn(sink, logger.handlers)
+
+        transport = InMemoryTransport(handler=lambda *args, **kwargs: {"code": 50000, "message": "busy"})
+        client = SubModelClient(token="test-token", transport=transport, max_retries=1, backoff_factor=0)
+        with self.assertRaises(Exception):
+            client.get("inst/list")
+        disable_async_logging()
+
+        self.assertTrue(any(m.startswith("Request failed (busy), retrying") for m in sink.messages))
+        self.assertIn(sink, logger.handlers)
+
+if __name__ == '__main__':
+    unittest.main()
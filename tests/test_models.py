@@ -0,0 +1,113 @@
+import pickle
+import unittest
+from submodel.sdk.async_client import AsyncSubModelClient
+from submodel.sdk.client import SubModelClient
+from submodel.sdk.job import Job
+from submodel.sdk.models import AreaRecord, BaremetalRecord, DeviceRecord, InstanceRecord, JobRecord
+from submodel.sdk.transport import AsyncInMemoryTransport, InMemoryTransport
+
+# Payload shapes of tests/test_device.py and tests/test_serverless.py
+DEVICE = {"id": "device1", "status": "online", "machine_id": "test123"}
+
+def list_handler(items):
+    def handler(method, url, headers, params=None, **kwargs):
+        start = (params["page"] - 1) * params["limit"]
+        return {"code": 20000, "data": {"total": len(items), "items": items[start:start + params["limit"]]}}
+    return handler
+
+class TestRecord(unittest.TestCase):
+    def test_from_dict(self):
+        """Test the keys of real payloads become fields, leaving no extra dict"""
+        record = DeviceRecord.from_dict(DEVICE)
+        self.assertEqual((record.id, record.machine_id, record.status), ("device1", "test123", "online"))
+        self.assertIsNone(record.extra)
+        self.assertEqual(record.to_dict(), DEVICE)
+        self.assertFalse(hasattr(record, "__dict__"))
+        for record_type, payload in ((AreaRecord, {"id": "area1", "name": "Zone A", "status": "active"}),
+                                     (BaremetalRecord, {"id": "bm1", "type": "gpu"}),
+                                     (InstanceRecord, {"inst_id": "test-id", "status": "running", "mode": "pod"})):
+            with self.subTest(record_type=record_type.__name__):
+                record = record_type.from_dict(payload)
+                self.assertIsNone(record.extra)
+                self.assertEqual(record.to_dict(), payload)
+
+    def test_unknown_keys_kept(self):
+        """Test keys a record has no field for are kept in extra"""
+        record = DeviceRecord.from_dict(dict(DEVICE, rack="r7"))
+        self.assertEqual(record.extra, {"rack": "r7"})
+        self.assertEqual(record.to_dict(), dict(DEVICE, rack="r7"))
+        self.assertEqual(InstanceRecord.from_dict({"inst_id": "a", "area": ["us"]}).area, ("us",))
+
+    def test_dict_compatibility(self):
+        """Test records can be read like the raw dicts"""
+        record = DeviceRecord.from_dict(DEVICE)
+        self.assertEqual(record["status"], "online")
+        self.assertEqual(record["machine_id"], "test123")
+        self.assertEqual(DeviceRecord.from_dict(dict(DEVICE, rack="r7"))["rack"], "r7")
+        self.assertEqual(record.get("missing", 1), 1)
+        with self.assertRaises(KeyError):
+            record["missing"]
+
+    def test_interned_values(self):
+        """Test categorical strings are shared between records"""
+        first = InstanceRecord.from_dict({"inst_id": "a", "status": "".join(["run", "ning"])})
+        second = InstanceRecord.from_dict({"inst_id": "b", "status": "".join(["runn", "ing"])})
+        self.assertIs(first.status, second.status)
+
+    def test_equality_and_pickle(self):
+        """Test records compare by value and survive pickling"""
+        record = AreaRecord(id=1, name="us-east", zone="a")
+        self.assertEqual(record.extra, {"zone": "a"})
+        self.assertEqual(record, AreaRecord.from_dict({"id": 1, "name": "us-east", "zone": "a"}))
+        self.assertNotEqual(record, AreaRecord(id=2, name="us-east"))
+        self.assertEqual(pickle.loads(pickle.dumps(record)), record)
+        self.assertEqual(repr(AreaRecord(id=1)), "AreaRecord(id=1)")
+
+class TestRecordsOptIn(unittest.TestCase):
+    def setUp(self):
+        self.devices = [dict(DEVICE, id=f"device{i}") for i in range(25)]
+        self.transport = InMemoryTransport()
+        self.transport.add_route("GET", "device/list", list_handler(self.devices))
+        self.client = SubModelClient(token="test-token", transport=self.transport)
+
+    def test_dicts_by_default(self):
+        """Test the raw dicts are still returned unless records are asked for"""
+        self.assertEqual(list(self.client.device.iter_devices(limit=10)), self.devices)
+        self.assertEqual(self.client.device.list_all_devices(), self.devices)
+
+    def test_records(self):
+        """Test the list helpers return records when asked"""
+        for devices in (list(self.client.device.iter_devices(limit=10, records=True)),
+                        list(self.client.device.stream_devices(limit=100, records=True)),
+                        self.client.device.list_all_devices(records=True)):
+            self.assertTrue(all(isinstance(d, DeviceRecord) for d in devices))
+            self.assertEqual([d.to_dict() for d in devices], self.devices)
+
+    def test_job_status(self):
+        """Test job statuses nested in data are read as records"""
+        self.transport.add_route("GET", "sl/i1/status/j1", {"code": 20000, "data": {"status": "completed", "result": 42}})
+        status = Job(self.client, "i1", "j1").get_status(records=True)
+        self.assertIsInstance(status, JobRecord)
+        self.assertEqual((status.status, status.result), ("completed", 42))
+        self.assertIsNone(status.extra)
+
+    def test_job_status_without_envelope(self):
+        """Test a bare job status is read as a record too"""
+        status = JobRecord.from_dict({"status": "failed", "error": "Processing error"})
+        self.assertEqual((status.status, status.error), ("failed", "Processing error"))
+
+class TestAsyncRecords(unittest.IsolatedAsyncioTestCase):
+    async def test_records(self):
+        """Test the async list helpers return records when asked"""
+        instances = [{"inst_id": f"i{n}", "status": "running", "mode": "pod"} for n in range(15)]
+        transport = AsyncInMemoryTransport()
+        transport.add_route("GET", "inst/list", list_handler(instances))
+        async with AsyncSubModelClient(token="test-token", transport=transport) as client:
+            iterated = [i async for i in client.instance.iter_instances(limit=10, records=True)]
+            fetched = await client.instance.list_all_instances(records=True)
+        for records in (iterated, fetched):
+            self.assertTrue(all(isinstance(i, InstanceRecord) for i in records))
+            self.assertEqual([i.to_dict() for i in records], instances)
+
+if __name__ == "__main__":
+    unittest.main()
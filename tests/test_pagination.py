@@ -0,0 +1,232 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from submodel.sdk.async_client import AsyncSubModelClient
+from submodel.sdk.client import SubModelClient
+from submodel.sdk.exceptions import ServerError
+from submodel.sdk.pagination import PagePlan, aiter_pages, choose_page_size, iter_pages, last_page, shutdown_executor
+from submodel.sdk.transport import AsyncInMemoryTransport, InMemoryTransport, TransportResponse
+
+def page_of(page, limit, total, with_total=True):
+    start = (page - 1) * limit
+    items = list(range(start, min(start + limit, total)))
+    data = {"page": page, "limit": limit, "items": items}
+    if with_total:
+        data["total"] = total
+    return {"code": 20000, "data": data}
+
+def list_route(total, seen, with_total=True, max_limit=None):
+    def handler(method, url, headers, params=None, **kwargs):
+        seen.append(dict(params))
+        return page_of(params["page"], min(params["limit"], max_limit or params["limit"]), total, with_total)
+    return handler
+
+class TestIterPages(unittest.TestCase):
+    def test_last_page(self):
+        """Test the last page is derived from the total"""
+        self.assertEqual(last_page({"data": {"total": 25}}, 10), 3)
+        self.assertEqual(last_page({"data": {"total": 0}}, 10), 1)
+        self.assertIsNone(last_page({"data": {}}, 10))
+
+    def test_walks_every_page(self):
+        """Test every page is fetched once, in order, and none past the total"""
+        for prefetch in (0, 1, 3):
+            with self.subTest(prefetch=prefetch):
+                fetched = []
+
+                def fetch(page):
+                    fetched.append(page)
+                    return page_of(page, 10, 25)
+
+                responses = list(iter_pages(fetch, 10, prefetch=prefetch))
+                self.assertEqual([r["data"]["page"] for r in responses], [1, 2, 3])
+                self.assertEqual(sorted(fetched), [1, 2, 3])
+
+    def test_short_page_ends_walk_without_total(self):
+        """Test a page with fewer items than the limit is the last one"""
+        fetched = []
+
+        def fetch(page):
+            fetched.append(page)
+            return page_of(page, 10, 15, with_total=False)
+
+        items = [i for r in iter_pages(fetch, 10, prefetch=0) for i in r["data"]["items"]]
+        self.assertEqual(items, list(range(15)))
+        self.assertEqual(fetched, [1, 2])
+
+    def test_next_page_fetched_while_processing(self):
+        """Test page N+1 is requested before the caller is done with page N"""
+        requested = {page: threading.Event() for page in (1, 2, 3)}
+
+        def fetch(page):
+            requested[page].set()
+            return page_of(page, 10, 30)
+
+        pages = iter_pages(fetch, 10, prefetch=2)
+        next(pages)
+        self.assertTrue(requested[2].wait(1))
+        self.assertTrue(requested[3].wait(1))
+        pages.close()
+
+    def test_error_raised_in_order(self):
+        """Test a failed page raises when the caller reaches it"""
+        def fetch(page):
+            if page == 2:
+                raise ServerError("boom", 50000)
+            return page_of(page, 10, 30)
+
+        pages = iter_pages(fetch, 10, prefetch=2)
+        self.assertEqual(next(pages)["data"]["page"], 1)
+        with self.assertRaises(ServerError):
+            next(pages)
+
+    def test_client_paginate(self):
+        """Test managers walk their list endpoints with page and limit"""
+        seen = []
+        transport = InMemoryTransport()
+        transport.add_route("GET", "device/list", list_route(250, seen))
+        transport.add_route("GET", "inst/list", list_route(5, seen))
+        client = SubModelClient(token="test-token", transport=transport)
+
+        self.assertEqual(list(client.device.iter_devices(limit=100, search="gpu")), list(range(250)))
+        self.assertEqual(sorted(p["page"] for p in seen), [1, 2, 3])
+        self.assertTrue(all(p["search"] == "gpu" and p["limit"] == 100 for p in seen))
+
+        seen.clear()
+        self.assertEqual(list(client.instance.iter_instances(limit=10)), list(range(5)))
+        self.assertEqual(seen, [{"mode": "pod", "page": 1, "limit": 10}])
+
+class TestShutdownExecutor(unittest.TestCase):
+    def test_queued_calls_cancelled(self):
+        """Test calls that have not started are cancelled, also without cancel_futures (Python 3.8)"""
+        for version in ((3, 8, 0), (3, 11, 0)):
+            with self.subTest(version=version):
+                release = threading.Event()
+                executor = ThreadPoolExecutor(max_workers=1)
+                running = executor.submit(release.wait)
+                queued = [executor.submit(time.sleep, 0) for _ in range(3)]
+                with mock.patch("sys.version_info", version):
+                    shutdown_executor(executor, [running, *queued])
+                release.set()
+                self.assertTrue(running.result())
+                self.assertTrue(all(future.cancelled() for future in queued))
+
+class TestFetchAll(unittest.TestCase):
+    def setUp(self):
+        self.seen = []
+        self.transport = InMemoryTransport()
+        self.client = SubModelClient(token="test-token", transport=self.transport)
+
+    def test_choose_page_size(self):
+        """Test the page size needs the fewest rounds with the smallest pages"""
+        self.assertEqual(choose_page_size(10000, 8, 1000), 625)   # 16 pages in 2 rounds
+        self.assertEqual(choose_page_size(4000, 8, 1000), 500)    # 8 pages in 1 round
+        self.assertEqual(choose_page_size(50000, 8, 1000), 893)   # 56 pages in 7 rounds
+        self.assertEqual(choose_page_size(64000, 8, 1000), 1000)  # Capped at max_limit
+        self.assertEqual(choose_page_size(3, 8, 1000), 1)
+
+    def test_plan_trims_overlap(self):
+        """Test pages of a different size than the first are trimmed to fit"""
+        plan = PagePlan(page_of(1, 100, 1000), 100, 300, 8, 1000)
+        self.assertEqual(plan.pages, [1, 2, 3, 4])
+        responses = [page_of(page, 300, 1000) for page in plan.pages]
+        self.assertEqual(plan.assemble(responses), list(range(1000)))
+
+    def test_fetch_all(self):
+        """Test every item is fetched once and in order"""
+        self.transport.add_route("GET", "inst/list", list_route(2345, self.seen))
+        for limit in (None, 100, 250):
+            with self.subTest(limit=limit):
+                self.seen.clear()
+                items = self.client.fetch_all("inst/list", params={"mode": "pod"}, limit=limit)
+                self.assertEqual(items, list(range(2345)))
+                self.assertTrue(all(p["mode"] == "pod" for p in self.seen))
+                if limit:
+                    self.assertEqual(sorted(p["page"] for p in self.seen), list(range(1, -(-2345 // limit) + 1)))
+                else:
+                    self.assertEqual(len(self.seen), 1 + 8)  # The first page, then one round
+
+    def test_capped_page_size(self):
+        """Test an API serving fewer items than asked for still yields every item"""
+        self.transport.add_route("GET", "device/list", list_route(950, self.seen, max_limit=50))
+        self.assertEqual(self.client.fetch_all("device/list"), list(range(950)))
+        self.assertEqual(len(self.seen), 19)
+
+    def test_without_total(self):
+        """Test lists without a total are walked page by page"""
+        self.transport.add_route("GET", "area/list", list_route(250, self.seen, with_total=False))
+        self.assertEqual(self.client.fetch_all("area/list", limit=100, concurrency=1), list(range(250)))
+        self.assertEqual(sorted(p["page"] for p in self.seen), [1, 2, 3])
+
+    def test_page_error(self):
+        """Test a failed page fails the whole fetch"""
+        def handler(method, url, headers, params=None, **kwargs):
+            if params["page"] == 3:
+                return {"code": 40100, "message": "Unauthorized"}
+            return page_of(params["page"], params["limit"], 1000)
+
+        self.transport.add_route("GET", "inst/list", handler)
+        with self.assertRaises(Exception):
+            self.client.fetch_all("inst/list", limit=100)
+
+class TestAsyncIterPages(unittest.IsolatedAsyncioTestCase):
+    async def test_walks_every_page(self):
+        """Test the async iterator yields every page in order"""
+        for prefetch in (0, 2):
+            with self.subTest(prefetch=prefetch):
+                async def fetch(page):
+                    await asyncio.sleep(0.001 * (4 - page))  # Later pages answer first
+                    return page_of(page, 10, 35)
+
+                pages = [r["data"]["page"] async for r in aiter_pages(fetch, 10, prefetch=prefetch)]
+                self.assertEqual(pages, [1, 2, 3, 4])
+
+    async def test_prefetch_overlaps_processing(self):
+        """Test prefetching hides page latency behind processing"""
+        async def fetch(page):
+            await asyncio.sleep(0.05)
+            return page_of(page, 10, 40)
+
+        started = time.monotonic()
+        async for _ in aiter_pages(fetch, 10, prefetch=1):
+            await asyncio.sleep(0.05)  # Processing a page
+        elapsed = time.monotonic() - started
+        self.assertLess(elapsed, 0.33)  # Sequential would take 4 * 0.1 seconds
+
+    async def test_client_paginate(self):
+        """Test the async client yields the items of every page"""
+        seen = []
+        transport = AsyncInMemoryTransport()
+        transport.add_route("GET", "area/list", list_route(42, seen))
+        async with AsyncSubModelClient(token="test-token", transport=transport) as client:
+            items = [item async for item in client.paginate("area/list", limit=20, prefetch=2)]
+        self.assertEqual(items, list(range(42)))
+        self.assertEqual(sorted(p["page"] for p in seen), [1, 2, 3])
+
+class TestAsyncFetchAll(unittest.IsolatedAsyncioTestCase):
+    async def test_fetch_all(self):
+        """Test the async client fetches pages concurrently, within the bound"""
+        in_flight, peak = 0, 0
+
+        async def handler(page, limit):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return page_of(page, limit, 1000)
+
+        class SlowTransport(AsyncInMemoryTransport):
+            async def request(self, method, url, headers=None, params=None, **kwargs):
+                return TransportResponse(200, data=await handler(params["page"], params["limit"]))
+
+        async with AsyncSubModelClient(token="test-token", transport=SlowTransport()) as client:
+            items = await client.fetch_all("device/list", limit=50, concurrency=4)
+        self.assertEqual(items, list(range(1000)))
+        self.assertEqual(peak, 4)
+
+if __name__ == "__main__":
+    unittest.main()
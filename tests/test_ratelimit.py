@@ -0,0 +1,157 @@
+import asyncio
+import threading
+import unittest
+from unittest.mock import patch
+from submodel.sdk.async_client import AsyncSubModelClient
+from submodel.sdk.client import SubModelClient
+from submodel.sdk.exceptions import HTTPStatusError, RateLimitError
+from submodel.sdk.ratelimit import RateLimiter, TokenBucket
+from submodel.sdk.transport import AsyncInMemoryTransport, InMemoryTransport, TransportResponse
+from submodel.sdk.utils import parse_retry_after
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_wait(self):
+        """Test callers beyond the burst reserve increasing waits"""
+        with patch('time.monotonic', return_value=10.0):
+            bucket = TokenBucket(rate=2, capacity=2)
+            waits = [bucket.reserve() for _ in range(4)]
+        self.assertEqual(waits, [0.0, 0.0, 0.5, 1.0])
+
+    def test_refill(self):
+        """Test tokens come back at the configured rate"""
+        with patch('time.monotonic', return_value=0.0):
+            bucket = TokenBucket(rate=1, capacity=1)
+            bucket.reserve()
+        with patch('time.monotonic', return_value=1.0):
+            self.assertEqual(bucket.reserve(), 0.0)
+
+    def test_block(self):
+        """Test a blocked bucket makes callers wait out the block"""
+        with patch('time.monotonic', return_value=0.0):
+            bucket = TokenBucket(rate=100)
+            bucket.block(3)
+            self.assertEqual(bucket.reserve(), 3.0)
+
+    def test_threads_share_bucket(self):
+        """Test concurrent threads never hand out more than the burst at once"""
+        bucket = TokenBucket(rate=1, capacity=5)
+        waits = []
+        threads = [threading.Thread(target=lambda: waits.append(bucket.reserve())) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sum(1 for w in waits if w == 0), 5)
+
+class TestRateLimiter(unittest.TestCase):
+    def test_groups(self):
+        """Test endpoints map to the first matching group"""
+        limiter = RateLimiter({"sl/*": 20, "*": 5})
+        self.assertEqual(limiter.group("sl/abc/runsync"), "sl/*")
+        self.assertEqual(limiter.group("/inst/list"), "*")
+        self.assertIs(limiter.bucket("inst/list"), limiter.bucket("device/list"))
+        self.assertIsNone(RateLimiter({"sl/*": 1}).bucket("inst/list"))
+
+    def test_penalize_and_recover(self):
+        """Test the rate halves on rate limiting and recovers gradually"""
+        limiter = RateLimiter({"*": 10}, recovery_step=0.1)
+        limiter.penalize("inst/list")
+        self.assertEqual(limiter.rates()["*"], 5)
+
+        for _ in range(3):
+            limiter.record_success("inst/list")
+        self.assertAlmostEqual(limiter.rates()["*"], 8)
+        for _ in range(10):
+            limiter.record_success("inst/list")
+        self.assertEqual(limiter.rates()["*"], 10)
+
+    def test_min_rate(self):
+        """Test repeated penalties stop at the minimum rate"""
+        limiter = RateLimiter({"*": 1}, min_rate=0.25, decrease_interval=0)
+        for _ in range(10):
+            limiter.penalize("inst/list")
+        self.assertEqual(limiter.rates()["*"], 0.25)
+
+    @patch('submodel.sdk.ratelimit.time.monotonic')
+    def test_concurrent_penalties_decrease_once(self, mock_monotonic):
+        """Test rate limit responses to one burst of requests share a single decrease"""
+        mock_monotonic.return_value = 100.0
+        limiter = RateLimiter({"*": 16}, decrease_interval=1.0)
+        threads = [threading.Thread(target=limiter.penalize, args=("inst/list", 2.0)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(limiter.rates()["*"], 8)
+        self.assertEqual(limiter.throttled, 8)
+        self.assertEqual(limiter.bucket("inst/list").blocked_until, 102.0)
+
+        mock_monotonic.return_value = 100.5
+        limiter.penalize("inst/list")
+        self.assertEqual(limiter.rates()["*"], 8)
+        mock_monotonic.return_value = 101.0
+        limiter.penalize("inst/list")
+        self.assertEqual(limiter.rates()["*"], 4)
+
+    def test_parse_retry_after(self):
+        """Test Retry-After seconds and HTTP dates are understood"""
+        self.assertEqual(parse_retry_after({"Retry-After": "3"}), 3.0)
+        self.assertIsNone(parse_retry_after({"Retry-After": "soon"}))
+        self.assertIsNone(parse_retry_after({}))
+        self.assertEqual(parse_retry_after({"Retry-After": "Wed, 01 Jan 2020 00:00:00 GMT"}), 0.0)
+
+class TestClientRateLimiting(unittest.TestCase):
+    @patch('time.sleep')
+    def test_rate_limit_code_throttles(self, mock_sleep):
+        """Test code 40300 slows the endpoint group down and pauses for Retry-After"""
+        answers = [
+            TransportResponse(200, {"Retry-After": "2"}, data={"code": 40300, "message": "Too many requests"}),
+            TransportResponse(200, data={"code": 20000}),
+        ]
+        transport = InMemoryTransport(handler=lambda *args, **kwargs: answers.pop(0))
+        limiter = RateLimiter({"*": 10})
+        client = SubModelClient(token="test-token", transport=transport, rate_limiter=limiter)
+
+        result = client.get("inst/list")
+
+        self.assertEqual(result["code"], 20000)
+        self.assertEqual(limiter.throttled, 1)
+        self.assertGreater(limiter.rates()["*"], 5)  # Recovering after the success
+        self.assertLess(limiter.rates()["*"], 10)
+        self.assertTrue(any(c.args[0] >= 1.9 for c in mock_sleep.call_args_list))
+
+    @patch('time.sleep')
+    def test_http_429_throttles(self, mock_sleep):
+        """Test HTTP 429 responses count as rate limiting"""
+        transport = InMemoryTransport(handler=lambda *args, **kwargs: TransportResponse(429))
+        limiter = RateLimiter({"*": 10})
+        client = SubModelClient(token="test-token", transport=transport, rate_limiter=limiter)
+
+        with self.assertRaises(HTTPStatusError):
+            client.get("inst/list")
+        self.assertEqual(limiter.throttled, 4)
+
+class TestAsyncClientRateLimiting(unittest.IsolatedAsyncioTestCase):
+    async def test_limiter_paces_tasks(self):
+        """Test concurrent tasks are paced by a shared limiter"""
+        transport = AsyncInMemoryTransport(handler=lambda *args, **kwargs: {"code": 20000})
+        limiter = RateLimiter({"*": 50})
+        client = AsyncSubModelClient(token="test-token", transport=transport, rate_limiter=limiter)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await asyncio.gather(*(client.get("inst/list") for _ in range(60)))
+        self.assertGreaterEqual(loop.time() - start, 0.15)
+
+    async def test_rate_limit_error_penalizes(self):
+        """Test the async client reports rate limiting to the limiter"""
+        transport = AsyncInMemoryTransport(handler=lambda *args, **kwargs: {"code": 40300, "message": "slow down"})
+        limiter = RateLimiter({"*": 10})
+        client = AsyncSubModelClient(token="test-token", transport=transport, max_retries=0, rate_limiter=limiter)
+
+        with self.assertRaises(RateLimitError):
+            await client.get("inst/list")
+        self.assertEqual(limiter.rates()["*"], 5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,214 @@
+import unittest
+from unittest.mock import patch
+import requests
+from submodel.sdk.async_client import AsyncSubModelClient
+from submodel.sdk.client import SubModelClient
+from submodel.sdk.exceptions import (
+    AuthenticationError,
+    CircuitOpenError,
+    HTTPStatusError,
+    RateLimitError,
+    ResourceNotFoundError,
+    ServerError,
+    ValidationError,
+)
+from submodel.sdk.retries import RetryBudget, RetryPolicy
+from submodel.sdk.transport import AsyncInMemoryTransport, InMemoryTransport, TransportResponse
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_classification(self):
+        """Test errors are classified by type and HTTP status"""
+        policy = RetryPolicy()
+        network_errors = (requests.RequestException,)
+        for error in (AuthenticationError("no", 40100), ResourceNotFoundError("no", 40400),
+                      ValidationError("bad"), CircuitOpenError("open", "inst/list"),
+                      HTTPStatusError("Not Found", 404), HTTPStatusError("Bad Request", 400),
+                      KeyError("bug")):
+            self.assertFalse(policy.is_retryable(error, network_errors), error)
+        for error in (ServerError("down", 50000), RateLimitError("slow", 40300),
+                      HTTPStatusError("Unavailable", 503), HTTPStatusError("Too Many", 429),
+                      requests.ConnectionError("reset")):
+            self.assertTrue(policy.is_retryable(error, network_errors), error)
+
+    def test_non_idempotent_classification(self):
+        """Test requests that change state are only retried when they were not processed"""
+        policy = RetryPolicy()
+        network_errors = (requests.RequestException,)
+        connect_errors = (requests.exceptions.ConnectTimeout, ConnectionRefusedError)
+        refused = requests.ConnectionError("refused")
+        refused.__context__ = ConnectionRefusedError(111, "Connection refused")
+        rate_limited = RateLimitError("slow", 40300)
+        rate_limited.headers = {"Retry-After": "1"}
+        for error in (ServerError("down", 50000), HTTPStatusError("Unavailable", 503),
+                      HTTPStatusError("Too Many", 429), HTTPStatusError("Bad Gateway", 502, {"Retry-After": "1"}),
+                      requests.ReadTimeout("slow"), requests.ConnectionError("reset")):
+            self.assertFalse(policy.is_retryable(error, network_errors, False, connect_errors), error)
+            self.assertTrue(policy.is_retryable(error, network_errors, True, connect_errors), error)
+        for error in (HTTPStatusError("Unavailable", 503, {"Retry-After": "1"}),
+                      HTTPStatusError("Too Many", 429, {"Retry-After": "1"}),
+                      rate_limited,
+                      requests.exceptions.ConnectTimeout("connect"), refused):
+            self.assertTrue(policy.is_retryable(error, network_errors, False, connect_errors), error)
+
+    def test_full_jitter(self):
+        """Test delays are drawn between zero and the exponential cap"""
+        policy = RetryPolicy(budget=False, max_backoff=3)
+        error = ServerError("down", 50000)
+        with patch('random.uniform', side_effect=lambda low, high: high) as mock_uniform:
+            delays = [policy.next_delay(attempt, error, max_retries=5, backoff_factor=0.5) for attempt in range(4)]
+        self.assertEqual(delays, [0.5, 1.0, 2.0, 3.0])
+        self.assertTrue(all(call.args[0] == 0 for call in mock_uniform.call_args_list))
+        self.assertIsNone(policy.next_delay(5, error, max_retries=5))
+
+    def test_retry_after(self):
+        """Test Retry-After sets the minimum delay and long waits are not retried"""
+        policy = RetryPolicy(budget=False, max_retry_after=10)
+        self.assertGreaterEqual(policy.next_delay(0, HTTPStatusError("Too Many", 429, {"Retry-After": "4"})), 4)
+        self.assertIsNone(policy.next_delay(0, HTTPStatusError("Too Many", 429, {"Retry-After": "120"})))
+
+    def test_policy_overrides_client_settings(self):
+        """Test settings on the policy take precedence over the client's"""
+        policy = RetryPolicy(max_retries=1, backoff_factor=0, budget=False)
+        error = ServerError("down", 50000)
+        self.assertEqual(policy.next_delay(0, error, max_retries=5, backoff_factor=2), 0)
+        self.assertIsNone(policy.next_delay(1, error, max_retries=5, backoff_factor=2))
+
+class TestRetryBudget(unittest.TestCase):
+    def test_budget_caps_retries(self):
+        """Test retries stop at the minimum plus the ratio of requests"""
+        with patch('time.monotonic', return_value=100.0):
+            budget = RetryBudget(ratio=0.5, min_retries_per_second=0.2, window=10)
+            for _ in range(4):
+                budget.record_request()
+            allowed = sum(budget.try_withdraw() for _ in range(10))
+        self.assertEqual(allowed, 4)
+        self.assertEqual(budget.stats()["exhausted"], 6)
+
+    def test_budget_window(self):
+        """Test retries older than the window no longer count"""
+        budget = RetryBudget(ratio=0, min_retries_per_second=0.1, window=10)
+        with patch('time.monotonic', return_value=100.0):
+            self.assertTrue(budget.try_withdraw())
+            self.assertFalse(budget.try_withdraw())
+        with patch('time.monotonic', return_value=111.0):
+            self.assertTrue(budget.try_withdraw())
+
+class TestClientRetries(unittest.TestCase):
+    @patch('time.sleep')
+    def test_not_found_is_not_retried(self, mock_sleep):
+        """Test client errors fail on the first attempt"""
+        transport = InMemoryTransport(handler=lambda *args, **kwargs: {"code": 40400, "message": "missing"})
+        client = SubModelClient(token="test-token", transport=transport)
+
+        with self.assertRaises(ResourceNotFoundError):
+            client.get("inst/detail")
+        self.assertEqual(len(transport.calls), 1)
+        mock_sleep.assert_not_called()
+
+    @patch('time.sleep')
+    def test_uses_client_settings(self, mock_sleep):
+        """Test the client's max_retries bounds the attempts"""
+        transport = InMemoryTransport(handler=lambda *args, **kwargs: TransportResponse(502))
+        client = SubModelClient(token="test-token", transport=transport, max_retries=1)
+
+        with self.assertRaises(HTTPStatusError):
+            client.get("inst/list")
+        self.assertEqual(len(transport.calls), 2)
+
+    @patch('time.sleep')
+    def test_retry_after_from_api_error(self, mock_sleep):
+        """Test Retry-After on a rate limited API response is honoured"""
+        answers = [
+            TransportResponse(200, {"Retry-After": "3"}, data={"code": 40300, "message": "slow down"}),
+            TransportResponse(200, data={"code": 20000}),
+        ]
+        transport = InMemoryTransport(handler=lambda *args, **kwargs: answers.pop(0))
+        client = SubModelClient(token="test-token", transport=transport)
+
+        self.assertEqual(client.get("inst/list")["code"], 20000)
+        self.assertGreaterEqual(mock_sleep.call_args.args[0], 3)
+
+    @patch('time.sleep')
+    def test_shared_budget_stops_retry_storm(self, mock_sleep):
+        """Test a shared budget limits retries across requests"""
+        transport = InMemoryTransport(handler=lambda *args, **kwargs: TransportResponse(503))
+        policy = RetryPolicy(budget=RetryBudget(ratio=0, min_retries_per_second=0.3, window=10))
+        client = SubModelClient(token="test-token", transport=transport, retry_policy=policy)
+
+        for _ in range(5):
+            with self.assertRaises(HTTPStatusError):
+                client.get("inst/list")
+        self.assertEqual(len(transport.calls), 5 + 3)
+
+    @patch('time.sleep')
+    def test_post_not_retried_on_server_error(self, mock_sleep):
+        """Test a POST that may have been applied is not sent again"""
+        transport = InMemoryTransport(handler=lambda *args, **kwargs: TransportResponse(502))
+        client = SubModelClient(token="test-token", transport=transport)
+
+        with self.assertRaises(HTTPStatusError):
+            client.post("inst/create", json={"name": "x"})
+        self.assertEqual(len(transport.calls), 1)
+        mock_sleep.assert_not_called()
+
+    @patch('time.sleep')
+    def test_post_retried_when_not_processed(self, mock_sleep):
+        """Test a POST is retried after a refused connection or a 503 with Retry-After"""
+        answers = [ConnectionRefusedError(111, "Connection refused"),
+                   TransportResponse(503, {"Retry-After": "1"}),
+                   TransportResponse(200, data={"code": 20000})]
+
+        def handler(*args, **kwargs):
+            answer = answers.pop(0)
+            if isinstance(answer, Exception):
+                raise answer
+            return answer
+
+        transport = InMemoryTransport(handler=handler)
+        transport.connect_errors = (ConnectionRefusedError,)
+        client = SubModelClient(token="test-token", transport=transport)
+
+        self.assertEqual(client.post("inst/create", json={"name": "x"})["code"], 20000)
+        self.assertEqual(len(transport.calls), 3)
+
+    @patch('time.sleep')
+    def test_post_retried_when_rate_limited(self, mock_sleep):
+        """Test a POST rate limited by the API is retried with backoff when no Retry-After is sent"""
+        answers = [{"code": 40300, "message": "slow down"}, {"code": 20000}]
+        transport = InMemoryTransport(handler=lambda *args, **kwargs: answers.pop(0))
+        client = SubModelClient(token="test-token", transport=transport)
+
+        self.assertEqual(client.post("inst/create", json={"name": "x"})["code"], 20000)
+        self.assertEqual(len(transport.calls), 2)
+        self.assertEqual(mock_sleep.call_count, 1)
+
+class TestAsyncClientRetries(unittest.IsolatedAsyncioTestCase):
+    async def test_server_error_retried(self):
+        """Test the async client retries server errors with the shared policy"""
+        answers = [{"code": 50000, "message": "busy"}, {"code": 20000}]
+        transport = AsyncInMemoryTransport(handler=lambda *args, **kwargs: answers.pop(0))
+        client = AsyncSubModelClient(token="test-token", transport=transport, backoff_factor=0)
+
+        self.assertEqual((await client.get("inst/list"))["code"], 20000)
+        self.assertEqual(len(transport.calls), 2)
+
+    async def test_authentication_error_not_retried(self):
+        """Test authentication errors are raised without retrying"""
+        transport = AsyncInMemoryTransport(handler=lambda *args, **kwargs: {"code": 40100, "message": "expired"})
+        client = AsyncSubModelClient(token="test-token", transport=transport)
+
+        with self.assertRaises(AuthenticationError):
+            await client.get("inst/list")
+        self.assertEqual(len(transport.calls), 1)
+
+    async def test_post_not_retried_on_server_error(self):
+        """Test the async client does not resend a POST after a server error"""
+        transport = AsyncInMemoryTransport(handler=lambda *args, **kwargs: {"code": 50000, "message": "busy"})
+        client = AsyncSubModelClient(token="test-token", transport=transport, backoff_factor=0)
+
+        with self.assertRaises(ServerError):
+            await client.post("inst/action/stop/abc", json={})
+        self.assertEqual(len(transport.calls), 1)
+
+if __name__ == '__main__':
+    unittest.main()
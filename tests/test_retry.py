@@ -83,5 +83,10 @@ class TestRetry(unittest.TestCase):
         with self.assertRaises(ValueError):
             test_function()
 
+    def test_deprecated(self):
+        """Test the decorator warns that it is deprecated"""
+        with self.assertWarns(DeprecationWarning):
+            retry(max_retries=1)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
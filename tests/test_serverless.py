@@ -8,6 +8,9 @@ from submodel.sdk.client import create_client
 from submodel.sdk.auth import Auth
 from submodel.sdk.instance import Instance
 from submodel.sdk.serverless import ServerlessHandler, ServerlessEndpoint
+from submodel.sdk.serverless import AsyncServerlessEndpoint
+from submodel.sdk.async_client import AsyncSubModelClient
+from submodel.sdk.transport import AsyncInMemoryTransport
 import os
 
 class TestServerlessHandler(unittest.TestCase):
@@ -239,7 +242,7 @@ class TestServerlessEndpoint(unittest.TestCase):
         self.assertEqual(endpoint.client, self.client)
         self.assertEqual(endpoint.inst_id, "test-instance-123")
         
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_run(self, mock_request):
         """Test asynchronous task execution"""
         mock_response = MagicMock()
@@ -250,7 +253,7 @@ class TestServerlessEndpoint(unittest.TestCase):
         self.assertEqual(result["code"], 20000)
         self.assertEqual(result["data"]["id"], "test-job")
         
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_run_sync(self, mock_request):
         """Test synchronous task execution"""
         mock_response = MagicMock()
@@ -261,7 +264,7 @@ class TestServerlessEndpoint(unittest.TestCase):
         self.assertEqual(result["code"], 20000)
         self.assertEqual(result["data"]["result"], "test")
         
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_get_status(self, mock_request):
         """Test getting task status"""
         mock_response = MagicMock()
@@ -272,7 +275,7 @@ class TestServerlessEndpoint(unittest.TestCase):
         self.assertEqual(result["code"], 20000)
         self.assertEqual(result["data"]["status"], "completed")
         
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_cancel(self, mock_request):
         """Test canceling task"""
         mock_response = MagicMock()
@@ -283,7 +286,7 @@ class TestServerlessEndpoint(unittest.TestCase):
         self.assertEqual(result["code"], 20000)
         self.assertEqual(result["data"]["status"], "cancelled")
         
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_get_health(self, mock_request):
         """Test getting health status"""
         mock_response = MagicMock()
@@ -294,7 +297,7 @@ class TestServerlessEndpoint(unittest.TestCase):
         self.assertEqual(result["code"], 20000)
         self.assertEqual(result["data"]["healthy"], True)
         
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_get_metrics(self, mock_request):
         """Test getting metrics"""
         mock_response = MagicMock()
@@ -305,7 +308,7 @@ class TestServerlessEndpoint(unittest.TestCase):
         self.assertEqual(result["code"], 20000)
         self.assertEqual(result["data"]["cpu"], 50)
         
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_get_requests(self, mock_request):
         """Test getting request list"""
         mock_response = MagicMock()
@@ -321,7 +324,7 @@ class TestAuth(unittest.TestCase):
         self.client = create_client(token="test-token", api_key="test-key")
         self.auth = Auth(self.client)
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_login(self, mock_request):
         """Test login functionality"""
         mock_response = MagicMock()
@@ -336,7 +339,7 @@ class TestInstance(unittest.TestCase):
         self.client = create_client(token="test-token", api_key="test-key")
         self.instance = Instance(self.client)
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_create_instance(self, mock_request):
         """Test instance creation"""
         mock_response = MagicMock()
@@ -350,5 +353,19 @@ class TestInstance(unittest.TestCase):
         )
         self.assertEqual(result["code"], 20000)
 
+class TestAsyncServerlessEndpoint(unittest.IsolatedAsyncioTestCase):
+    async def test_endpoint_calls(self):
+        """Test async endpoint calls"""
+        transport = AsyncInMemoryTransport()
+        transport.add_route("POST", "sl/i1/run", {"code": 20000, "data": {"job_id": "j1"}})
+        transport.add_route("GET", "sl/i1/status/j1", {"code": 20000, "data": {"status": "running"}})
+        transport.add_route("GET", "sl/i1/health", {"code": 20000, "data": {"workers": 2}})
+        endpoint = AsyncServerlessEndpoint(AsyncSubModelClient(token="test-token", transport=transport), "i1")
+
+        self.assertEqual((await endpoint.run({"prompt": "hi"}))["data"]["job_id"], "j1")
+        self.assertEqual(transport.calls[-1][2]["json"], {"input": {"prompt": "hi"}})
+        self.assertEqual((await endpoint.get_status("j1"))["data"]["status"], "running")
+        self.assertEqual((await endpoint.get_health())["data"]["workers"], 2)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,144 @@
+import asyncio
+import threading
+import time
+import unittest
+from submodel.sdk.async_client import AsyncSubModelClient
+from submodel.sdk.client import SubModelClient
+from submodel.sdk.exceptions import ResourceNotFoundError
+from submodel.sdk.singleflight import AsyncSingleFlight, SingleFlight, request_key
+from submodel.sdk.transport import AsyncInMemoryTransport, InMemoryTransport
+
+class TestRequestKey(unittest.TestCase):
+    def test_param_order_ignored(self):
+        """Test keys do not depend on parameter order"""
+        self.assertEqual(
+            request_key("get", "https://x/inst/list", {"page": 1, "limit": 10}),
+            request_key("GET", "https://x/inst/list", {"limit": 10, "page": 1}),
+        )
+
+    def test_params_distinguish(self):
+        """Test different parameters give different keys"""
+        self.assertNotEqual(
+            request_key("GET", "https://x/inst/list", {"page": 1}),
+            request_key("GET", "https://x/inst/list", {"page": 2}),
+        )
+
+class TestSingleFlight(unittest.TestCase):
+    def test_concurrent_callers_share_result(self):
+        """Test concurrent threads share one execution"""
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return {"code": 20000}
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(flight.do("k", fetch))) for _ in range(8)]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        while flight.coalesced < 7:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all(r is results[0] for r in results))
+        self.assertEqual(flight.stats(), {"executed": 1, "coalesced": 7})
+
+    def test_error_shared_and_key_released(self):
+        """Test errors reach every caller and later calls run again"""
+        flight = SingleFlight()
+
+        def fail():
+            raise ResourceNotFoundError("Instance not found", 40400)
+
+        with self.assertRaises(ResourceNotFoundError):
+            flight.do("k", fail)
+        self.assertEqual(flight.do("k", lambda: "ok"), "ok")
+        self.assertEqual(flight.executed, 2)
+
+class TestAsyncSingleFlight(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_tasks_share_request(self):
+        """Test concurrent tasks share one request through the client"""
+        transport = AsyncInMemoryTransport()
+        transport.add_route("GET", "inst/detail/abc", {"code": 20000, "data": {"inst_id": "abc"}})
+
+        async def delayed_request(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return transport._dispatch(*args, **kwargs)
+
+        transport.request = delayed_request
+        client = AsyncSubModelClient(token="test-token", transport=transport, coalesce_requests=True)
+
+        results = await asyncio.gather(*(client.instance.get_instance("abc") for _ in range(50)))
+
+        self.assertEqual(len(transport.calls), 1)
+        self.assertTrue(all(r is results[0] for r in results))
+        self.assertEqual(client.singleflight.stats(), {"executed": 1, "coalesced": 49})
+
+    async def test_mutating_gets_not_coalesced(self):
+        """Test concurrent GETs that change state are each sent"""
+        keys = iter(range(100))
+        transport = AsyncInMemoryTransport(handler=lambda *args, **kwargs: {"code": 20000, "data": {"key": next(keys)}})
+        request = transport.request
+
+        async def delayed_request(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return await request(*args, **kwargs)
+
+        transport.request = delayed_request
+        client = AsyncSubModelClient(token="test-token", transport=transport, coalesce_requests=True)
+
+        results = await asyncio.gather(*(client.auth.generate_api_key() for _ in range(5)))
+        await asyncio.gather(*(client.device.control_device("remote_cmd", "d1", cmd="reboot") for _ in range(3)))
+
+        self.assertEqual(len({r["data"]["key"] for r in results}), 5)
+        self.assertEqual(len(transport.calls), 8)
+        self.assertEqual(client.singleflight.stats(), {"executed": 0, "coalesced": 0})
+
+    async def test_cancelled_caller_does_not_cancel_flight(self):
+        """Test cancelling one waiter leaves the shared request running"""
+        flight = AsyncSingleFlight()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "done"
+
+        first = asyncio.ensure_future(flight.do("k", fetch))
+        second = asyncio.ensure_future(flight.do("k", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        self.assertEqual(await second, "done")
+        with self.assertRaises(asyncio.CancelledError):
+            await first
+
+class TestClientCoalescing(unittest.TestCase):
+    def test_posts_not_coalesced(self):
+        """Test requests with a body are never coalesced"""
+        transport = InMemoryTransport(handler=lambda *args, **kwargs: {"code": 20000})
+        client = SubModelClient(token="test-token", transport=transport, coalesce_requests=True)
+
+        client.post("inst/action/stop/abc", json={})
+        client.get("inst/detail/abc")
+
+        self.assertEqual(client.singleflight.stats(), {"executed": 1, "coalesced": 0})
+        self.assertEqual(len(transport.calls), 2)
+
+    def test_disabled_by_default(self):
+        """Test coalescing is opt-in"""
+        self.assertIsNone(SubModelClient(token="test-token").singleflight)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+import asyncio
+import time
+import unittest
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+import aiohttp
+from submodel.sdk.async_client import AsyncSubModelClient
+from submodel.sdk.client import SubModelClient
+from submodel.sdk.exceptions import DeadlineExceededError, HTTPStatusError
+from submodel.sdk.timeouts import Deadline, Timeout
+from submodel.sdk.transport import AsyncTransport, InMemoryTransport, TransportResponse
+
+class StalledTransport(AsyncTransport):
+    """Async transport that never answers"""
+
+    network_errors = (asyncio.TimeoutError,)
+
+    def __init__(self):
+        self.calls = 0
+
+    async def request(self, method, url, headers=None, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(10)
+
+class TestTimeout(unittest.TestCase):
+    def test_coerce(self):
+        """Test numbers become total timeouts"""
+        self.assertEqual(Timeout.coerce(5), Timeout(total=5.0))
+        self.assertIsNone(Timeout.coerce(None))
+        timeout = Timeout(connect=1)
+        self.assertIs(Timeout.coerce(timeout), timeout)
+
+    def test_as_tuple(self):
+        """Test connect and read timeouts are capped at the total"""
+        self.assertEqual(Timeout(connect=3, read=30).as_tuple(), (3, 30))
+        self.assertEqual(Timeout(total=5, connect=3, read=30).as_tuple(), (3, 5))
+        self.assertEqual(Timeout(total=5).as_tuple(), (5, 5))
+        self.assertIsNone(Timeout().as_tuple())
+
+    def test_clip(self):
+        """Test every limit is clipped to the remaining time"""
+        self.assertEqual(Timeout(connect=3, read=30).clip(10), Timeout(total=10, connect=3, read=10))
+
+    def test_deadline(self):
+        """Test a deadline counts down and expires"""
+        with patch('time.monotonic', return_value=100.0):
+            deadline = Deadline(5)
+        with patch('time.monotonic', return_value=102.0):
+            self.assertEqual(deadline.remaining(), 3.0)
+            self.assertFalse(deadline.expired)
+        with patch('time.monotonic', return_value=106.0):
+            self.assertEqual(deadline.remaining(), 0.0)
+            self.assertTrue(deadline.expired)
+
+class TestClientTimeouts(unittest.TestCase):
+    def setUp(self):
+        self.response = MagicMock()
+        self.response.status_code = 200
+        self.response.json.return_value = {"code": 20000}
+
+    @patch('requests.Session.request')
+    def test_default_timeout(self, mock_request):
+        """Test requests always carry a connect and read timeout"""
+        mock_request.return_value = self.response
+        SubModelClient(token="test-token").get("inst/list")
+        self.assertEqual(mock_request.call_args.kwargs["timeout"], (10.0, 300.0))
+
+    @patch('requests.Session.request')
+    def test_per_call_timeout(self, mock_request):
+        """Test a call's timeout overrides the client's"""
+        mock_request.return_value = self.response
+        client = SubModelClient(token="test-token", timeout=Timeout(connect=2, read=20))
+        client.get("inst/list")
+        self.assertEqual(mock_request.call_args.kwargs["timeout"], (2, 20))
+        client.get("inst/list", timeout=5)
+        self.assertEqual(mock_request.call_args.kwargs["timeout"], (5.0, 5.0))
+
+    @patch('time.sleep')
+    @patch('random.uniform', side_effect=lambda low, high: high)
+    def test_deadline_stops_retries(self, mock_uniform, mock_sleep):
+        """Test no retry is scheduled when its backoff would pass the deadline"""
+        transport = InMemoryTransport(handler=lambda *args, **kwargs: TransportResponse(503))
+        client = SubModelClient(token="test-token", transport=transport, backoff_factor=5)
+
+        with self.assertRaises(HTTPStatusError):
+            client.get("inst/list", deadline=2)
+        self.assertEqual(len(transport.calls), 1)
+        mock_sleep.assert_not_called()
+
+    def test_expired_deadline(self):
+        """Test a call with an expired deadline is not sent"""
+        transport = InMemoryTransport(handler=lambda *args, **kwargs: {"code": 20000})
+        client = SubModelClient(token="test-token", transport=transport)
+
+        with self.assertRaises(DeadlineExceededError):
+            client.get("inst/list", deadline=Deadline(0))
+        self.assertEqual(transport.calls, [])
+
+class TestAsyncClientTimeouts(unittest.IsolatedAsyncioTestCase):
+    @patch('aiohttp.ClientSession.request')
+    async def test_client_timeout(self, mock_request):
+        """Test aiohttp receives the connect and read timeouts"""
+        response = AsyncMock()
+        response.status = 200
+        response.json = AsyncMock(return_value={"code": 20000})
+        response.raise_for_status = Mock()
+        context = AsyncMock()
+        context.__aenter__.return_value = response
+        mock_request.return_value = context
+
+        async with AsyncSubModelClient(token="test-token", close_on_exit=True) as client:
+            await client.get("inst/list")
+            await client.get("inst/list", timeout=Timeout(total=7, connect=1))
+
+        first, second = (c.kwargs["timeout"] for c in mock_request.call_args_list)
+        self.assertIsInstance(first, aiohttp.ClientTimeout)
+        self.assertEqual((first.sock_connect, first.sock_read), (10.0, 300.0))
+        self.assertEqual((second.total, second.sock_connect, second.sock_read), (7, 1, None))
+
+    async def test_deadline_spans_retries(self):
+        """Test a stalled request is abandoned once the deadline passes"""
+        transport = StalledTransport()
+        client = AsyncSubModelClient(token="test-token", transport=transport, backoff_factor=0, deadline=0.2)
+
+        start = time.monotonic()
+        with self.assertRaises(DeadlineExceededError):
+            await client.get("inst/list")
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual(transport.calls, 1)
+
+    async def test_cancelled_call_with_deadline(self):
+        """Test cancelling a call is not reported as a passed deadline"""
+        client = AsyncSubModelClient(token="test-token", transport=StalledTransport(), deadline=5)
+
+        call = asyncio.ensure_future(client.get("inst/list"))
+        await asyncio.sleep(0.01)
+        call.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await call
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+import unittest
+from unittest.mock import patch
+from submodel.sdk.client import SubModelClient
+from submodel.sdk.async_client import AsyncSubModelClient
+from submodel.sdk.exceptions import HTTPStatusError, ResourceNotFoundError
+from submodel.sdk.transport import (
+    AsyncInMemoryTransport,
+    HTTPXTransport,
+    InMemoryTransport,
+    RequestsTransport,
+    TransportResponse,
+    httpx,
+)
+
+class TestTransportResponse(unittest.TestCase):
+    def test_json_from_content(self):
+        """Test body is decoded from raw content"""
+        response = TransportResponse(200, content=b'{"code": 20000}')
+        self.assertEqual(response.json(), {"code": 20000})
+
+    def test_content_from_data(self):
+        """Test preloaded data can be re-encoded"""
+        response = TransportResponse(200, data={"code": 20000})
+        self.assertEqual(response.content, b'{"code": 20000}')
+
+    def test_raise_for_status(self):
+        """Test HTTP error statuses raise HTTPStatusError"""
+        response = TransportResponse(503, headers={"Retry-After": "2"})
+        with self.assertRaises(HTTPStatusError) as context:
+            response.raise_for_status()
+        self.assertEqual(context.exception.status_code, 503)
+        self.assertEqual(context.exception.headers["Retry-After"], "2")
+
+class TestInMemoryTransport(unittest.TestCase):
+    def setUp(self):
+        self.transport = InMemoryTransport()
+        self.client = SubModelClient(token="test-token", transport=self.transport)
+
+    def test_route(self):
+        """Test requests are answered from registered routes"""
+        self.transport.add_route("GET", "inst/detail/abc", {"code": 20000, "data": {"inst_id": "abc"}})
+        result = self.client.instance.get_instance("abc")
+        self.assertEqual(result["data"]["inst_id"], "abc")
+
+        method, url, kwargs = self.transport.calls[0]
+        self.assertEqual(method, "GET")
+        self.assertEqual(url, "https://api.submodel.ai/api/v1/inst/detail/abc")
+
+    def test_callable_route(self):
+        """Test callable routes receive the request parameters"""
+        def handler(method, url, headers, **kwargs):
+            return {"code": 20000, "data": {"page": kwargs["params"]["page"], "token": headers["x-token"]}}
+
+        self.transport.add_route("GET", "device/list", handler)
+        result = self.client.device.list_devices(page=3)
+        self.assertEqual(result["data"], {"page": 3, "token": "test-token"})
+
+    def test_api_error_mapping(self):
+        """Test API error codes are mapped by the client, not the transport"""
+        self.transport.add_route("GET", "inst/detail/missing", {"code": 40400, "message": "Instance not found"})
+        with patch('time.sleep'):
+            with self.assertRaises(ResourceNotFoundError):
+                self.client.instance.get_instance("missing")
+
+    def test_unknown_route(self):
+        """Test requests without a route get a 404"""
+        with patch('time.sleep'):
+            with self.assertRaises(HTTPStatusError):
+                self.client.get("nothing/here")
+
+class TestAsyncInMemoryTransport(unittest.IsolatedAsyncioTestCase):
+    async def test_route(self):
+        """Test the async client runs on the in-memory transport"""
+        transport = AsyncInMemoryTransport()
+        transport.add_route("POST", "inst/create", {"code": 20000, "data": {"inst_id": "new"}})
+
+        async with AsyncSubModelClient(token="test-token", transport=transport) as client:
+            result = await client.instance.create(plan="gpu-rtx4090-24g-1")
+
+        self.assertEqual(result["data"]["inst_id"], "new")
+        self.assertEqual(transport.calls[0][2]["json"]["plan"], "gpu-rtx4090-24g-1")
+
+    async def test_http_errors_are_retried(self):
+        """Test HTTP status errors count as transport failures"""
+        transport = AsyncInMemoryTransport()
+        transport.add_route("GET", "flaky", TransportResponse(502))
+
+        client = AsyncSubModelClient(token="test-token", transport=transport, max_retries=1, backoff_factor=0)
+        with self.assertRaises(HTTPStatusError):
+            await client.get("flaky")
+        self.assertEqual(len(transport.calls), 2)
+
+class TestTransportSelection(unittest.TestCase):
+    def test_default_transport(self):
+        """Test the sync client defaults to the requests backend"""
+        client = SubModelClient(token="test-token")
+        self.assertIsInstance(client.transport, RequestsTransport)
+        self.assertIs(client.session, client.transport.session)
+
+    @unittest.skipIf(httpx is None, "httpx is not installed")
+    def test_httpx_conditional_get(self):
+        """Test the sync HTTP/2 backend returns the remembered body on 304"""
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304, headers={"ETag": '"v1"'})
+            return httpx.Response(200, headers={"ETag": '"v1"'}, json={"code": 20000, "data": {"items": [1]}})
+
+        transport = HTTPXTransport(http2=False, transport=httpx.MockTransport(handler))
+        with SubModelClient(token="test-token", transport=transport, conditional_get=True) as client:
+            first = client.instance.list_instances()
+            second = client.instance.list_instances()
+
+        self.assertIs(first, second)
+        self.assertEqual(seen, [None, '"v1"'])
+        self.assertEqual(client.validators.stats()["not_modified"], 1)
+
+    @unittest.skipIf(httpx is None, "httpx is not installed")
+    def test_httpx_status_errors(self):
+        """Test the sync HTTP/2 backend raises HTTPStatusError like the async one"""
+        transport = HTTPXTransport(http2=False, transport=httpx.MockTransport(lambda request: httpx.Response(404)))
+        self.assertIn(HTTPStatusError, transport.network_errors)
+        with self.assertRaises(HTTPStatusError) as context:
+            transport.request("GET", "https://api.example/inst/list").raise_for_status()
+        self.assertEqual(context.exception.status_code, 404)
+        transport.close()
+
+    @unittest.skipIf(httpx is not None, "httpx is installed")
+    def test_http2_requires_httpx(self):
+        """Test the HTTP/2 backend explains its optional dependency"""
+        with self.assertRaises(ImportError) as context:
+            HTTPXTransport()
+        self.assertIn("httpx", str(context.exception))
+
+if __name__ == '__main__':
+    unittest.main()